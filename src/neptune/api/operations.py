@@ -45,6 +45,9 @@ class Serializable(abc.ABC):
     def to_proto(self, run_op: "RunOperation") -> ingest_pb2.RunOperation:
         pass
 
+    def to_protos(self, run_op: "RunOperation") -> List[ingest_pb2.RunOperation]:
+        return [self.to_proto(run_op)]
+
 
 @dataclass
 class Run(Serializable):
@@ -77,11 +80,16 @@ class LogFloats(Serializable):
     items: List[FloatValue]
 
     def to_proto(self, run_op: "RunOperation") -> ingest_pb2.RunOperation:
-        first_item = self.items[0]
+        return self._item_to_proto(run_op, self.items[0])
+
+    def to_protos(self, run_op: "RunOperation") -> List[ingest_pb2.RunOperation]:
+        # a snapshot holds a single value per path, every item needs its own
+        return [self._item_to_proto(run_op, item) for item in self.items]
 
+    def _item_to_proto(self, run_op: "RunOperation", item: FloatValue) -> ingest_pb2.RunOperation:
         step = (
-            common_pb2.Step(whole=int(first_item.step), micro=int((first_item.step - int(first_item.step)) * 1e6))
-            if first_item.step is not None
+            common_pb2.Step(whole=int(item.step), micro=int((item.step - int(item.step)) * 1e6))
+            if item.step is not None
             else None
         )
 
@@ -90,8 +98,8 @@ class LogFloats(Serializable):
             run_id=run_op.run_id,
             update=common_pb2.UpdateRunSnapshot(
                 step=step,
-                append={f"{self.path}": common_pb2.Value(float64=first_item.value)},
-                timestamp=timestamp_pb2.Timestamp(seconds=int(first_item.timestamp)),
+                append={f"{self.path}": common_pb2.Value(float64=item.value)},
+                timestamp=timestamp_pb2.Timestamp(seconds=int(item.timestamp)),
             ),
         )
 
@@ -183,3 +191,6 @@ class RunOperation:
 
     def to_proto(self) -> ingest_pb2.RunOperation:
         return self.operation.to_proto(run_op=self)
+
+    def to_protos(self) -> List[ingest_pb2.RunOperation]:
+        return self.operation.to_protos(run_op=self)
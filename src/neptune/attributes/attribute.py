@@ -44,6 +44,9 @@ class Attribute:
     def _enqueue_operation(self, operation: Operation, *, wait: bool):
         self._container._op_processor.enqueue_operation(operation, wait=wait)
 
+    def _enqueue_operations(self, operations: List[Operation], *, wait: bool):
+        self._container._op_processor.enqueue_operations(operations, wait=wait)
+
     @property
     def _backend(self) -> NeptuneBackend:
         return self._container._backend
@@ -13,47 +13,137 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["FloatSeries"]
+__all__ = ["FloatSeries", "FloatSeriesWriter"]
 
+import copy
+import math
+import time
 from typing import (
+    TYPE_CHECKING,
     Iterable,
+    List,
     Optional,
     Union,
 )
 
 from neptune.api.models import FloatSeriesValues
 from neptune.attributes.series.fetchable_series import FetchableSeries
-from neptune.attributes.series.series import Series
+from neptune.attributes.series.series import (
+    SERIES_OPERATION_MAX_SIZE_BYTES,
+    SERIES_VALUE_OVERHEAD_BYTES,
+    Series,
+)
 from neptune.exceptions import NeptuneUnsupportedFunctionalityException
 from neptune.internal.operation import (
     ClearFloatLog,
     ConfigFloatSeries,
     LogFloats,
+    LogSeriesValue,
     Operation,
 )
-from neptune.internal.utils import verify_type
+from neptune.internal.utils import (
+    is_float_like,
+    is_string,
+    verify_type,
+)
+from neptune.internal.utils.iteration import get_batches
+from neptune.internal.warnings import (
+    NeptuneUnsupportedValue,
+    warn_once,
+)
+from neptune.types.series.downsampling import DownsamplingPolicy
 from neptune.types.series.float_series import FloatSeries as FloatSeriesVal
 
+if TYPE_CHECKING:
+    from neptune.objects import NeptuneObject
+
 Val = FloatSeriesVal
 Data = Union[float, int]
 LogOperation = LogFloats
 
+# Longest representation of a double in JSON, e.g. -2.2250738585072014e-308
+FLOAT_SERIALIZED_SIZE_BYTES = 24
+
 
 class FloatSeries(
-    Series[Val, Data, LogOperation], FetchableSeries[FloatSeriesValues], max_batch_size=1, operation_cls=LogOperation
+    Series[Val, Data, LogOperation],
+    FetchableSeries[FloatSeriesValues],
+    max_batch_size=100_000,
+    operation_cls=LogOperation,
 ):
+    def __init__(self, container: "NeptuneObject", path: List[str]):
+        super().__init__(container, path)
+        self._downsampling: Optional[DownsamplingPolicy] = None
+
     def configure(
         self,
         min: Optional[Union[float, int]] = None,
         max: Optional[Union[float, int]] = None,
         unit: Optional[str] = None,
         wait: bool = False,
+        downsampling: Optional[DownsamplingPolicy] = None,
     ) -> None:
-        verify_type("min", min, (float, int))
-        verify_type("max", max, (float, int))
-        verify_type("unit", unit, str)
+        verify_type("downsampling", downsampling, (DownsamplingPolicy, type(None)))
+        # `downsampling` can be configured on its own
+        configures_display = downsampling is None or any(arg is not None for arg in (min, max, unit))
+        if configures_display:
+            verify_type("min", min, (float, int))
+            verify_type("max", max, (float, int))
+            verify_type("unit", unit, str)
+        with self._container.lock():
+            if downsampling is not None:
+                self._set_downsampling(downsampling, wait=wait)
+            if configures_display:
+                self._enqueue_operation(ConfigFloatSeries(self._path, min, max, unit), wait=wait)
+
+    def _set_downsampling(self, policy: DownsamplingPolicy, *, wait: bool = False) -> None:
+        """Applies `policy` to the values logged from now on, the points held back by the previous one are sent."""
         with self._container.lock():
-            self._enqueue_operation(ConfigFloatSeries(self._path, min, max, unit), wait=wait)
+            self._flush_downsampling(wait=wait)
+            self._downsampling = copy.deepcopy(policy)
+            self._downsampling.reset()
+
+    def _flush_downsampling(self, *, wait: bool = False) -> None:
+        with self._container.lock():
+            if self._downsampling is None:
+                return
+            points = self._downsampling.flush()
+            if points:
+                log_values = [LogSeriesValue(val, step, ts) for val, step, ts in points]
+                self._enqueue_operations(self._to_log_operations(log_values), wait=wait)
+
+    def assign(self, value, wait: bool = False) -> None:
+        with self._container.lock():
+            if self._downsampling is not None:
+                self._downsampling.reset()
+            super().assign(value, wait=wait)
+
+    def _clear_impl(self, wait: bool = False) -> None:
+        with self._container.lock():
+            if self._downsampling is not None:
+                self._downsampling.reset()
+            super()._clear_impl(wait=wait)
+
+    def writer(self) -> "FloatSeriesWriter":
+        return FloatSeriesWriter(self)
+
+    def _append_point(self, value: float, step: float, timestamp: float, *, wait: bool = False) -> None:
+        if not math.isfinite(value):
+            warn_once(
+                message=f"WARNING: A value you're trying to log (`{value}`) will be skipped because "
+                f"it's a non-standard float value that is not currently supported.",
+                exception=NeptuneUnsupportedValue,
+            )
+            return
+
+        with self._container.lock():
+            if self._downsampling is None:
+                points = [(value, step, timestamp)]
+            else:
+                points = self._downsampling.add(value, step, timestamp)
+            if points:
+                log_values = [LogSeriesValue(val, step, ts) for val, step, ts in points]
+                self._enqueue_operation(LogOperation(self._path, log_values), wait=wait)
 
     def _get_clear_operation(self) -> Operation:
         return ClearFloatLog(self._path)
@@ -61,6 +151,24 @@ class FloatSeries(
     def _get_config_operation_from_value(self, value: Val) -> Optional[Operation]:
         return ConfigFloatSeries(self._path, value.min, value.max, value.unit)
 
+    def _get_log_operations_from_value(self, value: Val) -> List[LogOperation]:
+        # Columns are converted to Python floats in one go rather than read value by value
+        points = zip(value.values, value.steps, value.timestamps)
+        if self._downsampling is not None:
+            with self._container.lock():
+                points = [kept for point in points for kept in self._downsampling.add(*point)]
+        # the plain class, instantiating the `ValueType` generic alias is several times slower
+        log_values = [LogSeriesValue(val, step, ts) for val, step, ts in points]
+        return self._to_log_operations(log_values)
+
+    def _to_log_operations(self, log_values: List[LogSeriesValue]) -> List[LogOperation]:
+        # every value has the same serialized size, so the size budget comes down to a number of values
+        batch_size = min(self.max_batch_size, SERIES_OPERATION_MAX_SIZE_BYTES // self._serialized_size(0.0))
+        return [LogOperation(self._path, chunk) for chunk in get_batches(log_values, batch_size=batch_size)]
+
+    def _serialized_size(self, value: Data) -> int:
+        return SERIES_VALUE_OVERHEAD_BYTES + FLOAT_SERIALIZED_SIZE_BYTES
+
     def _data_to_value(self, values: Iterable, **kwargs) -> Val:
         return FloatSeriesVal(values, **kwargs)
 
@@ -80,3 +188,43 @@ class FloatSeries(
             from_step=from_step,
             limit=limit,
         )
+
+
+class FloatSeriesWriter:
+    """Appends values to a float series with little overhead per call.
+
+    The writer is bound to the series field it was created for. Only the types of the value and the step are
+    checked, there is no path resolution or value casting on `append()`.
+    """
+
+    def __init__(self, attribute: FloatSeries) -> None:
+        self._attribute = attribute
+        self._container = attribute._container
+
+    def append(
+        self,
+        value: Union[float, int],
+        step: Union[float, int],
+        timestamp: Optional[Union[float, int]] = None,
+        *,
+        wait: bool = False,
+    ) -> None:
+        """Appends a single value at `step`, timestamped with the current time unless `timestamp` is passed."""
+        self._container._raise_if_stopped()
+        if type(value) is not float:
+            value = _to_float("value", value)
+        if type(step) is not float:
+            step = _to_float("step", step)
+        if timestamp is None:
+            timestamp = time.time()
+        elif type(timestamp) is not float:
+            timestamp = _to_float("timestamp", timestamp)
+        self._attribute._append_point(value, step, timestamp, wait=wait)
+
+
+def _to_float(name: str, value) -> float:
+    if isinstance(value, bool) or (
+        not isinstance(value, (float, int)) and (is_string(value) or not is_float_like(value))
+    ):
+        raise TypeError(f"{name} must be a float or int (was {type(value)})")
+    return float(value)
@@ -31,17 +31,23 @@ from neptune.internal.operation import LogOperation
 from neptune.internal.types.stringify_value import StringifyValue
 from neptune.internal.utils import (
     is_collection,
+    is_numeric_array,
     is_stringify_value,
     verify_collection_type,
     verify_type,
 )
-from neptune.internal.utils.iteration import get_batches
+from neptune.internal.utils.iteration import get_batches_by_size
 from neptune.types.series.series import Series as SeriesVal
 
 ValTV = TypeVar("ValTV", bound=SeriesVal)
 DataTV = TypeVar("DataTV")
 LogOperationTV = TypeVar("LogOperationTV", bound=LogOperation)
 
+# Values are split into operations of at most this serialized size, which keeps requests well below server limits
+SERIES_OPERATION_MAX_SIZE_BYTES = 1024**2
+# Serialized size of the step, the timestamp and the keys of a single value
+SERIES_VALUE_OVERHEAD_BYTES = 64
+
 
 class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
     def __init_subclass__(cls, max_batch_size: int, operation_cls: type(LogOperationTV)):
@@ -55,9 +61,17 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
         mapped_values = self._map_series_val(value)
         values_with_step_and_ts = zip(mapped_values, value.steps, value.timestamps)
         log_values = [self.operation_cls.ValueType(val, step=step, ts=ts) for val, step, ts in values_with_step_and_ts]
-        return [
-            self.operation_cls(self._path, chunk) for chunk in get_batches(log_values, batch_size=self.max_batch_size)
-        ]
+        batches = get_batches_by_size(
+            log_values,
+            batch_size=self.max_batch_size,
+            batch_size_bytes=SERIES_OPERATION_MAX_SIZE_BYTES,
+            size_of=lambda log_value: self._serialized_size(log_value.value),
+        )
+        return [self.operation_cls(self._path, chunk) for chunk in batches]
+
+    def _serialized_size(self, value: DataTV) -> int:
+        """Estimated size of a value in a serialized operation, including its step and timestamp."""
+        return SERIES_VALUE_OVERHEAD_BYTES
 
     @classmethod
     def _map_series_val(cls, value: ValTV) -> List[DataTV]:
@@ -89,13 +103,11 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
         with self._container.lock():
             if config_op:
                 self._enqueue_operation(config_op, wait=False)
-            if not value.values:
+            if len(value) == 0:
                 self._enqueue_operation(clear_op, wait=wait)
             else:
                 self._enqueue_operation(clear_op, wait=False)
-                ops = self._get_log_operations_from_value(value)
-                for op in ops:
-                    self._enqueue_operation(op, wait=wait)
+                self._enqueue_operations(self._get_log_operations_from_value(value), wait=wait)
 
     def log(
         self,
@@ -128,8 +140,7 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
         ops = self._get_log_operations_from_value(value)
 
         with self._container.lock():
-            for op in ops:
-                self._enqueue_operation(op, wait=wait)
+            self._enqueue_operations(ops, wait=wait)
 
     def extend(
         self,
@@ -143,12 +154,14 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
             values = self._handle_stringified_value(values)
 
         if steps is not None:
-            verify_collection_type("steps", steps, (float, int))
+            if not is_numeric_array(steps):
+                verify_collection_type("steps", steps, (float, int))
             if len(steps) != len(values):
                 raise ValueError(f"Number of steps must be equal to number of values ({len(steps)} != {len(values)}")
 
         if timestamps is not None:
-            verify_collection_type("timestamps", timestamps, (float, int))
+            if not is_numeric_array(timestamps):
+                verify_collection_type("timestamps", timestamps, (float, int))
             if len(timestamps) != len(values):
                 raise ValueError(
                     f"Number of timestamps must be equal to number of values ({len(timestamps)} != {len(values)}"
@@ -158,8 +171,7 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
         ops = self._get_log_operations_from_value(value)
 
         with self._container.lock():
-            for op in ops:
-                self._enqueue_operation(op, wait=wait)
+            self._enqueue_operations(ops, wait=wait)
 
     def _clear_impl(self, wait: bool = False) -> None:
         op = self._get_clear_operation()
@@ -15,6 +15,7 @@
 #
 __all__ = ["StringSeries"]
 
+import json
 from typing import (
     TYPE_CHECKING,
     Iterable,
@@ -25,7 +26,10 @@ from typing import (
 
 from neptune.api.models import StringSeriesValues
 from neptune.attributes.series.fetchable_series import FetchableSeries
-from neptune.attributes.series.series import Series
+from neptune.attributes.series.series import (
+    SERIES_VALUE_OVERHEAD_BYTES,
+    Series,
+)
 from neptune.exceptions import NeptuneUnsupportedFunctionalityException
 from neptune.internal.operation import (
     ClearStringLog,
@@ -49,7 +53,10 @@ logger = get_logger()
 
 
 class StringSeries(
-    Series[Val, Data, LogOperation], FetchableSeries[StringSeriesValues], max_batch_size=10, operation_cls=LogOperation
+    Series[Val, Data, LogOperation],
+    FetchableSeries[StringSeriesValues],
+    max_batch_size=10_000,
+    operation_cls=LogOperation,
 ):
     def __init__(self, container: "NeptuneObject", path: List[str]):
         super().__init__(container, path)
@@ -72,6 +79,10 @@ class StringSeries(
 
         return super()._get_log_operations_from_value(value)
 
+    def _serialized_size(self, value: Data) -> int:
+        # Escaped as in the JSON records of the disk queue, at least as long as the UTF-8 encoding of other formats
+        return SERIES_VALUE_OVERHEAD_BYTES + len(json.dumps(value))
+
     def _get_clear_operation(self) -> Operation:
         return ClearStringLog(self._path)
 
@@ -19,11 +19,14 @@ from dataclasses import dataclass
 from pathlib import Path
 from types import TracebackType
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Generic,
+    Iterable,
     List,
     Optional,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -32,8 +35,14 @@ from typing import (
 from neptune.core.components.abstract import WithResources
 from neptune.core.components.queue.disk_queue import (
     DiskQueue,
+    DurabilityPolicy,
     QueueElement,
 )
+from neptune.core.components.queue.record_codec import RecordCodec
+from neptune.core.components.queue.segment_compression import SegmentCompression
+
+if TYPE_CHECKING:
+    from neptune.core.operation_processors.async_operation_processor.sync_scheduler import SyncScheduler
 
 T = TypeVar("T")
 K = TypeVar("K")
@@ -61,6 +70,12 @@ def from_dict_factory(from_dict: Callable[[dict], T]) -> Callable[[dict], Catego
 
 
 class AggregatingDiskQueue(WithResources, Generic[T, K]):
+    """Disk queue whose batches span at most `max_categories_per_batch` distinct categories.
+
+    Elements without a category can join any batch. With the default of one category per batch,
+    a batch ends at the first element of another category.
+    """
+
     def __init__(
         self,
         data_path: Path,
@@ -70,7 +85,15 @@ class AggregatingDiskQueue(WithResources, Generic[T, K]):
         max_file_size: int = 64 * 1024**2,
         max_batch_size_bytes: Optional[int] = None,
         extension: str = "log",
+        codec: Optional[RecordCodec] = None,
+        offset_commit_every: int = 1,
+        offset_commit_interval: Optional[float] = None,
+        compression: Optional[SegmentCompression] = None,
+        durability: Optional[DurabilityPolicy] = None,
+        max_categories_per_batch: int = 1,
+        scheduler: Optional["SyncScheduler"] = None,
     ) -> None:
+        self._max_categories_per_batch: int = max(max_categories_per_batch, 1)
         self._disk_queue = DiskQueue[CategoryQueueElement[T, K]](
             data_path=data_path,
             to_dict=to_dict_factory(to_dict),
@@ -79,6 +102,12 @@ class AggregatingDiskQueue(WithResources, Generic[T, K]):
             max_file_size=max_file_size,
             max_batch_size_bytes=max_batch_size_bytes,
             extension=extension,
+            codec=codec,
+            offset_commit_every=offset_commit_every,
+            offset_commit_interval=offset_commit_interval,
+            compression=compression,
+            durability=durability,
+            scheduler=scheduler,
         )
         self._stored_element: Optional[QueueElement[CategoryQueueElement[T, K]]] = None
         self._empty_cond = threading.Condition(threading.Lock())
@@ -86,6 +115,10 @@ class AggregatingDiskQueue(WithResources, Generic[T, K]):
     def put(self, obj: T, category: Optional[K] = None) -> int:
         return self._disk_queue.put(CategoryQueueElement(obj, category))
 
+    def put_batch(self, items: Iterable[Tuple[T, Optional[K]]]) -> int:
+        """Puts `(obj, category)` pairs with consecutive versions and returns the version of the last one."""
+        return self._disk_queue.put_batch(CategoryQueueElement(obj, category) for obj, category in items)
+
     def get(self) -> Optional[QueueElement[CategoryQueueElement[T, K]]]:
         if self._stored_element is not None:
             tmp = self._stored_element
@@ -94,7 +127,10 @@ class AggregatingDiskQueue(WithResources, Generic[T, K]):
         else:
             return self._disk_queue.get()
 
-    def get_batch(self, size: int) -> List[QueueElement[CategoryQueueElement[T, K]]]:
+    def get_batch(
+        self, size: int, max_size_bytes: Optional[int] = None
+    ) -> List[QueueElement[CategoryQueueElement[T, K]]]:
+        max_size_bytes = max_size_bytes or self.max_batch_size_bytes
         if self._stored_element is not None:
             first: QueueElement[CategoryQueueElement[T, K]] = self._stored_element
             self._stored_element = None
@@ -106,21 +142,21 @@ class AggregatingDiskQueue(WithResources, Generic[T, K]):
                 first = possible_first
 
         ret = [first]
-        category = first.obj.category
+        categories: Set[K] = set() if first.obj.category is None else {first.obj.category}
         cur_batch_size = first.size
         for _ in range(0, size - 1):
-            if cur_batch_size >= self._disk_queue._max_batch_size_bytes:
+            if cur_batch_size >= max_size_bytes:
                 break
             next_obj = self._disk_queue._get()
             if not next_obj:
                 break
 
-            if next_obj.obj.category is not None:
-                if category is None:
-                    category = next_obj.obj.category
-                elif category != next_obj.obj.category:
+            category = next_obj.obj.category
+            if category is not None and category not in categories:
+                if len(categories) >= self._max_categories_per_batch:
                     self._stored_element = next_obj
                     break
+                categories.add(category)
 
             cur_batch_size += next_obj.size
             ret.append(next_obj)
@@ -151,6 +187,16 @@ class AggregatingDiskQueue(WithResources, Generic[T, K]):
     def size(self) -> int:
         return self._disk_queue.size()
 
+    def size_bytes(self) -> int:
+        return self._disk_queue.size_bytes()
+
+    def pending_bytes(self) -> int:
+        return self._disk_queue.pending_bytes()
+
+    @property
+    def max_batch_size_bytes(self) -> int:
+        return self._disk_queue.max_batch_size_bytes
+
     def is_empty(self) -> bool:
         return self._disk_queue.is_empty() and self._stored_element is None
 
@@ -13,22 +13,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["QueueElement", "DiskQueue"]
+__all__ = ["QueueElement", "DiskQueue", "DurabilityPolicy"]
 
-import json
 import os
 import threading
 from collections import deque
 from dataclasses import dataclass
+from enum import Enum
 from glob import glob
 from pathlib import Path
-from time import time
+from time import (
+    monotonic,
+    time,
+)
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
     Callable,
     Deque,
     Generic,
+    Iterable,
     List,
     Optional,
     Tuple,
@@ -37,14 +41,31 @@ from typing import (
 )
 
 from neptune.core.components.abstract import WithResources
-from neptune.core.components.queue.json_file_splitter import JsonFileSplitter
 from neptune.core.components.queue.log_file import LogFile
+from neptune.core.components.queue.record_codec import (
+    RecordCodec,
+    detect_record_codec,
+    get_record_codec,
+)
+from neptune.core.components.queue.segment_compactor import SegmentCompactor
+from neptune.core.components.queue.segment_compression import (
+    SegmentCompression,
+    get_segment_compression,
+)
+from neptune.core.components.queue.segment_index import INDEX_INTERVAL_BYTES
+from neptune.core.components.queue.segment_preparer import SegmentPreparer
 from neptune.core.components.queue.sync_offset_file import SyncOffsetFile
+from neptune.envs import (
+    NEPTUNE_DISK_QUEUE_COMPRESSION,
+    NEPTUNE_DISK_QUEUE_DURABILITY,
+    NEPTUNE_DISK_QUEUE_RECORD_FORMAT,
+)
 from neptune.exceptions import MalformedOperation
 from neptune.internal.utils.logger import get_logger
 
 if TYPE_CHECKING:
     from neptune.core.components.abstract import Resource
+    from neptune.core.operation_processors.async_operation_processor.sync_scheduler import SyncScheduler
 
 
 T = TypeVar("T")
@@ -54,6 +75,29 @@ _logger = get_logger()
 
 
 DEFAULT_MAX_BATCH_SIZE_BYTES = 100 * 1024**2
+DEFAULT_RECORD_FORMAT = "json"
+
+# Group commit settings for the put offset used by the operation processors
+OFFSET_GROUP_COMMIT_EVERY = 1000
+OFFSET_GROUP_COMMIT_INTERVAL_SECONDS = 1.0
+
+DEFAULT_DURABILITY_INTERVAL_SECONDS = 1.0
+
+# Segments are sized to hold about this long of writes, between the minimum and `max_file_size`
+SEGMENT_TARGET_DURATION_SECONDS = 60.0
+MIN_SEGMENT_SIZE = 1024**2
+
+
+class DurabilityPolicy(str, Enum):
+    """When records written by `put` are pushed out of the process buffers.
+
+    Independently of the policy, the queue is flushed whenever `flush` is called.
+    """
+
+    NONE = "none"  # left to the buffered file and explicit flushes
+    FLUSH_PER_INTERVAL = "flush-per-interval"  # handed to the OS at most every interval, survives a process crash
+    FSYNC_PER_INTERVAL = "fsync-per-interval"  # fsynced at most every interval, survives a machine crash
+    FSYNC_PER_BATCH = "fsync-per-batch"  # fsynced before every `put` and `put_batch` returns
 
 
 @dataclass
@@ -75,6 +119,13 @@ class DiskQueue(WithResources, Generic[T]):
         max_file_size: int = 64 * 1024**2,
         max_batch_size_bytes: Optional[int] = None,
         extension: str = "log",
+        codec: Optional[RecordCodec] = None,
+        offset_commit_every: int = 1,
+        offset_commit_interval: Optional[float] = None,
+        compression: Optional[SegmentCompression] = None,
+        durability: Optional[DurabilityPolicy] = None,
+        durability_interval: float = DEFAULT_DURABILITY_INTERVAL_SECONDS,
+        scheduler: Optional["SyncScheduler"] = None,
     ) -> None:
         self._data_path: Path = data_path.resolve()
         self._to_dict: Callable[[T], dict] = to_dict
@@ -84,19 +135,61 @@ class DiskQueue(WithResources, Generic[T]):
             os.environ.get("NEPTUNE_MAX_BATCH_SIZE_BYTES") or str(DEFAULT_MAX_BATCH_SIZE_BYTES)
         )
         self._extension: str = extension
+        self._codec: RecordCodec = codec or get_record_codec(
+            os.environ.get(NEPTUNE_DISK_QUEUE_RECORD_FORMAT) or DEFAULT_RECORD_FORMAT
+        )
+        compression_name = os.environ.get(NEPTUNE_DISK_QUEUE_COMPRESSION)
+        if compression is None and compression_name:
+            compression = get_segment_compression(compression_name)
+        self._compactor: Optional[SegmentCompactor] = (
+            SegmentCompactor(compression, scheduler=scheduler) if compression else None
+        )
+        self._durability: DurabilityPolicy = durability or DurabilityPolicy(
+            os.environ.get(NEPTUNE_DISK_QUEUE_DURABILITY) or DurabilityPolicy.NONE.value
+        )
+        self._durability_interval: float = durability_interval
+        self._last_durable_write: float = monotonic()
 
         self._last_ack_file = SyncOffsetFile(data_path / "last_ack_version", default=0)
-        self._last_put_file = SyncOffsetFile(data_path / "last_put_version", default=0)
+        # Acks are persisted right away, as the acknowledged version cannot be recovered from the segments
+        self._last_put_file = SyncOffsetFile(
+            data_path / "last_put_version",
+            default=0,
+            commit_every=offset_commit_every,
+            commit_interval=offset_commit_interval,
+        )
+
+        self._log_files: Deque[LogFile] = get_all_log_files(data_path, extension, self._codec)
+        self._recover_last_put_version()
 
-        self._log_files: Deque[LogFile] = get_all_log_files(data_path, extension)
+        if self._compactor is not None:
+            for sealed_log_file in list(self._log_files)[:-1]:
+                self._compactor.schedule(sealed_log_file.file_path)
         self._write_file_version: int = self._log_files[-1].min_version
         self._writer = self._log_files[-1]
+        self._sealed_size: int = sum(log_file.file_size for log_file in list(self._log_files)[:-1])
+
+        self._segment_preparer = SegmentPreparer(self._data_path, extension, self._codec, scheduler=scheduler)
+        self._next_segment_requested: bool = False
+        self._segment_size: int = max_file_size
+        self._segment_started_at: float = monotonic()
+        self._segment_start_size: int = self._writer.file_size
         self._read_file_version: int = self._log_files[0].min_version
-        self._reader = JsonFileSplitter(self._log_files[0].file_path)
+        self._reader = self._log_files[0].open_reader()
 
         self._should_skip_to_ack = True
 
-        self._empty_cond = threading.Condition(lock)
+        # `(version, bytes put up to it)` of every put call not acknowledged yet
+        self._put_marks: Deque[Tuple[int, int]] = deque()
+        self._put_bytes: int = 0
+        self._acked_bytes: int = 0
+        if not self.is_empty():
+            # Records left by a previous process all count until they are acknowledged
+            self._put_bytes = self.size_bytes()
+            self._put_marks.append((self._last_put_file.read_local(), self._put_bytes))
+
+        # Not bound to `lock`: writers may hold it while waiting for the consumer to acknowledge operations
+        self._empty_cond = threading.Condition(threading.Lock())
 
     @property
     def data_path(self) -> Path:
@@ -109,17 +202,105 @@ class DiskQueue(WithResources, Generic[T]):
             self._last_ack_file,
         ) + tuple(self._log_files)
 
+    def _recover_last_put_version(self) -> None:
+        # The persisted put offset may lag behind the records that reached the disk, e.g. after a crash
+        # between group commits. Segments are rotated at version boundaries, so only the newest one,
+        # which is never compacted, has to be looked at.
+        newest = self._log_files[-1]
+        codec_class = detect_record_codec(newest.file_path)
+        if codec_class is None:
+            return
+
+        last_record, end = codec_class().read_last_record(newest.file_path)
+        if end < newest.file_size:
+            # Records put from now on would be appended to the torn one and could not be read back
+            _logger.warning(
+                "Dropping %d bytes of a record torn by a crash in %s", newest.file_size - end, newest.file_name
+            )
+            newest.truncate(end)
+
+        last_version = last_record["version"] if last_record else newest.min_version - 1
+
+        if last_version > self._last_put_file.read_local():
+            _logger.debug("Recovered last put version %d from %s", last_version, newest.file_name)
+            self._last_put_file.write(last_version)
+            self._last_put_file.flush()
+
     def put(self, obj: T) -> int:
         version = self._last_put_file.read_local() + 1
-        serialized_obj = json.dumps(self._serialize(obj=obj, version=version, at=time()))
+        serialized_obj = self._codec.encode(self._serialize(obj=obj, version=version, at=time()))
 
         self._create_new_writer_if_file_size_exceeded(len(serialized_obj), version)
 
-        self._writer.write(serialized_obj)
+        self._writer.write(serialized_obj, version)
         self._last_put_file.write(version)
+        self._mark_put(version, len(serialized_obj))
+        self._apply_durability()
+
+        return version
+
+    def put_batch(self, objs: Iterable[T]) -> int:
+        """Puts `objs` with consecutive versions and returns the version of the last one.
+
+        Records are encoded up front and written with one write per segment; the put offset is updated once.
+        """
+        version = self._last_put_file.read_local()
+        at = time()
+        records: List[Tuple[bytes, int]] = []
+        records_size = 0
+        batch_size = 0
+
+        for obj in objs:
+            version += 1
+            serialized_obj = self._codec.encode(self._serialize(obj=obj, version=version, at=at))
+
+            if records and self._writer.file_size + records_size + len(serialized_obj) > self._segment_size:
+                self._writer.write_batch(records)
+                records, records_size = [], 0
+            if not records:
+                self._create_new_writer_if_file_size_exceeded(len(serialized_obj), version)
+
+            records.append((serialized_obj, version))
+            records_size += len(serialized_obj)
+            batch_size += len(serialized_obj)
+
+        if records:
+            self._writer.write_batch(records)
+            self._last_put_file.write(version)
+            self._mark_put(version, batch_size)
+            self._apply_durability()
 
         return version
 
+    def _mark_put(self, version: int, size: int) -> None:
+        self._put_bytes += size
+        self._put_marks.append((version, self._put_bytes))
+
+    @property
+    def _is_fsynced(self) -> bool:
+        return self._durability in (DurabilityPolicy.FSYNC_PER_INTERVAL, DurabilityPolicy.FSYNC_PER_BATCH)
+
+    def _apply_durability(self) -> None:
+        # The put offset is not synced, it is recovered from the segment after a crash
+        if self._durability == DurabilityPolicy.NONE:
+            return
+        if self._durability == DurabilityPolicy.FSYNC_PER_BATCH:
+            self._writer.sync()
+            return
+
+        now = monotonic()
+        if now - self._last_durable_write >= self._durability_interval:
+            self._last_durable_write = now
+            if self._durability == DurabilityPolicy.FSYNC_PER_INTERVAL:
+                self._writer.sync()
+            else:
+                self._writer.flush()
+
+    def flush(self) -> None:
+        super().flush()
+        if self._is_fsynced:
+            self._writer.sync()
+
     def get(self) -> Optional[QueueElement[T]]:
         if self._should_skip_to_ack:
             return self._skip_and_get()
@@ -128,6 +309,7 @@ class DiskQueue(WithResources, Generic[T]):
 
     def _skip_and_get(self) -> Optional[QueueElement[T]]:
         ack_version = self._last_ack_file.read_local()
+        self._seek_to_version(ack_version + 1)
         while True:
             top_element = self._get()
             if top_element is None:
@@ -142,6 +324,67 @@ class DiskQueue(WithResources, Generic[T]):
                     )
                 return top_element
 
+    def _seek_to_version(self, version: int) -> None:
+        """Moves the reader close to `version` using the segment indexes, records before it are still skipped."""
+        target: Optional[LogFile] = None
+        for log_file in self._log_files:
+            if log_file.min_version <= version:
+                target = log_file
+
+        if target is None:
+            return
+
+        offset = self._find_offset(target, version)
+        if offset is None and target.min_version == self._read_file_version:
+            return
+
+        self._reader.close()
+        self._read_file_version = target.min_version
+        self._reader = target.open_reader(offset)
+
+    def _find_offset(self, log_file: LogFile, version: int) -> Optional[int]:
+        entry = log_file.index.lookup(version)
+        if entry is not None and self._is_valid_index_entry(log_file, *entry):
+            return entry[1]
+
+        if entry is not None or log_file.index.is_empty:
+            _logger.debug("Rebuilding index of %s", log_file.file_name)
+            self._rebuild_index(log_file)
+            entry = log_file.index.lookup(version)
+
+        return entry[1] if entry is not None else None
+
+    @staticmethod
+    def _is_valid_index_entry(log_file: LogFile, version: int, offset: int) -> bool:
+        try:
+            reader = log_file.open_reader(offset)
+            try:
+                data, _ = reader.get_with_size()
+            finally:
+                reader.close()
+        except Exception:
+            return False
+        return data is not None and data.get("version") == version
+
+    @staticmethod
+    def _rebuild_index(log_file: LogFile) -> None:
+        entries: List[Tuple[int, int]] = []
+        reader = log_file.open_reader()
+        try:
+            while True:
+                offset = reader.position
+                data, _ = reader.get_with_size()
+                if data is None:
+                    break
+                if not entries or offset - entries[-1][1] >= INDEX_INTERVAL_BYTES:
+                    entries.append((data["version"], offset))
+        except Exception:
+            # Entries collected up to a malformed record are still correct
+            _logger.debug("Malformed record while rebuilding index of %s", log_file.file_name)
+        finally:
+            reader.close()
+        log_file.index.rebuild(entries)
+
     def _get(self) -> Optional[QueueElement[T]]:
         _json, size = self._reader.get_with_size()
         if not _json:
@@ -152,7 +395,7 @@ class DiskQueue(WithResources, Generic[T]):
             for log_file in self._log_files:
                 if log_file.min_version > self._read_file_version:
                     self._read_file_version = log_file.min_version
-                    self._reader = JsonFileSplitter(log_file.file_path)
+                    self._reader = log_file.open_reader()
                     break
 
             # It is safe. Max recursion level is 2.
@@ -163,7 +406,8 @@ class DiskQueue(WithResources, Generic[T]):
         except Exception as e:
             raise MalformedOperation from e
 
-    def get_batch(self, size: int) -> List[QueueElement[T]]:
+    def get_batch(self, size: int, max_size_bytes: Optional[int] = None) -> List[QueueElement[T]]:
+        max_size_bytes = max_size_bytes or self._max_batch_size_bytes
         if self._should_skip_to_ack:
             first = self._skip_and_get()
         else:
@@ -174,7 +418,7 @@ class DiskQueue(WithResources, Generic[T]):
         ret = [first]
         cur_batch_size = first.size
         for _ in range(0, size - 1):
-            if cur_batch_size >= self._max_batch_size_bytes:
+            if cur_batch_size >= max_size_bytes:
                 break
             next_obj = self._get()
             if not next_obj:
@@ -191,26 +435,72 @@ class DiskQueue(WithResources, Generic[T]):
     def ack(self, version: int) -> None:
         self._last_ack_file.write(version)
         self._clean_log_files_up_to(version)
+        while self._put_marks and self._put_marks[0][0] <= version:
+            self._acked_bytes = self._put_marks.popleft()[1]
 
         with self._empty_cond:
             if self.is_empty():
                 self._empty_cond.notify_all()
 
     def _create_new_writer_if_file_size_exceeded(self, size: int, version: int) -> None:
-        if self._writer.file_size + size > self._max_file_size:
+        file_size = self._writer.file_size + size
+        # A segment left by a queue with a different record format is never appended to
+        if file_size > self._segment_size or not isinstance(self._codec, self._writer.codec_class):
             old_writer = self._writer
-            self._writer = LogFile(self._data_path, version, extension=self._extension)
+            self._adapt_segment_size(old_writer)
+            self._writer = self._create_log_file(version)
+            if self._is_fsynced:
+                old_writer.sync()
             old_writer.flush()
             old_writer.close()
+            self._sealed_size += old_writer.file_size
             self._write_file_version = version
             self._log_files.append(self._writer)
 
+            if self._compactor is not None:
+                self._compactor.schedule(old_writer.file_path)
+        elif not self._next_segment_requested and file_size > self._segment_size // 2:
+            self._next_segment_requested = True
+            self._segment_preparer.request()
+
+    def _create_log_file(self, version: int) -> LogFile:
+        log_file = self._segment_preparer.take()
+        if log_file is not None:
+            try:
+                log_file.rename(version)
+                self._segment_preparer.request()
+                return log_file
+            except OSError:
+                _logger.debug("Cannot use the prepared queue file", exc_info=True)
+                log_file.cleanup()
+        return LogFile(self._data_path, version, extension=self._extension, codec=self._codec)
+
+    def _adapt_segment_size(self, sealed: LogFile) -> None:
+        now = monotonic()
+        elapsed = now - self._segment_started_at
+        written = sealed.file_size - self._segment_start_size
+        self._segment_started_at = now
+        self._segment_start_size = 0
+
+        if elapsed > 0 and written > 0:
+            target = int(written / elapsed * SEGMENT_TARGET_DURATION_SECONDS)
+            self._segment_size = max(min(target, self._max_file_size), min(MIN_SEGMENT_SIZE, self._max_file_size))
+
     def _clean_log_files_up_to(self, version: int) -> None:
         log_versions = [log.min_version for log in self._log_files]
 
         for current_min_version, next_min_version in zip(log_versions, log_versions[1:]):
             if next_min_version <= version:
-                self._log_files.popleft().cleanup()
+                log_file = self._log_files.popleft()
+                if self._compactor is not None:
+                    self._compactor.discard(log_file.file_path, log_file.cleanup)
+                else:
+                    log_file.cleanup()
+                self._sealed_size -= log_file.file_size
+
+    @property
+    def max_batch_size_bytes(self) -> int:
+        return self._max_batch_size_bytes
 
     def is_empty(self) -> bool:
         return self.size() == 0
@@ -218,6 +508,17 @@ class DiskQueue(WithResources, Generic[T]):
     def size(self) -> int:
         return self._last_put_file.read_local() - self._last_ack_file.read_local()
 
+    def size_bytes(self) -> int:
+        """Uncompressed size of the segments kept on disk, including acknowledged records not yet removed."""
+        return self._sealed_size + self._writer.file_size
+
+    def pending_bytes(self) -> int:
+        """Encoded size of the records not acknowledged yet.
+
+        Records put with a single `put_batch` are only subtracted once all of them are acknowledged.
+        """
+        return self._put_bytes - self._acked_bytes
+
     def _serialize(self, obj: T, version: int, at: Optional[Timestamp] = None) -> dict:
         return {"obj": self._to_dict(obj), "version": version, "at": at}
 
@@ -225,6 +526,9 @@ class DiskQueue(WithResources, Generic[T]):
         return self._from_dict(data["obj"]), data["version"], data.get("at")
 
     def close(self) -> None:
+        self._segment_preparer.stop()
+        if self._compactor is not None:
+            self._compactor.stop()
         self._reader.close()
         super().close()
 
@@ -243,11 +547,11 @@ class DiskQueue(WithResources, Generic[T]):
             self.cleanup()
 
 
-def get_all_log_files(data_path: Path, extension: str) -> Deque[LogFile]:
+def get_all_log_files(data_path: Path, extension: str, codec: Optional[RecordCodec] = None) -> Deque[LogFile]:
     local_data_files = glob(f"{data_path}/data-*.{extension}")
 
     if not local_data_files:
-        return deque([LogFile(data_path, 1, extension=extension)])
+        return deque([LogFile(data_path, 1, extension=extension, codec=codec)])
 
     sorted_local_data_files = sorted(
         local_data_files, key=lambda file_path: extract_version_from_file_name(Path(file_path), extension)
@@ -255,7 +559,9 @@ def get_all_log_files(data_path: Path, extension: str) -> Deque[LogFile]:
 
     return deque(
         [
-            LogFile(data_path, extract_version_from_file_name(Path(file_path), extension), extension=extension)
+            LogFile(
+                data_path, extract_version_from_file_name(Path(file_path), extension), extension=extension, codec=codec
+            )
             for file_path in sorted_local_data_files
         ]
     )
@@ -13,25 +13,65 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import os
 from pathlib import Path
+from typing import (
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
 from neptune.core.components.abstract import Resource
+from neptune.core.components.queue.record_codec import (
+    JsonRecordCodec,
+    RecordCodec,
+    RecordReader,
+    detect_record_codec,
+)
+from neptune.core.components.queue.segment_index import (
+    INDEX_INTERVAL_BYTES,
+    SegmentIndex,
+)
 from neptune.internal.utils.logger import get_logger
 
 logger = get_logger()
 
 
 class LogFile(Resource):
-    def __init__(self, data_path: Path, min_version: int, extension: str = "log") -> None:
+    def __init__(
+        self,
+        data_path: Path,
+        min_version: int,
+        extension: str = "log",
+        codec: Optional[RecordCodec] = None,
+        file_name: Optional[str] = None,
+    ) -> None:
         self._data_path: Path = data_path
         self._min_version: int = min_version
         self._extension: str = extension
+        # Segments prepared ahead of time get a temporary name until `rename` gives them their version
+        self._file_name: str = file_name or segment_file_name(min_version, extension)
 
         self._file_size: int = 0
-        if (data_path / f"data-{min_version}.{extension}").exists():
+        if self.file_path.exists():
             self._file_size = self.file_path.stat().st_size
 
-        self._writer = open(self.file_path, "a")
+        # Existing segments keep the format they were written with
+        detected_codec_class = detect_record_codec(self.file_path)
+        self._codec_class: Type[RecordCodec] = detected_codec_class or (type(codec) if codec else JsonRecordCodec)
+        # shared by all readers of the segment, so the format is not detected again on every open
+        self._reader_codec: RecordCodec = codec if type(codec) is self._codec_class else self._codec_class()
+
+        self._writer = open(self.file_path, "ab")
+        if self._file_size == 0 and codec is not None and codec.file_header:
+            # Flushed right away, so a reader opened on a fresh segment can detect its format
+            self._writer.write(codec.file_header)
+            self._writer.flush()
+            self._file_size = len(codec.file_header)
+
+        self._index = SegmentIndex(self._data_path / f"{self.file_name}.idx")
+        self._last_indexed_offset: Optional[int] = None
 
     @property
     def data_path(self) -> Path:
@@ -41,21 +81,64 @@ class LogFile(Resource):
     def min_version(self) -> int:
         return self._min_version
 
+    @property
+    def codec_class(self) -> Type[RecordCodec]:
+        return self._codec_class
+
+    def open_reader(self, offset: Optional[int] = None) -> RecordReader:
+        """Opens the segment for reading, at `offset` if given."""
+        return self._reader_codec.open_reader(self.file_path, offset)
+
+    @property
+    def index(self) -> SegmentIndex:
+        return self._index
+
     @property
     def file_size(self) -> int:
         return self._file_size
 
     @property
     def file_name(self) -> str:
-        return f"data-{self._min_version}.{self._extension}"
+        return self._file_name
 
     @property
     def file_path(self) -> Path:
         return self._data_path / self.file_name
 
-    def write(self, data: str) -> None:
-        self._writer.write(data + "\n")
-        self._file_size += len(data) + 1
+    def rename(self, min_version: int) -> None:
+        """Moves the segment under the name of `min_version`, open handles keep working."""
+        file_name = segment_file_name(min_version, self._extension)
+        os.replace(self.file_path, self._data_path / file_name)
+        self._index.rename(self._data_path / f"{file_name}.idx")
+        self._min_version = min_version
+        self._file_name = file_name
+
+    def write(self, data: bytes, version: int) -> None:
+        self._index_record(version, self._file_size)
+
+        self._writer.write(data)
+        self._file_size += len(data)
+
+    def write_batch(self, records: Sequence[Tuple[bytes, int]]) -> None:
+        """Appends encoded records, given as `(data, version)` pairs, with a single write."""
+        offset = self._file_size
+        for data, version in records:
+            self._index_record(version, offset)
+            offset += len(data)
+
+        self._writer.write(b"".join(data for data, _ in records))
+        self._file_size = offset
+
+    def truncate(self, size: int) -> None:
+        """Cuts the segment at `size`, records are appended from there on."""
+        self._writer.flush()
+        self._writer.truncate(size)
+        self._file_size = size
+
+    def _index_record(self, version: int, offset: int) -> None:
+        if self._last_indexed_offset is None or offset - self._last_indexed_offset >= INDEX_INTERVAL_BYTES:
+            self._index.add(version, offset)
+            self._last_indexed_offset = offset
 
     def cleanup(self) -> None:
         self.close()
@@ -65,11 +148,25 @@ class LogFile(Resource):
             pass
         except Exception:
             logger.exception("Cannot remove queue file %s", self.file_name)
+        self._index.cleanup()
 
     def flush(self) -> None:
+        # Records go first, so the index does not point past the data that reached the disk
         if not self._writer.closed:
             self._writer.flush()
+        self._index.flush()
+
+    def sync(self) -> None:
+        """Flushes the segment and waits until the OS has stored it on the disk, the index is left as a hint."""
+        if not self._writer.closed:
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
 
     def close(self) -> None:
         if not self._writer.closed:
             self._writer.close()
+        self._index.close()
+
+
+def segment_file_name(min_version: int, extension: str) -> str:
+    return f"data-{min_version}.{extension}"
@@ -0,0 +1,188 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "RecordCodec",
+    "RecordReader",
+    "JsonRecordCodec",
+    "MsgpackRecordCodec",
+    "get_record_codec",
+    "detect_record_codec",
+]
+
+import json
+import os
+import zlib
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from typing_extensions import Protocol
+
+from neptune.core.components.queue.segment_compression import open_segment
+from neptune.core.components.queue.segment_reader import (
+    BINARY_FILE_MAGIC,
+    FRAME_HEADER,
+    BinarySegmentReader,
+    JsonSegmentReader,
+)
+from neptune.exceptions import MalformedOperation
+from neptune.internal.utils.requirement_check import require_installed
+
+
+class RecordReader(Protocol):
+    @property
+    def position(self) -> int: ...
+
+    def get_with_size(self) -> Tuple[Optional[dict], int]: ...
+
+    def close(self) -> None: ...
+
+
+class RecordCodec(ABC):
+    """Encodes queue records for a `LogFile` segment and opens readers for segments written with it."""
+
+    name: str = ""
+    file_header: bytes = b""
+
+    @abstractmethod
+    def encode(self, data: dict) -> bytes: ...
+
+    @abstractmethod
+    def open_reader(self, file_path: Path, offset: Optional[int] = None) -> RecordReader:
+        """Opens a reader at the start of the first record or at `offset`, which must point to a record."""
+        ...
+
+    @abstractmethod
+    def read_last_record(self, file_path: Path) -> Tuple[Optional[dict], int]:
+        """Returns the last complete record of an uncompressed segment and the offset right past it.
+
+        A tail cut by a crash is skipped, the offset is where the next record should be written.
+        """
+        ...
+
+
+class JsonRecordCodec(RecordCodec):
+    name = "json"
+
+    TAIL_CHUNK_SIZE = 64 * 1024
+
+    def encode(self, data: dict) -> bytes:
+        return json.dumps(data).encode("utf-8") + b"\n"
+
+    def open_reader(self, file_path: Path, offset: Optional[int] = None) -> RecordReader:
+        return JsonSegmentReader(file_path, offset or 0)
+
+    def read_last_record(self, file_path: Path) -> Tuple[Optional[dict], int]:
+        # Records are written one per line, so only the tail of the file has to be read
+        with open(file_path, "rb") as file:
+            file_size = file.seek(0, os.SEEK_END)
+            chunk_size = self.TAIL_CHUNK_SIZE
+            while True:
+                start = max(0, file_size - chunk_size)
+                file.seek(start)
+                chunk = file.read(file_size - start)
+
+                # Bytes after the last line break belong to a record that was not written completely
+                end = chunk.rfind(b"\n")
+                while end >= 0:
+                    line_start = chunk.rfind(b"\n", 0, end) + 1
+                    if line_start == 0 and start > 0:
+                        # the first line is most likely incomplete
+                        break
+                    try:
+                        data = json.loads(chunk[line_start:end])
+                    except ValueError:
+                        data = None
+                    if isinstance(data, dict):
+                        return data, start + end + 1
+                    end = line_start - 1
+
+                if start == 0:
+                    return None, 0
+                chunk_size *= 4
+
+
+class MsgpackRecordCodec(RecordCodec):
+    """Length-prefixed binary frames: `<payload length><type tag><crc32>` followed by a msgpack payload."""
+
+    name = "msgpack"
+    file_header = BINARY_FILE_MAGIC
+    type_tag = 1
+
+    def __init__(self) -> None:
+        require_installed("msgpack", suggestion="msgpack")
+
+        import msgpack
+
+        self._packer = msgpack.Packer(use_bin_type=True)
+        self._unpackb = msgpack.unpackb
+
+    def encode(self, data: dict) -> bytes:
+        payload: bytes = self._packer.pack(data)
+        return FRAME_HEADER.pack(len(payload), self.type_tag, zlib.crc32(payload)) + payload
+
+    def decode(self, type_tag: int, payload: bytes) -> dict:
+        if type_tag != self.type_tag:
+            raise MalformedOperation(f"Unknown queue record type: {type_tag}")
+        data: Dict[str, Any] = self._unpackb(payload, raw=False, strict_map_key=False)
+        return data
+
+    def open_reader(self, file_path: Path, offset: Optional[int] = None) -> RecordReader:
+        return BinarySegmentReader(file_path, decode=self.decode, offset=offset)
+
+    def read_last_record(self, file_path: Path) -> Tuple[Optional[dict], int]:
+        last_frame: Optional[Tuple[int, bytes]] = None
+        reader = BinarySegmentReader(file_path, decode=self.decode)
+        try:
+            for type_tag, payload in reader.iter_frames():
+                last_frame = type_tag, payload
+            end = reader.position
+        finally:
+            reader.close()
+        return (self.decode(*last_frame) if last_frame else None), end
+
+
+_CODECS: Dict[str, Type[RecordCodec]] = {codec.name: codec for codec in (JsonRecordCodec, MsgpackRecordCodec)}
+
+
+def get_record_codec(name: str) -> RecordCodec:
+    if name not in _CODECS:
+        raise ValueError(f"record format should be one of {list(_CODECS)}")
+    return _CODECS[name]()
+
+
+def detect_record_codec(file_path: Path) -> Optional[Type[RecordCodec]]:
+    """Returns the codec class a segment was written with or `None` if the file is empty or missing."""
+    try:
+        with open_segment(file_path) as file:
+            header = file.read(len(BINARY_FILE_MAGIC))
+    except FileNotFoundError:
+        return None
+
+    if not header:
+        return None
+    if header == BINARY_FILE_MAGIC:
+        return MsgpackRecordCodec
+    return JsonRecordCodec
@@ -0,0 +1,93 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["RingBuffer"]
+
+import threading
+from collections import deque
+from typing import (
+    Deque,
+    Generic,
+    List,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class RingBuffer(Generic[T]):
+    """Bounded in-memory FIFO handing objects over from producer threads to a single consumer thread.
+
+    `put` and `pop_batch` rely on `deque.append` and `deque.popleft` being atomic and take no lock, so the capacity
+    is only approximate when several producers race for the last slot. The condition is used only by producers
+    that wait for space.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity should be positive")
+        self._capacity: int = capacity
+        self._items: Deque[T] = deque()
+        self._space_cond = threading.Condition()
+        self._space_waiters: int = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def is_empty(self) -> bool:
+        return not self._items
+
+    def is_full(self) -> bool:
+        return len(self._items) >= self._capacity
+
+    def put(self, obj: T) -> bool:
+        """Appends `obj` unless the buffer is full, returns whether it was appended."""
+        if len(self._items) >= self._capacity:
+            return False
+        self._items.append(obj)
+        return True
+
+    def put_blocking(self, obj: T, timeout: Optional[float] = None) -> bool:
+        """Waits up to `timeout` seconds for space, returns whether `obj` was appended."""
+        with self._space_cond:
+            self._space_waiters += 1
+            try:
+                if not self._space_cond.wait_for(self._has_space, timeout=timeout):
+                    return False
+            finally:
+                self._space_waiters -= 1
+            self._items.append(obj)
+            return True
+
+    def pop_batch(self, max_size: int) -> List[T]:
+        items: List[T] = []
+        try:
+            for _ in range(max_size):
+                items.append(self._items.popleft())
+        except IndexError:
+            pass
+
+        if items and self._space_waiters:
+            with self._space_cond:
+                self._space_cond.notify_all()
+        return items
+
+    def _has_space(self) -> bool:
+        return len(self._items) < self._capacity
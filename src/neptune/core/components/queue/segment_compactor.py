@@ -0,0 +1,121 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["SegmentCompactor"]
+
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Optional,
+)
+
+from neptune.core.components.queue.segment_compression import (
+    SegmentCompression,
+    detect_segment_compression,
+)
+from neptune.internal.daemon import Daemon
+from neptune.internal.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from neptune.core.operation_processors.async_operation_processor.sync_scheduler import SyncScheduler
+
+logger = get_logger()
+
+
+class SegmentCompactor(Daemon):
+    """Compresses sealed queue segments in the background.
+
+    A segment is compressed into a temporary file which then atomically replaces it, unless the segment has been
+    removed in the meantime. Readers that still have the old file open keep reading the uncompressed content.
+    """
+
+    def __init__(
+        self,
+        compression: SegmentCompression,
+        sleep_time: float = 5.0,
+        scheduler: Optional["SyncScheduler"] = None,
+    ) -> None:
+        super().__init__(sleep_time=sleep_time, name="NeptuneSegmentCompactor", scheduler=scheduler)
+        self._compression = compression
+        self._lock = threading.Lock()
+        self._pending: Deque[Path] = deque()
+
+    def schedule(self, file_path: Path) -> None:
+        with self._lock:
+            self._pending.append(file_path)
+        if not self.is_alive() and not self._is_interrupted():
+            self.start()
+        self.wake_up()
+
+    def discard(self, file_path: Path, remove: Callable[[], None]) -> None:
+        """Removes a segment with `remove`, so that a running compaction does not bring it back."""
+        with self._lock:
+            if file_path in self._pending:
+                self._pending.remove(file_path)
+            # a compaction finishing later finds the segment gone
+            remove()
+
+    def stop(self, seconds: Optional[float] = None) -> None:
+        """Drops compactions that have not started yet and waits for the running one."""
+        with self._lock:
+            self._pending.clear()
+        self.interrupt()
+        if self.is_alive():
+            self.join(seconds)
+
+    def work(self) -> None:
+        while not self._is_interrupted():
+            with self._lock:
+                if not self._pending:
+                    return
+                file_path = self._pending.popleft()
+            self._compact(file_path)
+            if self._scheduler is not None:
+                # one segment per task, the workers are shared with the other runs
+                return
+
+    def _next_pass_delay(self) -> Optional[float]:
+        with self._lock:
+            return 0.0 if self._pending else None
+
+    def _compact(self, file_path: Path) -> None:
+        tmp_path = file_path.with_name(file_path.name + ".tmp")
+        try:
+            if detect_segment_compression(file_path) is not None:
+                return
+
+            with open(file_path, "rb") as source, open(tmp_path, "wb") as target:
+                self._compression.compress(source, target)
+
+            with self._lock:
+                if not file_path.exists():
+                    tmp_path.unlink()
+                    return
+                os.replace(tmp_path, file_path)
+        except FileNotFoundError:
+            # removed after being acknowledged
+            pass
+        except Exception:
+            logger.debug("Cannot compress queue file %s", file_path.name, exc_info=True)
+
+        try:
+            tmp_path.unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,147 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "SegmentCompression",
+    "ZstdCompression",
+    "Lz4Compression",
+    "GzipCompression",
+    "get_segment_compression",
+    "detect_segment_compression",
+    "open_segment",
+]
+
+import gzip
+import shutil
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from pathlib import Path
+from typing import (
+    IO,
+    Dict,
+    Optional,
+    Type,
+    Union,
+    cast,
+)
+
+from neptune.internal.utils.requirement_check import require_installed
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+class SegmentCompression(ABC):
+    """Whole-file compression of sealed queue segments, recognized by the magic number of its format."""
+
+    name: str = ""
+    magic: bytes = b""
+
+    @abstractmethod
+    def compress(self, source: IO[bytes], target: IO[bytes]) -> None: ...
+
+    @abstractmethod
+    def open(self, file_path: Union[str, Path]) -> IO[bytes]:
+        """Opens a compressed segment as a stream of its decompressed content."""
+        ...
+
+
+class ZstdCompression(SegmentCompression):
+    name = "zstd"
+    magic = b"\x28\xb5\x2f\xfd"
+
+    def __init__(self, level: int = 3) -> None:
+        require_installed("zstandard", suggestion="zstd")
+
+        import zstandard
+
+        self._zstandard = zstandard
+        self._level = level
+
+    def compress(self, source: IO[bytes], target: IO[bytes]) -> None:
+        self._zstandard.ZstdCompressor(level=self._level).copy_stream(source, target)
+
+    def open(self, file_path: Union[str, Path]) -> IO[bytes]:
+        stream: IO[bytes] = self._zstandard.open(file_path, "rb")
+        return stream
+
+
+class Lz4Compression(SegmentCompression):
+    name = "lz4"
+    magic = b"\x04\x22\x4d\x18"
+
+    def __init__(self) -> None:
+        require_installed("lz4", suggestion="lz4")
+
+        import lz4.frame
+
+        self._lz4_frame = lz4.frame
+
+    def compress(self, source: IO[bytes], target: IO[bytes]) -> None:
+        with self._lz4_frame.LZ4FrameFile(target, "wb") as compressed:
+            shutil.copyfileobj(source, compressed, COPY_BUFFER_SIZE)
+
+    def open(self, file_path: Union[str, Path]) -> IO[bytes]:
+        stream: IO[bytes] = self._lz4_frame.open(file_path, "rb")
+        return stream
+
+
+class GzipCompression(SegmentCompression):
+    """Available without extra packages, slower than zstd and lz4."""
+
+    name = "gzip"
+    magic = b"\x1f\x8b"
+
+    def compress(self, source: IO[bytes], target: IO[bytes]) -> None:
+        with gzip.GzipFile(fileobj=target, mode="wb", compresslevel=6) as compressed:
+            shutil.copyfileobj(source, compressed, COPY_BUFFER_SIZE)
+
+    def open(self, file_path: Union[str, Path]) -> IO[bytes]:
+        return cast(IO[bytes], gzip.open(file_path, "rb"))
+
+
+_COMPRESSIONS: Dict[str, Type[SegmentCompression]] = {
+    compression.name: compression for compression in (ZstdCompression, Lz4Compression, GzipCompression)
+}
+
+_MAGIC_LENGTH = max(len(compression.magic) for compression in _COMPRESSIONS.values())
+
+
+def get_segment_compression(name: str) -> SegmentCompression:
+    if name not in _COMPRESSIONS:
+        raise ValueError(f"segment compression should be one of {list(_COMPRESSIONS)}")
+    return _COMPRESSIONS[name]()
+
+
+def detect_segment_compression(file_path: Union[str, Path]) -> Optional[Type[SegmentCompression]]:
+    try:
+        with open(file_path, "rb") as file:
+            header = file.read(_MAGIC_LENGTH)
+    except FileNotFoundError:
+        return None
+
+    for compression in _COMPRESSIONS.values():
+        if header.startswith(compression.magic):
+            return compression
+    return None
+
+
+def open_segment(file_path: Union[str, Path]) -> IO[bytes]:
+    """Opens a segment for reading, decompressing it on the fly if it has been compacted."""
+    compression = detect_segment_compression(file_path)
+    if compression is None:
+        return open(file_path, "rb")
+    return compression().open(file_path)
@@ -0,0 +1,140 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["SegmentIndex", "INDEX_INTERVAL_BYTES"]
+
+import os
+import struct
+import threading
+from bisect import bisect_right
+from pathlib import Path
+from typing import (
+    IO,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from neptune.core.components.abstract import Resource
+from neptune.internal.utils.logger import get_logger
+
+logger = get_logger()
+
+# An entry is added once this many bytes have been written to the segment since the previous one
+INDEX_INTERVAL_BYTES = 256 * 1024
+
+# version, byte offset of the record in the segment
+INDEX_ENTRY = struct.Struct("<QQ")
+
+
+class SegmentIndex(Resource):
+    """Sparse `version -> byte offset` index stored next to a `LogFile` segment.
+
+    Entries are only hints: an index that is lost or lags behind the segment just has fewer of them.
+    Entries that are out of order are treated as corruption and dropped together with everything after them.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path: Path = path
+        self._lock = threading.Lock()
+        self._versions: List[int] = []
+        self._offsets: List[int] = []
+
+        self._load()
+        self._writer: IO[bytes] = open(self._path, "ab")
+
+    @property
+    def data_path(self) -> Path:
+        return self._path.parent
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._versions
+
+    def _load(self) -> None:
+        try:
+            content = self._path.read_bytes()
+        except FileNotFoundError:
+            return
+
+        valid_size = 0
+        for version, offset in INDEX_ENTRY.iter_unpack(content[: len(content) - len(content) % INDEX_ENTRY.size]):
+            if self._versions and (version <= self._versions[-1] or offset <= self._offsets[-1]):
+                break
+            self._versions.append(version)
+            self._offsets.append(offset)
+            valid_size += INDEX_ENTRY.size
+
+        if valid_size != len(content):
+            logger.debug("Dropping corrupted tail of %s", self._path.name)
+            with open(self._path, "r+b") as file:
+                file.truncate(valid_size)
+
+    def add(self, version: int, offset: int) -> None:
+        with self._lock:
+            if self._versions and (version <= self._versions[-1] or offset <= self._offsets[-1]):
+                return
+            self._versions.append(version)
+            self._offsets.append(offset)
+            self._writer.write(INDEX_ENTRY.pack(version, offset))
+
+    def lookup(self, version: int) -> Optional[Tuple[int, int]]:
+        """Returns the entry with the greatest version not exceeding `version`."""
+        with self._lock:
+            position = bisect_right(self._versions, version)
+            if position == 0:
+                return None
+            return self._versions[position - 1], self._offsets[position - 1]
+
+    def rebuild(self, entries: Iterable[Tuple[int, int]]) -> None:
+        entries = list(entries)
+        tmp_path = self._path.with_name(self._path.name + ".tmp")
+        with self._lock:
+            with open(tmp_path, "wb") as file:
+                file.write(b"".join(INDEX_ENTRY.pack(version, offset) for version, offset in entries))
+            self._writer.close()
+            os.replace(tmp_path, self._path)
+            self._writer = open(self._path, "ab")
+            self._versions = [version for version, _ in entries]
+            self._offsets = [offset for _, offset in entries]
+
+    def rename(self, path: Path) -> None:
+        with self._lock:
+            os.replace(self._path, path)
+            self._path = path
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._writer.closed:
+                self._writer.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._writer.closed:
+                self._writer.close()
+
+    def cleanup(self) -> None:
+        self.close()
+        try:
+            self._path.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logger.exception("Cannot remove queue index file %s", self._path.name)
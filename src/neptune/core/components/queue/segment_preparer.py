@@ -0,0 +1,109 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["SegmentPreparer"]
+
+import threading
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
+
+from neptune.core.components.queue.log_file import LogFile
+from neptune.core.components.queue.record_codec import RecordCodec
+from neptune.internal.daemon import Daemon
+from neptune.internal.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from neptune.core.operation_processors.async_operation_processor.sync_scheduler import SyncScheduler
+
+logger = get_logger()
+
+
+class SegmentPreparer(Daemon):
+    """Creates the next queue segment ahead of time, so that rotation does not create files on the producer thread.
+
+    The segment is prepared under a temporary name, which does not match the segment pattern and is ignored when
+    the queue is reopened; `DiskQueue` renames it once it knows the version the segment starts with.
+    """
+
+    def __init__(
+        self,
+        data_path: Path,
+        extension: str,
+        codec: RecordCodec,
+        sleep_time: float = 5.0,
+        scheduler: Optional["SyncScheduler"] = None,
+    ) -> None:
+        super().__init__(sleep_time=sleep_time, name="NeptuneSegmentPreparer", scheduler=scheduler)
+        self._data_path: Path = data_path
+        self._extension: str = extension
+        self._codec: RecordCodec = codec
+        self._lock = threading.Lock()
+        self._prepared: Optional[LogFile] = None
+
+        self._remove_stale_files()
+
+    @property
+    def _file_name(self) -> str:
+        return f"prepared.{self._extension}"
+
+    def request(self) -> None:
+        """Starts preparing the next segment in the background if there is none yet."""
+        if not self.is_alive() and not self._is_interrupted():
+            self.start()
+        self.wake_up()
+
+    def take(self) -> Optional[LogFile]:
+        """Returns the prepared segment if it is ready. It has to be renamed before another one is requested."""
+        with self._lock:
+            log_file, self._prepared = self._prepared, None
+        return log_file
+
+    def work(self) -> None:
+        with self._lock:
+            if self._prepared is not None:
+                return
+        try:
+            log_file = LogFile(
+                self._data_path, 0, extension=self._extension, codec=self._codec, file_name=self._file_name
+            )
+        except Exception:
+            logger.debug("Cannot prepare the next queue file", exc_info=True)
+            return
+        with self._lock:
+            self._prepared = log_file
+
+    def _next_pass_delay(self) -> Optional[float]:
+        # a segment is only prepared on request
+        return None
+
+    def stop(self, seconds: Optional[float] = None) -> None:
+        """Waits for a running preparation and removes the unused segment."""
+        self.interrupt()
+        if self.is_alive():
+            self.join(seconds)
+        with self._lock:
+            if self._prepared is not None:
+                self._prepared.cleanup()
+                self._prepared = None
+
+    def _remove_stale_files(self) -> None:
+        for path in (self._data_path / self._file_name, self._data_path / f"{self._file_name}.idx"):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,266 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "SegmentReader",
+    "JsonSegmentReader",
+    "BinarySegmentReader",
+    "BINARY_FILE_MAGIC",
+    "FRAME_HEADER",
+]
+
+import mmap
+import os
+import struct
+import zlib
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from json import (
+    JSONDecodeError,
+    JSONDecoder,
+)
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    IO,
+    Callable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from neptune.core.components.queue.segment_compression import detect_segment_compression
+from neptune.exceptions import MalformedOperation
+from neptune.internal.utils.logger import get_logger
+
+logger = get_logger()
+
+BINARY_FILE_MAGIC = b"\x00NPTQ\x01"
+
+# payload length, type tag, crc32 of the payload
+FRAME_HEADER = struct.Struct("<IBI")
+
+# Compacted segments are decompressed in chunks of at least this size
+DECOMPRESSION_CHUNK_SIZE = 1024 * 1024
+
+
+class SegmentReader(ABC):
+    """Reads records of a queue segment through a read-only memory map.
+
+    Record boundaries are found in the mapping itself; only the bytes of the record being decoded are copied.
+    The segment may still be appended to, the mapping is extended once the reader catches up with its end.
+    Compacted segments are sealed, they are decompressed as a stream instead: only a window of the content,
+    starting at the record being read, is kept in memory. `_base` is the offset of that window in the segment.
+    """
+
+    def __init__(self, file_path: Union[str, Path], offset: int = 0):
+        self._file: IO[bytes] = open(file_path, "rb")
+        self._map: Optional[Union[mmap.mmap, bytes]] = None
+        self._base: int = 0
+        self._pos: int = offset
+
+        compression = detect_segment_compression(file_path)
+        self._stream: Optional[IO[bytes]] = None
+        if compression is not None:
+            self._stream = compression().open(file_path)
+            self._map = self._stream.read(DECOMPRESSION_CHUNK_SIZE)
+
+    @property
+    def position(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._map = None
+        if self._stream is not None:
+            self._stream.close()
+        if not self._file.closed:
+            self._file.close()
+
+    def get(self) -> Optional[dict]:
+        return self.get_with_size()[0]
+
+    def get_with_size(self) -> Tuple[Optional[dict], int]:
+        return self._next_record() or (None, 0)
+
+    @abstractmethod
+    def _next_record(self) -> Optional[Tuple[dict, int]]: ...
+
+    @property
+    def _mapped_size(self) -> int:
+        """Offset in the segment right past the content available in `_map`."""
+        return self._base + len(self._map) if self._map is not None else 0
+
+    def _ensure_mapped(self, end: int) -> bool:
+        """Makes sure the mapping covers the segment up to `end`, remapping it if the file has grown."""
+        if end <= self._mapped_size:
+            return True
+        if self._stream is not None:
+            return self._decompress(end)
+
+        file_size = os.fstat(self._file.fileno()).st_size
+        if file_size <= self._mapped_size:
+            return False
+
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), file_size, access=mmap.ACCESS_READ)
+        if hasattr(self._map, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            self._map.madvise(mmap.MADV_SEQUENTIAL)
+
+        return end <= file_size
+
+    def _decompress(self, end: int) -> bool:
+        assert self._stream is not None and isinstance(self._map, bytes)
+        # Content before the current position has been decoded already
+        start = min(self._pos, self._mapped_size)
+        chunks = [self._map[start - self._base :]]
+        self._base = start
+        while self._base < self._pos:
+            skipped = len(self._stream.read(min(self._pos - self._base, DECOMPRESSION_CHUNK_SIZE)))
+            if not skipped:
+                break
+            self._base += skipped
+
+        size = len(chunks[0])
+        while self._base + size < end:
+            chunk = self._stream.read(max(DECOMPRESSION_CHUNK_SIZE, end - self._base - size))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+
+        self._map = b"".join(chunks)
+        return end <= self._mapped_size
+
+    def __enter__(self) -> "SegmentReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[Optional[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class JsonSegmentReader(SegmentReader):
+    """Reads JSON records written one per line."""
+
+    def __init__(self, file_path: Union[str, Path], offset: int = 0):
+        super().__init__(file_path, offset)
+        self._decoder: JSONDecoder = JSONDecoder(strict=False)
+
+    def _next_record(self) -> Optional[Tuple[dict, int]]:
+        while True:
+            end = self._find_line_end()
+            if end is None:
+                return None
+
+            assert self._map is not None
+            start = self._pos
+            self._pos = end + 1
+            record = self._map[start - self._base : end - self._base]
+            try:
+                # Fast path for lines written by `JsonRecordCodec`
+                data, size = self._decoder.raw_decode(record.decode("utf-8"))
+                return data, size
+            except (JSONDecodeError, UnicodeDecodeError):
+                pass
+
+            line = record.strip()
+            if not line:
+                continue
+            try:
+                return self._decoder.decode(line.decode("utf-8")), len(line)
+            except (JSONDecodeError, UnicodeDecodeError):
+                # A line torn by a crash, records appended after it are still readable
+                logger.warning("Skipping malformed queue record at offset %d", start)
+
+    def _find_line_end(self) -> Optional[int]:
+        start = self._pos
+        while True:
+            if self._map is not None:
+                end = self._map.find(b"\n", start - self._base)
+                if end >= 0:
+                    return self._base + end
+                start = max(start, self._mapped_size)
+            if not self._ensure_mapped(self._mapped_size + 1):
+                return None
+
+
+class BinarySegmentReader(SegmentReader):
+    """Reads length-prefixed frames: `<payload length><type tag><crc32>` followed by the payload."""
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        decode: Callable[[int, bytes], dict],
+        offset: Optional[int] = None,
+    ):
+        super().__init__(file_path, len(BINARY_FILE_MAGIC) if offset is None else offset)
+        self._decode = decode
+
+        if not self._ensure_mapped(len(BINARY_FILE_MAGIC)) or self._header() != BINARY_FILE_MAGIC:
+            self.close()
+            raise MalformedOperation(f"{file_path} is not a binary queue segment")
+
+    def _header(self) -> bytes:
+        assert self._map is not None and self._base == 0
+        return self._map[: len(BINARY_FILE_MAGIC)]
+
+    def _next_record(self) -> Optional[Tuple[dict, int]]:
+        frame = self._read_frame()
+        if frame is None:
+            return None
+        type_tag, payload = frame
+        return self._decode(type_tag, payload), FRAME_HEADER.size + len(payload)
+
+    def iter_frames(self) -> Iterator[Tuple[int, bytes]]:
+        """Yields raw frames up to the end of the segment or to the first incomplete or corrupted one."""
+        while True:
+            try:
+                frame = self._read_frame()
+            except MalformedOperation:
+                return
+            if frame is None:
+                return
+            yield frame
+
+    def _read_frame(self) -> Optional[Tuple[int, bytes]]:
+        pos = self._pos
+        payload_start = pos + FRAME_HEADER.size
+        if payload_start > self._mapped_size and not self._ensure_mapped(payload_start):
+            return None
+
+        assert self._map is not None
+        length, type_tag, checksum = FRAME_HEADER.unpack_from(self._map, pos - self._base)
+        payload_end = payload_start + length
+        if payload_end > self._mapped_size and not self._ensure_mapped(payload_end):
+            # The writer has not finished this frame yet, retry on the next call.
+            return None
+
+        payload = self._map[payload_start - self._base : payload_end - self._base]
+        if zlib.crc32(payload) != checksum:
+            raise MalformedOperation("Checksum mismatch in queue record")
+
+        self._pos = payload_end
+        return type_tag, payload
@@ -17,29 +17,55 @@ __all__ = ["SyncOffsetFile"]
 
 import os
 from pathlib import Path
-from typing import IO
+from time import monotonic
+from typing import (
+    IO,
+    Optional,
+)
 
 from neptune.core.components.abstract import Resource
 
 
 class SyncOffsetFile(Resource):
-    def __init__(self, path: Path, default: int = 0):
+    """Offset persisted in a file.
+
+    With `commit_every` > 1 or `commit_interval` set, writes are group-committed: the offset is kept in memory and
+    persisted once per `commit_every` writes, once `commit_interval` seconds have passed since the last commit,
+    and always on `flush()` and `close()`.
+    """
+
+    def __init__(self, path: Path, default: int = 0, commit_every: int = 1, commit_interval: Optional[float] = None):
         self._path = path
         mode = "r+" if path.exists() else "w+"
         self._file: IO = open(self._path, mode)
         self._default: int = default
+        self._commit_every: int = max(commit_every, 1)
+        self._commit_interval: Optional[float] = commit_interval
         self._last: int = self.read()
+        self._pending_writes: int = 0
+        self._last_commit: float = monotonic()
 
     @property
     def data_path(self) -> Path:
         return self._path.parent
 
     def write(self, offset: int) -> None:
+        self._last = offset
+        self._pending_writes += 1
+        if self._pending_writes >= self._commit_every or (
+            self._commit_interval is not None and monotonic() - self._last_commit >= self._commit_interval
+        ):
+            self._commit()
+
+    def _commit(self) -> None:
+        if self._file.closed:
+            return
         self._file.seek(0)
-        self._file.write(str(offset))
+        self._file.write(str(self._last))
         self._file.truncate()
         self._file.flush()
-        self._last = offset
+        self._pending_writes = 0
+        self._last_commit = monotonic()
 
     def read(self) -> int:
         self._file.seek(0)
@@ -52,9 +78,13 @@ class SyncOffsetFile(Resource):
         return self._last
 
     def flush(self) -> None:
-        self._file.flush()
+        if self._pending_writes:
+            self._commit()
+        elif not self._file.closed:
+            self._file.flush()
 
     def close(self) -> None:
+        self.flush()
         self._file.close()
 
     def cleanup(self) -> None:
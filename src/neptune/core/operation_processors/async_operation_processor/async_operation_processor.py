@@ -16,14 +16,20 @@
 
 __all__ = ("AsyncOperationProcessor",)
 
+import os
 import threading
 from pathlib import Path
 from queue import Queue
-from time import time
+from time import (
+    monotonic,
+    time,
+)
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    List,
     Optional,
     Tuple,
 )
@@ -32,13 +38,35 @@ from neptune.core.components.abstract import (
     Resource,
     WithResources,
 )
+from neptune.core.components.queue.ring_buffer import RingBuffer
+from neptune.core.operation_processors.async_operation_processor.background_drain import (
+    DrainMode,
+    start_background_drain,
+)
+from neptune.core.operation_processors.async_operation_processor.batch_sender import BatchSender
+from neptune.core.operation_processors.async_operation_processor.batch_size_controller import BatchSizeController
+from neptune.core.operation_processors.async_operation_processor.buffer_writer_thread import (
+    BufferFullPolicy,
+    BufferWriterThread,
+)
 from neptune.core.operation_processors.async_operation_processor.constants import (
+    ADAPTIVE_BATCH_MAX_SIZE_MULTIPLIER,
+    ADAPTIVE_BATCH_MIN_SIZE,
+    BUFFER_FULL_WAIT_SECONDS,
+    BUFFER_WRITER_SLEEP_TIME_SECONDS,
+    DISK_USAGE_REFRESH_SECONDS,
     STOP_QUEUE_MAX_TIME_NO_CONNECTION_SECONDS,
 )
 from neptune.core.operation_processors.async_operation_processor.consumer_thread import ConsumerThread
 from neptune.core.operation_processors.async_operation_processor.operation_logger import ProcessorStopSignal
 from neptune.core.operation_processors.async_operation_processor.processing_resources import ProcessingResources
 from neptune.core.operation_processors.async_operation_processor.queue_observer import QueueObserver
+from neptune.core.operation_processors.async_operation_processor.queue_quota import (
+    QueueQuotaMetrics,
+    QuotaPolicy,
+)
+from neptune.core.operation_processors.async_operation_processor.sync_scheduler import SyncScheduler
+from neptune.core.operation_processors.async_operation_processor.sync_stats import SyncStats
 from neptune.core.operation_processors.operation_processor import OperationProcessor
 from neptune.core.operations.operation import Operation
 from neptune.core.operations.utils import try_get_step
@@ -52,6 +80,9 @@ from neptune.internal.warnings import (
     warn_once,
 )
 
+if TYPE_CHECKING:
+    from neptune.internal.backends.hosted_neptune_backend_v2 import HostedNeptuneBackendV2
+
 
 class AsyncOperationProcessor(WithResources, OperationProcessor):
     def __init__(
@@ -65,8 +96,25 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
         serializer: Callable[[Operation], Dict[str, Any]] = lambda op: op.to_dict(),
         should_print_logs: bool = True,
         sleep_time: float = 5.0,
+        buffer_size: int = 0,
+        buffer_full_policy: BufferFullPolicy = BufferFullPolicy.BLOCK,
+        max_queue_bytes: Optional[int] = None,
+        quota_policy: QuotaPolicy = QuotaPolicy.BLOCK,
+        backend: Optional["HostedNeptuneBackendV2"] = None,
+        project: Optional[str] = None,
+        max_in_flight_batches: int = 1,
+        adaptive_batch_size: bool = False,
+        max_delay: Optional[float] = None,
+        max_steps_per_batch: int = 1,
+        sync_scheduler: Optional[SyncScheduler] = None,
     ) -> None:
         self._should_print_logs = should_print_logs
+        self._custom_id: CustomId = custom_id
+        self._container_type: ContainerType = container_type
+        self._backend: Optional["HostedNeptuneBackendV2"] = backend
+        self._project: Optional[str] = project
+        # Longest time, in seconds, an operation may wait on disk for the consumer to wake up
+        self._max_delay: Optional[float] = max_delay
         self._accepts_operations: bool = True
         self._last_version: int = 0
 
@@ -78,11 +126,34 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
             signal_queue=signal_queue,
             data_path=data_path,
             serializer=serializer,
+            max_queue_bytes=max_queue_bytes,
+            quota_policy=quota_policy,
+            max_steps_per_batch=max_steps_per_batch,
+            sync_scheduler=sync_scheduler,
         )
 
+        # Without a backend operations are only kept on disk, to be uploaded later with `neptune sync`
+        batch_sender: Optional[BatchSender] = None
+        if backend is not None and project is not None:
+            batch_sender = BatchSender(backend=backend, project=project, run_id=custom_id)
+
+        # `batch_size` is only the starting point, the batch size follows the observed latency
+        batch_size_controller: Optional[BatchSizeController] = None
+        if batch_sender is not None and adaptive_batch_size:
+            batch_size_controller = BatchSizeController(
+                initial_size=batch_size,
+                min_size=ADAPTIVE_BATCH_MIN_SIZE,
+                max_size=batch_size * ADAPTIVE_BATCH_MAX_SIZE_MULTIPLIER,
+                max_size_bytes=self._processing_resources.disk_queue.max_batch_size_bytes,
+            )
+
         self._consumer = ConsumerThread(
             sleep_time=sleep_time,
             processing_resources=self._processing_resources,
+            batch_sender=batch_sender,
+            max_in_flight=max_in_flight_batches,
+            batch_size_controller=batch_size_controller,
+            sync_scheduler=sync_scheduler,
         )
 
         self._queue_observer = QueueObserver(
@@ -92,6 +163,26 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
             stop_queue_max_time_no_connection_seconds=STOP_QUEUE_MAX_TIME_NO_CONNECTION_SECONDS,
         )
 
+        # (time of the walk, size of the files) of the queue directory
+        self._disk_usage: Optional[Tuple[float, int]] = None
+
+        # With a buffer, operations are only appended to memory on the caller's thread
+        # and a writer thread moves them to the disk queue
+        self._buffer_full_policy: BufferFullPolicy = buffer_full_policy
+        self._buffer: Optional[RingBuffer[Operation]] = None
+        self._buffer_writer: Optional[BufferWriterThread] = None
+        if buffer_size > 0:
+            self._buffer = RingBuffer[Operation](capacity=buffer_size)
+            self._buffer_writer = BufferWriterThread(
+                buffer=self._buffer,
+                disk_queue=self._processing_resources.disk_queue,
+                on_written=self._on_operations_written,
+                sleep_time=BUFFER_WRITER_SLEEP_TIME_SECONDS,
+                batch_size=max(batch_size, 1),
+                queue_quota=self._processing_resources.queue_quota,
+                scheduler=sync_scheduler,
+            )
+
     @property
     def resources(self) -> Tuple[Resource, ...]:
         return self._processing_resources.resources
@@ -104,22 +195,108 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
     def processing_resources(self) -> "ProcessingResources":
         return self._processing_resources
 
+    @property
+    def queue_quota_metrics(self) -> Optional[QueueQuotaMetrics]:
+        quota = self._processing_resources.queue_quota
+        return quota.metrics() if quota is not None else None
+
+    def sync_stats(self) -> SyncStats:
+        """Returns the current state of synchronization, cheap enough to be called periodically."""
+        disk_queue = self._processing_resources.disk_queue
+        stats = self._processing_resources.sync_stats
+        queue_size = disk_queue.size() + (len(self._buffer) if self._buffer is not None else 0)
+        return SyncStats(
+            queue_size=queue_size,
+            queue_size_bytes=disk_queue.pending_bytes(),
+            disk_usage_bytes=self._disk_usage_bytes(),
+            enqueue_rate=stats.enqueue_rate(),
+            send_rate=stats.send_rate(),
+            batch_latency_p50=stats.batch_latency(50),
+            batch_latency_p99=stats.batch_latency(99),
+            oldest_unacked_age=stats.oldest_unacked_age() if queue_size > 0 else None,
+        )
+
+    def _disk_usage_bytes(self) -> int:
+        # Walking the directory is not cheap, a value a few seconds old is good enough
+        now = monotonic()
+        if self._disk_usage is None or now - self._disk_usage[0] >= DISK_USAGE_REFRESH_SECONDS:
+            self._disk_usage = now, _directory_size(self.data_path)
+        return self._disk_usage[1]
+
     @ensure_disk_not_overutilize
     def enqueue_operation(self, op: Operation, *, wait: bool) -> None:
         if not self._accepts_operations:
             warn_once("Not accepting operations", exception=NeptuneWarning)
             return
 
-        step = try_get_step(op)
-        self._last_version = self.processing_resources.disk_queue.put(op, category=step)
+        if self._buffer is not None:
+            self._enqueue_to_buffer(op)
+        elif self._processing_resources.queue_quota is not None:
+            self._write_operations([op])
+        else:
+            step = try_get_step(op)
+            self._on_operations_written(self.processing_resources.disk_queue.put(op, category=step))
+
+        if wait:
+            self.wait()
+
+    @ensure_disk_not_overutilize
+    def enqueue_operations(self, ops: List[Operation], *, wait: bool) -> None:
+        if not self._accepts_operations:
+            warn_once("Not accepting operations", exception=NeptuneWarning)
+            return
+
+        if self._buffer is not None:
+            for op in ops:
+                self._enqueue_to_buffer(op)
+        elif ops:
+            self._write_operations(ops)
 
-        if _queue_has_enough_space(self.processing_resources.disk_queue.size(), self._processing_resources.batch_size):
-            self._consumer.wake_up()
         if wait:
             self.wait()
 
+    def _enqueue_to_buffer(self, op: Operation) -> None:
+        assert self._buffer is not None and self._buffer_writer is not None
+
+        if self._buffer.put(op):
+            if len(self._buffer) >= self._buffer_writer.batch_size:
+                self._buffer_writer.wake_up()
+            return
+
+        if self._buffer_full_policy == BufferFullPolicy.DROP:
+            warn_once(
+                "The operation buffer is full, operations are being dropped."
+                " Consider increasing NEPTUNE_ASYNC_BUFFER_SIZE or logging less frequently.",
+                exception=NeptuneWarning,
+            )
+        elif self._buffer_full_policy == BufferFullPolicy.SPILL or not self._buffer_writer.is_alive():
+            self._buffer_writer.spill(op)
+        else:
+            self._buffer_writer.wake_up()
+            while not self._buffer.put_blocking(op, timeout=BUFFER_FULL_WAIT_SECONDS):
+                if not self._buffer_writer.is_alive():
+                    self._buffer_writer.spill(op)
+                    return
+
+    def _write_operations(self, ops: List[Operation]) -> None:
+        if self._processing_resources.queue_quota is not None:
+            ops = self._processing_resources.queue_quota.admit(ops)
+        self._on_operations_written(
+            self.processing_resources.disk_queue.put_batch((op, try_get_step(op)) for op in ops)
+        )
+
+    def _on_operations_written(self, version: int) -> None:
+        self._last_version = version
+        self._processing_resources.sync_stats.on_written(version)
+        if _queue_has_enough_space(self.processing_resources.disk_queue.size(), self._processing_resources.batch_size):
+            self._consumer.wake_up()
+        elif self._max_delay is not None:
+            self._consumer.schedule_wake_up(self._max_delay)
+
     def start(self) -> None:
         self._consumer.start()
+        if self._buffer_writer is not None:
+            self._buffer_writer.start()
 
     def pause(self) -> None:
         self._consumer.pause()
@@ -146,8 +323,20 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
         self,
         seconds: Optional[float] = None,
         processor_stop_signal_queue: Optional["Queue[ProcessorStopSignal]"] = None,
+        drain: DrainMode = DrainMode.WAIT,
     ) -> None:
+        if drain == DrainMode.BACKGROUND:
+            if self._backend is not None and self._project is not None:
+                self._stop_with_background_drain(self._backend, self._project)
+                return
+            warn_once(
+                "Metadata can be synchronized in the background only with a connection to a Neptune project,"
+                " waiting for it to be synchronized instead.",
+                exception=NeptuneWarning,
+            )
+
         ts = time()
+        self._release_queue_quota()
         self.flush()
         if self._consumer.is_running():
             self._consumer.disable_sleep()
@@ -167,13 +356,61 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
         if self._queue_observer.is_queue_empty():
             self.cleanup()
 
+    def _stop_with_background_drain(self, backend: "HostedNeptuneBackendV2", project: str) -> None:
+        self._release_queue_quota()
+        self.flush()
+        # Batches being sent are finished, the rest is sealed on disk and left to the drain process
+        self._consumer.interrupt()
+        self._consumer.join()
+        self.close()
+
+        if self._queue_observer.is_queue_empty():
+            self.cleanup()
+            return
+
+        start_background_drain(
+            data_path=self.data_path,
+            project=project,
+            run_id=self._custom_id,
+            container_type=self._container_type,
+            api_token=backend.credentials.api_key,
+        )
+
     def cleanup(self) -> None:
         self._processing_resources.cleanup()
 
+    def flush(self) -> None:
+        if self._buffer_writer is not None:
+            self._buffer_writer.drain()
+        super().flush()
+
     def close(self) -> None:
         self._accepts_operations = False
+        self._release_queue_quota()
+        if self._buffer_writer is not None:
+            self._buffer_writer.interrupt()
+            if self._buffer_writer.is_alive():
+                self._buffer_writer.join()
+            self._buffer_writer.drain()
         super().close()
 
+    def _release_queue_quota(self) -> None:
+        # Everything still buffered has to reach the disk queue, even above the quota
+        if self._processing_resources.queue_quota is not None:
+            self._processing_resources.queue_quota.release()
+
+
+def _directory_size(path: Path) -> int:
+    size = 0
+    for root, _, files in os.walk(path):
+        for file in files:
+            try:
+                size += os.stat(os.path.join(root, file)).st_size
+            except OSError:
+                # removed in the meantime
+                pass
+    return size
+
 
 def _queue_has_enough_space(queue_size: int, batch_size: int) -> bool:
     return queue_size > batch_size / 2
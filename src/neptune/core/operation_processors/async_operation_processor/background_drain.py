@@ -0,0 +1,157 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["DrainMode", "drain", "start_background_drain"]
+
+import os
+import subprocess
+import sys
+import threading
+from enum import Enum
+from pathlib import Path
+from queue import Queue
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+)
+
+from neptune.core.operation_processors.async_operation_processor.batch_sender import BatchSender
+from neptune.core.operation_processors.async_operation_processor.constants import (
+    BACKGROUND_DRAIN_SLEEP_TIME_SECONDS,
+    BACKGROUND_DRAIN_TIMEOUT_SECONDS,
+)
+from neptune.core.operation_processors.async_operation_processor.consumer_thread import ConsumerThread
+from neptune.core.operation_processors.async_operation_processor.processing_resources import ProcessingResources
+from neptune.core.typing.container_type import ContainerType
+from neptune.core.typing.id_formats import CustomId
+from neptune.envs import (
+    API_TOKEN_ENV_NAME,
+    NEPTUNE_ASYNC_BACKGROUND_DRAIN_TIMEOUT,
+    NEPTUNE_ASYNC_BATCH_SIZE,
+    NEPTUNE_ASYNC_MAX_IN_FLIGHT_BATCHES,
+)
+from neptune.internal.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from neptune.internal.backends.hosted_neptune_backend_v2 import HostedNeptuneBackendV2
+
+logger = get_logger()
+
+# Seconds between checks whether the queue has been synchronized
+DRAIN_CHECK_INTERVAL_SECONDS = 1.0
+# Output of the drain process, kept next to the queue when not everything could be synchronized
+DRAIN_LOG_FILE_NAME = "drain.log"
+
+
+class DrainMode(str, Enum):
+    """What `stop` does with operations that have not been synchronized yet."""
+
+    WAIT = "wait"  # wait for them, at most for the given number of seconds
+    BACKGROUND = "background"  # leave them to a detached process and return right away
+
+
+def start_background_drain(
+    data_path: Path, project: str, run_id: str, container_type: ContainerType, api_token: str
+) -> "subprocess.Popen[bytes]":
+    """Starts a process that outlives the current one, synchronizes the closed disk queue and removes it."""
+    env = {**os.environ, API_TOKEN_ENV_NAME: api_token}
+    kwargs: Dict[str, Any] = {}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+
+    with open(data_path / DRAIN_LOG_FILE_NAME, "ab") as log_file:
+        return subprocess.Popen(
+            [sys.executable, "-m", __name__, str(data_path.resolve()), project, run_id, container_type.value],
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            close_fds=True,
+            env=env,
+            **kwargs,
+        )
+
+
+def drain(
+    data_path: Path,
+    project: str,
+    run_id: str,
+    container_type: ContainerType,
+    backend: "HostedNeptuneBackendV2",
+    timeout: float = BACKGROUND_DRAIN_TIMEOUT_SECONDS,
+) -> bool:
+    """Synchronizes what is left in the disk queue of a stopped run, removing the queue once it is empty.
+
+    Gives up after `timeout` seconds, e.g. when the connection doesn't come back, leaving the queue on disk.
+    Returns whether everything has been synchronized.
+    """
+    resources = ProcessingResources(
+        custom_id=CustomId(run_id),
+        container_type=container_type,
+        lock=threading.RLock(),
+        signal_queue=Queue(),
+        batch_size=int(os.environ.get(NEPTUNE_ASYNC_BATCH_SIZE) or "1000"),
+        data_path=data_path,
+    )
+    consumer = ConsumerThread(
+        sleep_time=BACKGROUND_DRAIN_SLEEP_TIME_SECONDS,
+        processing_resources=resources,
+        batch_sender=BatchSender(backend=backend, project=project, run_id=run_id),
+        max_in_flight=int(os.environ.get(NEPTUNE_ASYNC_MAX_IN_FLIGHT_BATCHES) or "4"),
+    )
+
+    deadline = monotonic() + timeout
+    consumer.start()
+    # the consumer keeps retrying on connection loss, it only stops on unexpected errors
+    while not resources.disk_queue.wait_for_empty(seconds=DRAIN_CHECK_INTERVAL_SECONDS) and consumer.is_running():
+        if monotonic() >= deadline:
+            logger.warning("Synchronization of %s did not finish within %s seconds", run_id, timeout)
+            break
+    consumer.interrupt()
+    consumer.join()
+
+    is_synchronized = resources.disk_queue.is_empty()
+    resources.close()
+    if is_synchronized:
+        try:
+            (data_path / DRAIN_LOG_FILE_NAME).unlink()
+        except OSError:
+            # missing, or still open on Windows, the directory is kept then
+            pass
+        resources.cleanup()
+    return is_synchronized
+
+
+def main(argv: List[str]) -> None:
+    from neptune_api.credentials import Credentials as ApiCredentials
+
+    from neptune.internal.backends.hosted_neptune_backend_v2 import HostedNeptuneBackendV2
+
+    data_path, project, run_id, container_type = argv
+    backend = HostedNeptuneBackendV2(credentials=ApiCredentials.from_api_key(os.environ[API_TOKEN_ENV_NAME]))
+    timeout = float(os.environ.get(NEPTUNE_ASYNC_BACKGROUND_DRAIN_TIMEOUT) or BACKGROUND_DRAIN_TIMEOUT_SECONDS)
+    if not drain(Path(data_path), project, run_id, ContainerType(container_type), backend, timeout=timeout):
+        logger.warning(
+            "Not all metadata of %s could be synchronized, you can upload it later using the `neptune sync` command.",
+            run_id,
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
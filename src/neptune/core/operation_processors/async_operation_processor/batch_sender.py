@@ -0,0 +1,145 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+__all__ = ["BatchSender"]
+
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import neptune_api.proto.neptune_pb.ingest.v1.pub.ingest_pb2 as ingest_pb2
+
+from neptune.api.operation_to_api import OperationToApiVisitor
+from neptune.api.operations import RunOperation
+from neptune.core.operations.operation import Operation
+from neptune.internal.exceptions import (
+    ClientHttpError,
+    NeptuneConnectionLostException,
+)
+from neptune.internal.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from neptune.internal.backends.hosted_neptune_backend_v2 import HostedNeptuneBackendV2
+
+logger = get_logger()
+
+# Sending the operations again later may succeed, e.g. with another API token, so they must not be dropped
+NOT_REJECTED_HTTP_STATUSES = frozenset({"401", "403", "404", "413"})
+
+
+class BatchSender:
+    """Submits a batch of operations to the ingest API in as few requests as possible.
+
+    Consecutive snapshot updates sharing the step and timestamp are merged into a single `RunOperation`,
+    so a batch aggregated by step is usually sent with one request. An operation may need several messages,
+    e.g. one per value of a series; when sending is interrupted in the middle of one, the messages already
+    confirmed are skipped when the same operation is sent again.
+    """
+
+    def __init__(self, backend: "HostedNeptuneBackendV2", project: str, run_id: str) -> None:
+        self._backend = backend
+        self._project: str = project
+        self._run_id: str = run_id
+        self._visitor = OperationToApiVisitor()
+        # by the id of a partially sent operation, the operation and how many of its messages were confirmed
+        self._confirmed_messages: Dict[int, Tuple[Operation, int]] = {}
+        self._confirmed_messages_lock = threading.Lock()
+
+    def send(self, batch: List[Operation]) -> int:
+        """Returns how many leading operations of the batch have been confirmed by the server.
+
+        Operations rejected by the server as invalid are logged and count as processed, retrying them would
+        not help. Errors such as an invalid API token or a missing run are raised, so the operations stay on disk.
+        Operations not turned into any message, e.g. logging no values, count as processed right away.
+        """
+        skipped_messages = self._take_confirmed_messages(batch[0]) if batch else 0
+        packed = self._pack(batch, skipped_messages)
+        if not packed:
+            return len(batch)
+
+        processed_count, confirmed_messages = 0, skipped_messages
+        for run_operation, completed_count, next_confirmed_messages in packed:
+            try:
+                self._backend.submit_operation(run_operation)
+            except NeptuneConnectionLostException:
+                self._keep_confirmed_messages(batch, processed_count, confirmed_messages)
+                if processed_count == 0:
+                    raise
+                return processed_count
+            except ClientHttpError as e:
+                if str(e.status) in NOT_REJECTED_HTTP_STATUSES:
+                    self._keep_confirmed_messages(batch, processed_count, confirmed_messages)
+                    if processed_count == 0:
+                        raise
+                    return processed_count
+                logger.error("Neptune server rejected operations (status %s): %s", e.status, e.response)
+            processed_count, confirmed_messages = completed_count, next_confirmed_messages
+        return processed_count
+
+    def pack(self, batch: List[Operation]) -> List[Tuple[ingest_pb2.RunOperation, int]]:
+        """Returns the messages to send, each with the number of operations complete once it is confirmed."""
+        return [(run_operation, completed_count) for run_operation, completed_count, _ in self._pack(batch)]
+
+    def _pack(
+        self, batch: List[Operation], skipped_messages: int = 0
+    ) -> List[Tuple[ingest_pb2.RunOperation, int, int]]:
+        # Each message comes with the number of complete operations and of messages of the next operation
+        # it brings to the server, the first `skipped_messages` messages of the first operation are left out
+        packed: List[Tuple[ingest_pb2.RunOperation, int, int]] = []
+        current: Optional[ingest_pb2.RunOperation] = None
+        for completed_count, op in enumerate(batch):
+            first_message = skipped_messages if completed_count == 0 else 0
+            protos = RunOperation(self._project, self._run_id, op.accept(self._visitor)).to_protos()
+            for message_count, proto in enumerate(protos[first_message:], first_message):
+                if current is not None and _can_merge(current, proto):
+                    current.update.MergeFrom(proto.update)
+                    continue
+                if current is not None:
+                    packed.append((current, completed_count, message_count))
+                current = proto
+
+        if current is not None:
+            packed.append((current, len(batch), 0))
+        return packed
+
+    def _take_confirmed_messages(self, op: Operation) -> int:
+        with self._confirmed_messages_lock:
+            confirmed = self._confirmed_messages.pop(id(op), None)
+        return confirmed[1] if confirmed is not None and confirmed[0] is op else 0
+
+    def _keep_confirmed_messages(self, batch: List[Operation], processed_count: int, confirmed_messages: int) -> None:
+        if confirmed_messages > 0 and processed_count < len(batch):
+            op = batch[processed_count]
+            with self._confirmed_messages_lock:
+                self._confirmed_messages[id(op)] = op, confirmed_messages
+
+
+def _can_merge(target: ingest_pb2.RunOperation, source: ingest_pb2.RunOperation) -> bool:
+    if target.WhichOneof("operation") != "update" or source.WhichOneof("operation") != "update":
+        return False
+    for field in ("step", "timestamp"):
+        if target.update.HasField(field) != source.update.HasField(field):
+            return False
+    if target.update.step != source.update.step or target.update.timestamp != source.update.timestamp:
+        return False
+    # a snapshot appends a single value per series
+    return not any(path in target.update.append for path in source.update.append)
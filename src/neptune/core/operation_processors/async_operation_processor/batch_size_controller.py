@@ -0,0 +1,76 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["BatchSizeController"]
+
+import threading
+from typing import Optional
+
+# Latency may grow by this factor over its running average before the batch size stops growing
+LATENCY_TOLERANCE = 1.5
+LATENCY_SMOOTHING = 0.2
+DECREASE_FACTOR = 0.5
+
+
+class BatchSizeController:
+    """Adapts the number of operations per batch with additive increase and multiplicative decrease.
+
+    The size grows by `increase_step` after each full batch sent without latency rising above its running average,
+    and is halved whenever the server throttles or the request times out. The byte limit of a batch follows
+    the same proportion, it is never raised above the configured one.
+    """
+
+    def __init__(
+        self,
+        initial_size: int,
+        min_size: int,
+        max_size: int,
+        max_size_bytes: int,
+        increase_step: Optional[int] = None,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._initial_size: int = max(initial_size, 1)
+        self._min_size: int = max(min(min_size, self._initial_size), 1)
+        self._max_size: int = max(max_size, self._initial_size)
+        self._max_size_bytes: int = max_size_bytes
+        self._increase_step: int = increase_step or max(self._initial_size // 10, 1)
+
+        self._size: int = self._initial_size
+        self._average_latency: Optional[float] = None
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def size_bytes(self) -> int:
+        return max(min(self._max_size_bytes, self._max_size_bytes * self._size // self._initial_size), 1)
+
+    def on_sent(self, batch_size: int, latency: float) -> None:
+        with self._lock:
+            average = self._average_latency
+            self._average_latency = (
+                latency if average is None else (1 - LATENCY_SMOOTHING) * average + LATENCY_SMOOTHING * latency
+            )
+
+            # Only a full batch tells whether a bigger one would be sent as fast
+            if batch_size < self._size:
+                return
+            if average is None or latency <= average * LATENCY_TOLERANCE:
+                self._size = min(self._size + self._increase_step, self._max_size)
+
+    def on_throttled(self) -> None:
+        with self._lock:
+            self._size = max(int(self._size * DECREASE_FACTOR), self._min_size)
@@ -0,0 +1,115 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+__all__ = ["BufferFullPolicy", "BufferWriterThread"]
+
+import threading
+from enum import Enum
+from typing import (
+    Callable,
+    List,
+    Optional,
+)
+
+from neptune.core.components.queue.aggregating_disk_queue import AggregatingDiskQueue
+from neptune.core.components.queue.ring_buffer import RingBuffer
+from neptune.core.operation_processors.async_operation_processor.constants import COALESCED_LOG_FLOATS_MAX_VALUES
+from neptune.core.operation_processors.async_operation_processor.queue_quota import QueueQuota
+from neptune.core.operation_processors.async_operation_processor.sync_scheduler import SyncScheduler
+from neptune.core.operations.operation import Operation
+from neptune.core.operations.utils import (
+    coalesce_log_floats,
+    try_get_step,
+)
+from neptune.internal.daemon import Daemon
+
+
+class BufferFullPolicy(str, Enum):
+    """What `enqueue_operation` does when the in-memory operation buffer is full."""
+
+    BLOCK = "block"  # wait for the writer thread to make space
+    SPILL = "spill"  # write the operation to the disk queue on the caller's thread
+    DROP = "drop"  # discard the operation with a warning
+
+
+class BufferWriterThread(Daemon):
+    """Moves operations from the in-memory buffer to the disk queue, off the thread that logs them.
+
+    Consecutive `LogFloats` of a drained batch are coalesced, so a queue record and its version may cover
+    many logged values. Run by a `scheduler`, the writer leaves the operations in the buffer while the queue
+    quota blocks writers, instead of waiting on a shared worker.
+    """
+
+    def __init__(
+        self,
+        buffer: RingBuffer[Operation],
+        disk_queue: AggregatingDiskQueue[Operation, float],
+        on_written: Callable[[int], None],
+        sleep_time: float,
+        batch_size: int,
+        queue_quota: Optional[QueueQuota] = None,
+        scheduler: Optional[SyncScheduler] = None,
+    ) -> None:
+        super().__init__(sleep_time=sleep_time, name="NeptuneAsyncBufferWriter", scheduler=scheduler)
+        self._buffer = buffer
+        self._disk_queue = disk_queue
+        self._on_written = on_written
+        self._batch_size: int = batch_size
+        self._queue_quota: Optional[QueueQuota] = queue_quota
+        # keeps operations in order when the buffer is also drained from other threads
+        self._drain_lock = threading.RLock()
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def work(self) -> None:
+        if self._scheduler is None:
+            self.drain()
+            return
+
+        # another drain already writes the buffer out
+        if not self._drain_lock.acquire(blocking=False):
+            return
+        try:
+            while self._queue_quota is None or not self._queue_quota.blocks_writers():
+                ops = self._buffer.pop_batch(self._batch_size)
+                if not ops:
+                    return
+                self._write(coalesce_log_floats(ops, max_values=COALESCED_LOG_FLOATS_MAX_VALUES))
+        finally:
+            self._drain_lock.release()
+
+    def drain(self) -> None:
+        """Writes all buffered operations to the disk queue."""
+        with self._drain_lock:
+            while True:
+                ops = self._buffer.pop_batch(self._batch_size)
+                if not ops:
+                    return
+                self._write(coalesce_log_floats(ops, max_values=COALESCED_LOG_FLOATS_MAX_VALUES))
+
+    def spill(self, op: Operation) -> None:
+        """Writes `op` to the disk queue directly, after everything buffered before it."""
+        with self._drain_lock:
+            self.drain()
+            self._write([op])
+
+    def _write(self, ops: List[Operation]) -> None:
+        if self._queue_quota is not None:
+            ops = self._queue_quota.admit(ops)
+        self._on_written(self._disk_queue.put_batch((op, try_get_step(op)) for op in ops))
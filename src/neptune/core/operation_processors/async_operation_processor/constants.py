@@ -14,7 +14,18 @@
 # limitations under the License.
 #
 
-__all__ = ["STOP_QUEUE_STATUS_UPDATE_FREQ_SECONDS", "STOP_QUEUE_MAX_TIME_NO_CONNECTION_SECONDS"]
+__all__ = [
+    "STOP_QUEUE_STATUS_UPDATE_FREQ_SECONDS",
+    "STOP_QUEUE_MAX_TIME_NO_CONNECTION_SECONDS",
+    "BUFFER_WRITER_SLEEP_TIME_SECONDS",
+    "BUFFER_FULL_WAIT_SECONDS",
+    "COALESCED_LOG_FLOATS_MAX_VALUES",
+    "ADAPTIVE_BATCH_MIN_SIZE",
+    "ADAPTIVE_BATCH_MAX_SIZE_MULTIPLIER",
+    "BACKGROUND_DRAIN_SLEEP_TIME_SECONDS",
+    "BACKGROUND_DRAIN_TIMEOUT_SECONDS",
+    "DISK_USAGE_REFRESH_SECONDS",
+]
 
 import os
 
@@ -23,3 +34,11 @@ from neptune.internal.parameters import DEFAULT_STOP_TIMEOUT
 
 STOP_QUEUE_STATUS_UPDATE_FREQ_SECONDS = 30.0
 STOP_QUEUE_MAX_TIME_NO_CONNECTION_SECONDS = float(os.getenv(NEPTUNE_SYNC_AFTER_STOP_TIMEOUT, DEFAULT_STOP_TIMEOUT))
+BUFFER_WRITER_SLEEP_TIME_SECONDS = 0.1
+BUFFER_FULL_WAIT_SECONDS = 1.0
+COALESCED_LOG_FLOATS_MAX_VALUES = 1000
+ADAPTIVE_BATCH_MIN_SIZE = 10
+ADAPTIVE_BATCH_MAX_SIZE_MULTIPLIER = 10
+BACKGROUND_DRAIN_SLEEP_TIME_SECONDS = 1.0
+BACKGROUND_DRAIN_TIMEOUT_SECONDS = 3600.0
+DISK_USAGE_REFRESH_SECONDS = 5.0
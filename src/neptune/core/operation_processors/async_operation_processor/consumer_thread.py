@@ -16,53 +16,306 @@
 
 __all__ = ["ConsumerThread"]
 
-from time import time
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass
+from time import (
+    monotonic,
+    time,
+)
 from typing import (
+    Any,
+    Deque,
+    FrozenSet,
     List,
     Optional,
+    Tuple,
 )
 
+from neptune.core.components.queue.aggregating_disk_queue import CategoryQueueElement
+from neptune.core.components.queue.disk_queue import QueueElement
+from neptune.core.operation_processors.async_operation_processor.batch_sender import BatchSender
+from neptune.core.operation_processors.async_operation_processor.batch_size_controller import BatchSizeController
 from neptune.core.operation_processors.async_operation_processor.processing_resources import ProcessingResources
-from neptune.core.operations.operation import Operation
+from neptune.core.operation_processors.async_operation_processor.sync_scheduler import SyncScheduler
+from neptune.core.operations.operation import (
+    FieldOperation,
+    Operation,
+)
 from neptune.internal.daemon import Daemon
+from neptune.internal.exceptions import NeptuneConnectionLostException
 from neptune.internal.signals_processing.utils import (
     signal_batch_lag,
     signal_batch_processed,
     signal_batch_started,
 )
+from neptune.internal.utils.logger import get_logger
+
+logger = get_logger()
+
+
+@dataclass
+class InFlightBatch:
+    batch: List[Operation]
+    version: int
+    future: "Future[int]"
+    # `None` when the batch holds operations that are not bound to a field, e.g. the creation of the run
+    paths: Optional[FrozenSet[Tuple[str, ...]]]
 
 
 class ConsumerThread(Daemon):
+    """Sends batches read from the disk queue and acknowledges them in version order.
+
+    With `max_in_flight` above one, up to that many batches are sent concurrently, as long as they update
+    different fields: values appended to a series have to reach the server in order. A batch is acknowledged only
+    once all batches before it have been, a batch that was not fully confirmed is retried before moving on.
+    A `batch_size_controller` adapts the size of the batches to the observed latency and throttling.
+    With a `sync_scheduler` the consumer has no thread of its own: its passes and the batches it sends are tasks
+    of the workers shared by all runs of the process. A pass then never waits, neither for batches in flight,
+    which wake the consumer up once sent, nor for a lost connection, which is retried in a later pass.
+    Without a `batch_sender` nothing is acknowledged, the consumer stops at the first batch and the queue stays
+    on disk.
+
+    Between passes the consumer sleeps for `sleep_time`, unless woken up or a deadline set by `schedule_wake_up`
+    comes first.
+    """
+
     def __init__(
         self,
         sleep_time: float,
         processing_resources: ProcessingResources,
+        batch_sender: Optional[BatchSender] = None,
+        max_in_flight: int = 1,
+        batch_size_controller: Optional[BatchSizeController] = None,
+        sync_scheduler: Optional[SyncScheduler] = None,
     ) -> None:
-        super().__init__(sleep_time=sleep_time, name="NeptuneAsyncOpProcessor")
+        super().__init__(sleep_time=sleep_time, name="NeptuneAsyncOpProcessor", scheduler=sync_scheduler)
         self._processing_resources = processing_resources
+        self._batch_sender: Optional[BatchSender] = batch_sender
+        self._max_in_flight: int = max(max_in_flight, 1)
+        self._batch_size_controller: Optional[BatchSizeController] = batch_size_controller
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: Deque[InFlightBatch] = deque()
+        # read from the queue, but waiting for batches in flight that update the same fields or for a lost
+        # connection to come back
+        self._held_batch: Optional[Tuple[List[Operation], int]] = None
+        # end of the backoff after a lost connection, only when run by a scheduler
+        self._retry_at: Optional[float] = None
+        self._acked_version: int = 0
         self._last_flush: float = 0.0
 
+        self._wake_up_requested: bool = False
+        self._wake_up_deadline: Optional[float] = None
+
     def run(self) -> None:
         try:
             super().run()
         except Exception as e:
-            with self._processing_resources.waiting_cond:
-                self._processing_resources.waiting_cond.notify_all()
+            self._on_error()
             raise Exception from e
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+
+    def _on_error(self) -> None:
+        if self._processing_resources.queue_quota is not None:
+            # nothing will be synchronized anymore, writers waiting for the queue to shrink must not hang
+            self._processing_resources.queue_quota.release()
+        with self._processing_resources.waiting_cond:
+            self._processing_resources.waiting_cond.notify_all()
+
+    def wake_up(self) -> None:
+        with self._wait_condition:
+            self._wake_up_requested = True
+            self._wait_condition.notify_all()
+            self._request_pass()
+
+    def schedule_wake_up(self, delay: float) -> None:
+        """Makes the consumer wake up within `delay` seconds, without waking it up right away."""
+        deadline = monotonic() + delay
+        with self._wait_condition:
+            if self._wake_up_deadline is None or deadline < self._wake_up_deadline:
+                self._wake_up_deadline = deadline
+                # lets a sleeping consumer shorten its timeout
+                self._wait_condition.notify_all()
+                self._schedule_pass(delay)
+
+    def _sleep(self) -> None:
+        sleep_until = monotonic() + self._sleep_time
+        while not self._wake_up_requested and self._state == Daemon.DaemonState.WORKING:
+            wake_up_at = sleep_until if self._sleep_time > 0 else monotonic()
+            if self._wake_up_deadline is not None:
+                wake_up_at = min(wake_up_at, self._wake_up_deadline)
+
+            timeout = wake_up_at - monotonic()
+            if timeout <= 0:
+                return
+            self._wait_condition.wait(timeout=timeout)
+
+    def _next_pass_delay(self) -> Optional[float]:
+        now = monotonic()
+        if self._retry_at is not None:
+            return max(self._retry_at - now, 0.0)
+        if self._in_flight:
+            # sent batches wake the consumer up
+            return None
+
+        delay = max(self._sleep_time, 0.0)
+        if self._wake_up_deadline is not None:
+            delay = min(delay, max(self._wake_up_deadline - now, 0.0))
+        return delay
+
+    def _has_pending_work(self) -> bool:
+        # after a lost connection, what is in flight is left on disk
+        return bool(self._in_flight) and self._retry_at is None
 
     def work(self) -> None:
+        with self._wait_condition:
+            # whatever was written so far is handled by this pass
+            self._wake_up_requested = False
+            self._wake_up_deadline = None
+
+        if self._retry_at is not None and monotonic() < self._retry_at and not self._is_interrupted():
+            return
+        self._retry_at = None
+
         ts = time()
         if ts - self._last_flush >= self._sleep_time:
             self._last_flush = ts
             self._processing_resources.disk_queue.flush()
 
+        try:
+            if self._batch_sender is not None and self._max_in_flight > 1:
+                self._work_pipelined(self._batch_sender)
+            else:
+                self._work_serial()
+        except NeptuneConnectionLostException:
+            # only raised when run by a scheduler, what has not been acknowledged is sent in a later pass
+            self._retry_at = monotonic() + self.last_backoff_time
+
+    def _work_serial(self) -> None:
+        while not self._is_interrupted():
+            occurred_at: Optional[float] = None
+            if self._held_batch is None:
+                batch = self._get_batch()
+                if not batch:
+                    return
+
+                signal_batch_started(queue=self._processing_resources.signals_queue)
+                self._held_batch = [element.obj.obj for element in batch], batch[-1].ver
+                occurred_at = batch[-1].at
+
+            operations, version = self._held_batch
+            self.process_batch(operations, version, occurred_at)
+            self._held_batch = None
+
+    def _submit(self, batch_sender: BatchSender, operations: List[Operation]) -> "Future[int]":
+        if self._scheduler is not None:
+            future = self._scheduler.submit(self, self._send, batch_sender, operations)
+            future.add_done_callback(lambda _: self.wake_up())
+            return future
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_in_flight, thread_name_prefix="NeptuneBatchSender"
+            )
+        return self._executor.submit(self._send, batch_sender, operations)
+
+    def _work_pipelined(self, batch_sender: BatchSender) -> None:
         while True:
-            batch = self._processing_resources.disk_queue.get_batch(self._processing_resources.batch_size)
-            if not batch:
+            while len(self._in_flight) < self._max_in_flight and not self._is_interrupted():
+                if self._held_batch is None:
+                    batch = self._get_batch()
+                    if not batch:
+                        break
+
+                    signal_batch_started(queue=self._processing_resources.signals_queue)
+                    if batch[-1].at is not None:
+                        signal_batch_lag(queue=self._processing_resources.signals_queue, lag=time() - batch[-1].at)
+                    self._held_batch = [element.obj.obj for element in batch], batch[-1].ver
+
+                operations, version = self._held_batch
+                paths = _updated_paths(operations)
+                if any(_overlap(paths, in_flight.paths) for in_flight in self._in_flight):
+                    break
+
+                self._held_batch = None
+                self._in_flight.append(
+                    InFlightBatch(operations, version, self._submit(batch_sender, operations), paths)
+                )
+
+            if not self._in_flight:
+                return
+            if self._scheduler is not None and not self._in_flight[0].future.done():
                 return
 
-            signal_batch_started(queue=self._processing_resources.signals_queue)
-            self.process_batch([element.obj for element in batch], batch[-1].ver, batch[-1].at)
+            # Acknowledgements follow version order, whatever order the responses come in
+            head = self._in_flight.popleft()
+            confirmed_count = head.future.result() if head.future.exception() is None else 0
+            if confirmed_count == len(head.batch):
+                signal_batch_processed(queue=self._processing_resources.signals_queue)
+                self._ack(head.version, notify=True)
+            else:
+                if confirmed_count > 0:
+                    self._ack(head.version - len(head.batch) + confirmed_count, notify=False)
+                # the retry skips what has been acknowledged, later batches wait for it
+                try:
+                    self.process_batch(head.batch, head.version)
+                except NeptuneConnectionLostException:
+                    self._in_flight.appendleft(head)
+                    raise
+                if self._acked_version < head.version:
+                    # interrupted before the retry went through, later batches must not be acknowledged past it
+                    self._in_flight.clear()
+                    return
+                if self._acked_version != head.version:
+                    # interrupted while retrying, what is left stays on disk
+                    self._in_flight.clear()
+                    return
+
+    def _get_batch(self) -> List[QueueElement[CategoryQueueElement[Operation, Any]]]:
+        if self._batch_size_controller is None:
+            return self._processing_resources.disk_queue.get_batch(self._processing_resources.batch_size)
+
+        # also moves the threshold at which writers wake the consumer up
+        self._processing_resources.batch_size = self._batch_size_controller.size
+        return self._processing_resources.disk_queue.get_batch(
+            self._processing_resources.batch_size, self._batch_size_controller.size_bytes
+        )
+
+    def _send(self, batch_sender: BatchSender, batch: List[Operation]) -> int:
+        start = monotonic()
+        try:
+            processed_count = batch_sender.send(batch)
+        except NeptuneConnectionLostException:
+            if self._batch_size_controller is not None:
+                self._batch_size_controller.on_throttled()
+            raise
+
+        latency = monotonic() - start
+        if self._batch_size_controller is not None:
+            if processed_count < len(batch):
+                self._batch_size_controller.on_throttled()
+            else:
+                self._batch_size_controller.on_sent(len(batch), latency)
+        if processed_count == len(batch):
+            self._processing_resources.sync_stats.on_batch_sent(latency)
+        return processed_count
+
+    def _ack(self, version: int, notify: bool) -> None:
+        # Writers blocked by the queue quota wait on `waiting_cond`, it is only taken to publish the new version
+        self._processing_resources.disk_queue.ack(version)
+        self._acked_version = version
+
+        with self._processing_resources.waiting_cond:
+            self._processing_resources.consumed_version = version
+            self._processing_resources.sync_stats.on_acked(version)
+
+            if notify:
+                self._processing_resources.waiting_cond.notify_all()
 
     @Daemon.ConnectionRetryWrapper(
         kill_message=(
@@ -74,20 +327,50 @@ class ConsumerThread(Daemon):
         if occurred_at is not None:
             signal_batch_lag(queue=self._processing_resources.signals_queue, lag=time() - occurred_at)
 
+        if self._batch_sender is None:
+            # Nothing can confirm the operations, acknowledging them would drop them from the disk
+            self._stop_consuming()
+            return
+
         expected_count = len(batch)
         version_to_ack = version - expected_count
+
+        # Retried after a connection loss, skip what has already been acknowledged
+        already_processed = self._acked_version - version_to_ack
+        if already_processed > 0:
+            batch = batch[already_processed:]
+            version_to_ack += already_processed
+
         while True:
-            # TODO: Add proper batch processing logic here once backend is ready
+            processed_count = self._send(self._batch_sender, batch) if batch else 0
+
+            if processed_count == 0 and batch:
+                # the same operations would be sent again and again
+                raise RuntimeError("Sending operations made no progress")
 
             signal_batch_processed(queue=self._processing_resources.signals_queue)
-            processed_count = len(batch)
             version_to_ack += processed_count
+            batch = batch[processed_count:]
 
-            with self._processing_resources.waiting_cond:
-                self._processing_resources.disk_queue.ack(version_to_ack)
+            self._ack(version_to_ack, notify=version_to_ack == version)
+            if version_to_ack == version:
+                return
 
-                self._processing_resources.consumed_version = version_to_ack
+    def _stop_consuming(self) -> None:
+        logger.warning(
+            "Metadata cannot be sent without a connection to the Neptune ingest API. It is kept on disk,"
+            " you can upload it later using the `neptune sync` command."
+        )
+        self.interrupt()
+        with self._processing_resources.waiting_cond:
+            self._processing_resources.waiting_cond.notify_all()
 
-                if version_to_ack == version:
-                    self._processing_resources.waiting_cond.notify_all()
-                    return
+
+def _updated_paths(batch: List[Operation]) -> Optional[FrozenSet[Tuple[str, ...]]]:
+    if not all(isinstance(op, FieldOperation) for op in batch):
+        return None
+    return frozenset(tuple(op.path) for op in batch if isinstance(op, FieldOperation))
+
+
+def _overlap(paths: Optional[FrozenSet[Tuple[str, ...]]], other: Optional[FrozenSet[Tuple[str, ...]]]) -> bool:
+    return paths is None or other is None or not paths.isdisjoint(other)
@@ -37,6 +37,16 @@ from neptune.core.components.abstract import (
 from neptune.core.components.metadata_file import MetadataFile
 from neptune.core.components.operation_storage import OperationStorage
 from neptune.core.components.queue.aggregating_disk_queue import AggregatingDiskQueue
+from neptune.core.components.queue.disk_queue import (
+    OFFSET_GROUP_COMMIT_EVERY,
+    OFFSET_GROUP_COMMIT_INTERVAL_SECONDS,
+)
+from neptune.core.operation_processors.async_operation_processor.queue_quota import (
+    QueueQuota,
+    QuotaPolicy,
+)
+from neptune.core.operation_processors.async_operation_processor.sync_scheduler import SyncScheduler
+from neptune.core.operation_processors.async_operation_processor.sync_stats import SyncStatsCollector
 from neptune.core.operation_processors.utils import (
     common_metadata,
     get_container_full_path,
@@ -57,6 +67,10 @@ class ProcessingResources(WithResources):
         batch_size: int = 1,
         data_path: Optional[Path] = None,
         serializer: Callable[[Operation], Dict[str, Any]] = lambda op: op.to_dict(),
+        max_queue_bytes: Optional[int] = None,
+        quota_policy: QuotaPolicy = QuotaPolicy.BLOCK,
+        max_steps_per_batch: int = 1,
+        sync_scheduler: Optional[SyncScheduler] = None,
     ) -> None:
         self.batch_size: int = batch_size
         self._data_path = (
@@ -73,11 +87,25 @@ class ProcessingResources(WithResources):
             to_dict=serializer,
             from_dict=Operation.from_dict,
             lock=lock,
+            offset_commit_every=OFFSET_GROUP_COMMIT_EVERY,
+            offset_commit_interval=OFFSET_GROUP_COMMIT_INTERVAL_SECONDS,
+            max_categories_per_batch=max_steps_per_batch,
+            scheduler=sync_scheduler,
         )
 
         self.waiting_cond = threading.Condition()
 
+        self.queue_quota: Optional[QueueQuota] = None
+        if max_queue_bytes:
+            self.queue_quota = QueueQuota(
+                disk_queue=self.disk_queue,
+                max_bytes=max_queue_bytes,
+                policy=quota_policy,
+                waiting_cond=self.waiting_cond,
+            )
+
         self.signals_queue = signal_queue
+        self.sync_stats = SyncStatsCollector()
 
         self.consumed_version: int = 0
 
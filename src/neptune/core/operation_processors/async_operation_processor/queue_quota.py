@@ -0,0 +1,172 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from __future__ import annotations
+
+__all__ = ["QuotaPolicy", "QueueQuota", "QueueQuotaMetrics"]
+
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from time import monotonic
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Tuple,
+)
+
+from neptune.core.components.queue.aggregating_disk_queue import AggregatingDiskQueue
+from neptune.core.operations.operation import Operation
+from neptune.core.operations.utils import (
+    LOG_FLOATS_TYPES,
+    LOG_OPERATION_TYPES,
+)
+from neptune.internal.warnings import (
+    NeptuneWarning,
+    warn_once,
+)
+
+# Only every n-th value of each float series is kept while the quota is exceeded with `QuotaPolicy.DOWNSAMPLE`
+QUOTA_DOWNSAMPLE_FACTOR = 10
+# With `QuotaPolicy.DROP` all series operations are dropped above this multiple of the quota, not only monitoring
+QUOTA_DROP_ALL_SERIES_RATIO = 1.1
+QUOTA_WAIT_SECONDS = 1.0
+
+MONITORING_NAMESPACE_ROOT = "monitoring"
+
+
+class QuotaPolicy(str, Enum):
+    """What happens to operations written while the run's disk queue is over its byte quota."""
+
+    BLOCK = "block"  # wait until the queue is synchronized below the quota
+    DOWNSAMPLE = "downsample"  # keep only every n-th value of float series
+    DROP = "drop"  # drop series operations, starting with monitoring metrics
+
+
+@dataclass
+class QueueQuotaMetrics:
+    size_bytes: int
+    max_bytes: int
+    is_exceeded: bool
+    blocked_seconds: float
+    downsampled_values: int
+    dropped_operations: int
+
+
+class QueueQuota:
+    """Keeps the bytes stored by a run's disk queue within `max_bytes`, applying `policy` to operations above it."""
+
+    def __init__(
+        self,
+        disk_queue: AggregatingDiskQueue[Operation, float],
+        max_bytes: int,
+        policy: QuotaPolicy,
+        waiting_cond: threading.Condition,
+    ) -> None:
+        self._disk_queue = disk_queue
+        self._max_bytes: int = max_bytes
+        self._policy: QuotaPolicy = policy
+        # notified by the consumer whenever operations are acknowledged
+        self._waiting_cond = waiting_cond
+        self._released: bool = False
+
+        self._downsample_counters: Dict[Tuple[str, ...], int] = {}
+        self._blocked_seconds: float = 0.0
+        self._downsampled_values: int = 0
+        self._dropped_operations: int = 0
+
+    def size_bytes(self) -> int:
+        # Only what is still waiting to be synchronized counts, acknowledged records may stay on disk for a while
+        return self._disk_queue.pending_bytes()
+
+    def is_exceeded(self) -> bool:
+        return self.size_bytes() >= self._max_bytes
+
+    def metrics(self) -> QueueQuotaMetrics:
+        size_bytes = self.size_bytes()
+        return QueueQuotaMetrics(
+            size_bytes=size_bytes,
+            max_bytes=self._max_bytes,
+            is_exceeded=size_bytes >= self._max_bytes,
+            blocked_seconds=self._blocked_seconds,
+            downsampled_values=self._downsampled_values,
+            dropped_operations=self._dropped_operations,
+        )
+
+    def blocks_writers(self) -> bool:
+        """Whether `admit` would wait for the queue to shrink."""
+        return self._policy == QuotaPolicy.BLOCK and not self._released and self.is_exceeded()
+
+    def release(self) -> None:
+        """Stops blocking writers, e.g. when the processor is closing and nothing will be synchronized anymore."""
+        self._released = True
+        with self._waiting_cond:
+            self._waiting_cond.notify_all()
+
+    def admit(self, ops: List[Operation]) -> List[Operation]:
+        """Returns the operations that should be written to the disk queue."""
+        size_bytes = self.size_bytes()
+        if size_bytes < self._max_bytes:
+            return ops
+
+        warn_once(
+            f"The local queue of this run exceeds its quota of {self._max_bytes} bytes,"
+            f" applying the '{self._policy.value}' policy until it is synchronized.",
+            exception=NeptuneWarning,
+        )
+        if self._policy == QuotaPolicy.BLOCK:
+            self._wait_below_quota()
+            return ops
+        if self._policy == QuotaPolicy.DOWNSAMPLE:
+            return self._downsample(ops)
+        return self._drop(ops, drop_all_series=size_bytes >= self._max_bytes * QUOTA_DROP_ALL_SERIES_RATIO)
+
+    def _wait_below_quota(self) -> None:
+        start = monotonic()
+        with self._waiting_cond:
+            while not self._released and self.is_exceeded():
+                self._waiting_cond.wait(timeout=QUOTA_WAIT_SECONDS)
+        self._blocked_seconds += monotonic() - start
+
+    def _downsample(self, ops: List[Operation]) -> List[Operation]:
+        admitted: List[Operation] = []
+        for op in ops:
+            if not isinstance(op, LOG_FLOATS_TYPES):
+                admitted.append(op)
+                continue
+
+            path = tuple(op.path)
+            counter = self._downsample_counters.get(path, 0)
+            values = [value for i, value in enumerate(op.values, counter) if i % QUOTA_DOWNSAMPLE_FACTOR == 0]
+            self._downsample_counters[path] = counter + len(op.values)
+            self._downsampled_values += len(op.values) - len(values)
+            if values:
+                admitted.append(type(op)(op.path, values))
+        return admitted
+
+    def _drop(self, ops: List[Operation], drop_all_series: bool) -> List[Operation]:
+        should_drop: Callable[[Operation], bool] = _is_series_operation if drop_all_series else _is_monitoring_operation
+        admitted = [op for op in ops if not should_drop(op)]
+        self._dropped_operations += len(ops) - len(admitted)
+        return admitted
+
+
+def _is_series_operation(op: Operation) -> bool:
+    return isinstance(op, LOG_OPERATION_TYPES)
+
+
+def _is_monitoring_operation(op: Operation) -> bool:
+    return isinstance(op, LOG_OPERATION_TYPES) and bool(op.path) and op.path[0] == MONITORING_NAMESPACE_ROOT
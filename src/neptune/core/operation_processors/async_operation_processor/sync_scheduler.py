@@ -0,0 +1,160 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["SyncScheduler", "get_sync_scheduler"]
+
+import heapq
+import itertools
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from neptune.internal.utils.logger import get_logger
+
+logger = get_logger()
+
+R = TypeVar("R")
+
+Task = Tuple["Future[Any]", Callable[..., Any], Tuple[Any, ...]]
+
+
+class SyncScheduler:
+    """Runs the background work of all runs of the process on a shared pool of worker threads.
+
+    Every run submits its tasks under its own key. Workers take tasks from the keys in turns, one at a time,
+    so a run with a long backlog doesn't hold back the others. Tasks submitted with `submit_after` wait for
+    their time without taking a worker.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._max_workers: int = max(max_workers, 1)
+        self._cond = threading.Condition()
+        self._tasks: Dict[Hashable, Deque[Task]] = {}
+        # keys with pending tasks, in the order they get their next turn
+        self._ready: Deque[Hashable] = deque()
+        # (due time, sequence number, key, task) of the delayed tasks
+        self._delayed: List[Tuple[float, int, Hashable, Task]] = []
+        self._sequence = itertools.count()
+        self._workers: List[threading.Thread] = []
+        self._idle_workers: int = 0
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def submit(self, key: Hashable, fn: Callable[..., R], *args: Any) -> "Future[R]":
+        future: "Future[R]" = Future()
+        with self._cond:
+            self._enqueue(key, (future, fn, args))
+            self._notify_worker()
+        return future
+
+    def submit_after(self, delay: float, key: Hashable, fn: Callable[..., R], *args: Any) -> "Future[R]":
+        """Submits the task once `delay` seconds have passed. It is skipped if the future is cancelled before."""
+        future: "Future[R]" = Future()
+        with self._cond:
+            heapq.heappush(self._delayed, (monotonic() + delay, next(self._sequence), key, (future, fn, args)))
+            self._notify_worker()
+        return future
+
+    def pending(self, key: Hashable) -> int:
+        with self._cond:
+            return len(self._tasks.get(key, ()))
+
+    def _start_worker(self) -> None:
+        worker = threading.Thread(target=self._work, name=f"NeptuneSyncScheduler-{len(self._workers)}", daemon=True)
+        self._workers.append(worker)
+        worker.start()
+
+    def _enqueue(self, key: Hashable, task: Task) -> None:
+        tasks = self._tasks.setdefault(key, deque())
+        if not tasks:
+            self._ready.append(key)
+        tasks.append(task)
+
+    def _notify_worker(self) -> None:
+        if self._idle_workers == 0 and len(self._workers) < self._max_workers:
+            self._start_worker()
+        self._cond.notify()
+
+    def _next_task(self) -> Task:
+        with self._cond:
+            while True:
+                now = monotonic()
+                while self._delayed and self._delayed[0][0] <= now:
+                    _, _, key, task = heapq.heappop(self._delayed)
+                    self._enqueue(key, task)
+                if self._ready:
+                    break
+
+                self._idle_workers += 1
+                self._cond.wait(timeout=self._delayed[0][0] - now if self._delayed else None)
+                self._idle_workers -= 1
+
+            key = self._ready.popleft()
+            tasks = self._tasks[key]
+            task = tasks.popleft()
+            if tasks:
+                self._ready.append(key)
+            else:
+                del self._tasks[key]
+            return task
+
+    def _work(self) -> None:
+        while True:
+            future, fn, args = self._next_task()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+_scheduler: Optional[SyncScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_sync_scheduler(max_workers: int) -> SyncScheduler:
+    """Returns the scheduler shared by all runs of the process, created with `max_workers` on first use."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = SyncScheduler(max_workers=max_workers)
+        return _scheduler
+
+
+def _reset_after_fork() -> None:
+    # worker threads don't survive a fork, the child process starts with a fresh scheduler
+    global _scheduler, _scheduler_lock
+    _scheduler = None
+    _scheduler_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,139 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["SyncStats", "SyncStatsCollector"]
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from time import monotonic
+from typing import (
+    Deque,
+    List,
+    Optional,
+    Tuple,
+)
+
+# Rates are computed over this many last seconds
+RATE_WINDOW_SECONDS = 60.0
+RATE_SAMPLE_INTERVAL_SECONDS = 1.0
+# Writes closer in time than this are tracked together when computing the age of the oldest operation
+WRITE_TRACKING_RESOLUTION_SECONDS = 0.1
+LATENCY_SAMPLES = 1000
+
+
+@dataclass
+class SyncStats:
+    queue_size: int  # operations waiting to be synchronized, in memory or on disk
+    queue_size_bytes: int  # encoded size of the operations waiting on disk
+    disk_usage_bytes: int
+    enqueue_rate: float  # operations per second
+    send_rate: float  # operations per second
+    batch_latency_p50: Optional[float]  # seconds
+    batch_latency_p99: Optional[float]  # seconds
+    oldest_unacked_age: Optional[float]  # seconds, None with nothing waiting
+
+
+class _RateMeter:
+    """Rate of growth of a counter over the last `window` seconds, sampled at most once per sample interval."""
+
+    def __init__(self, window: float) -> None:
+        self._window: float = window
+        self._samples: Deque[Tuple[float, int]] = deque()
+        self._value: Optional[int] = None
+
+    def update(self, value: int, now: float) -> None:
+        if self._value is None or now - self._samples[-1][0] >= RATE_SAMPLE_INTERVAL_SECONDS:
+            self._samples.append((now, value))
+        self._value = value
+        self._prune(now)
+
+    def rate(self, now: float) -> float:
+        if self._value is None:
+            return 0.0
+        self._prune(now)
+        start, start_value = self._samples[0]
+        elapsed = now - start
+        return (self._value - start_value) / elapsed if elapsed > 0 else 0.0
+
+    def _prune(self, now: float) -> None:
+        while len(self._samples) > 1 and now - self._samples[1][0] >= self._window:
+            self._samples.popleft()
+
+
+class SyncStatsCollector:
+    """Follows the versions written to and acknowledged from the disk queue and the latency of sent batches.
+
+    Versions are counted from the first ones seen, operations left on disk by a previous session are only
+    reflected in the queue size.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._written = _RateMeter(RATE_WINDOW_SECONDS)
+        self._acked = _RateMeter(RATE_WINDOW_SECONDS)
+        self._acked_version: int = 0
+        # (last version, time of the first write) of writes not acknowledged yet
+        self._writes: Deque[Tuple[int, float]] = deque()
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def on_written(self, version: int) -> None:
+        now = monotonic()
+        with self._lock:
+            self._written.update(version, now)
+            if version <= self._acked_version:
+                return
+            if self._writes and now - self._writes[-1][1] < WRITE_TRACKING_RESOLUTION_SECONDS:
+                self._writes[-1] = (version, self._writes[-1][1])
+            else:
+                self._writes.append((version, now))
+
+    def on_acked(self, version: int) -> None:
+        now = monotonic()
+        with self._lock:
+            self._acked.update(version, now)
+            self._acked_version = version
+            while self._writes and self._writes[0][0] <= version:
+                self._writes.popleft()
+
+    def on_batch_sent(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+
+    def enqueue_rate(self) -> float:
+        with self._lock:
+            return self._written.rate(monotonic())
+
+    def send_rate(self) -> float:
+        with self._lock:
+            return self._acked.rate(monotonic())
+
+    def batch_latency(self, percentile: float) -> Optional[float]:
+        with self._lock:
+            latencies = sorted(self._latencies)
+        return _percentile(latencies, percentile)
+
+    def oldest_unacked_age(self) -> Optional[float]:
+        with self._lock:
+            if not self._writes:
+                return None
+            return monotonic() - self._writes[0][1]
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(int(len(sorted_values) * percentile / 100), len(sorted_values) - 1)
+    return sorted_values[index]
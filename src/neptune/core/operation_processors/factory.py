@@ -19,19 +19,37 @@ __all__ = ["get_operation_processor"]
 import os
 import threading
 from queue import Queue
-from typing import TYPE_CHECKING
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+)
 
 from neptune.core.operation_processors.async_operation_processor import AsyncOperationProcessor
+from neptune.core.operation_processors.async_operation_processor.buffer_writer_thread import BufferFullPolicy
+from neptune.core.operation_processors.async_operation_processor.queue_quota import QuotaPolicy
+from neptune.core.operation_processors.async_operation_processor.sync_scheduler import get_sync_scheduler
 from neptune.core.operation_processors.offline_operation_processor import OfflineOperationProcessor
 from neptune.core.operation_processors.operation_processor import OperationProcessor
 from neptune.core.operation_processors.read_only_operation_processor import ReadOnlyOperationProcessor
 from neptune.core.operation_processors.sync_operation_processor import SyncOperationProcessor
 from neptune.core.typing.container_type import ContainerType
 from neptune.core.typing.id_formats import CustomId
-from neptune.envs import NEPTUNE_ASYNC_BATCH_SIZE
+from neptune.envs import (
+    NEPTUNE_ASYNC_ADAPTIVE_BATCH_SIZE,
+    NEPTUNE_ASYNC_BATCH_SIZE,
+    NEPTUNE_ASYNC_BUFFER_FULL_POLICY,
+    NEPTUNE_ASYNC_BUFFER_SIZE,
+    NEPTUNE_ASYNC_MAX_DELAY,
+    NEPTUNE_ASYNC_MAX_IN_FLIGHT_BATCHES,
+    NEPTUNE_ASYNC_MAX_QUEUE_BYTES,
+    NEPTUNE_ASYNC_MAX_STEPS_PER_BATCH,
+    NEPTUNE_ASYNC_QUEUE_QUOTA_POLICY,
+    NEPTUNE_ASYNC_SYNC_WORKERS,
+)
 from neptune.objects.mode import Mode
 
 if TYPE_CHECKING:
+    from neptune.internal.backends.hosted_neptune_backend_v2 import HostedNeptuneBackendV2
     from neptune.internal.signals_processing.signals import Signal
 
 
@@ -42,8 +60,15 @@ def get_operation_processor(
     lock: threading.RLock,
     flush_period: float,
     queue: "Queue[Signal]",
+    ingest_backend: Optional["HostedNeptuneBackendV2"] = None,
+    project: Optional[str] = None,
+    max_delay: Optional[float] = None,
 ) -> OperationProcessor:
     if mode == Mode.ASYNC:
+        if max_delay is None and os.environ.get(NEPTUNE_ASYNC_MAX_DELAY):
+            max_delay = float(os.environ[NEPTUNE_ASYNC_MAX_DELAY])
+        # Batches of all runs of the process are sent by one pool of workers, 0 gives every run its own threads
+        sync_workers = int(os.environ.get(NEPTUNE_ASYNC_SYNC_WORKERS) or "8")
         return AsyncOperationProcessor(
             custom_id=custom_id,
             container_type=container_type,
@@ -51,6 +76,17 @@ def get_operation_processor(
             sleep_time=flush_period,
             batch_size=int(os.environ.get(NEPTUNE_ASYNC_BATCH_SIZE) or "1000"),
             signal_queue=queue,
+            buffer_size=int(os.environ.get(NEPTUNE_ASYNC_BUFFER_SIZE) or "10000"),
+            buffer_full_policy=BufferFullPolicy(os.environ.get(NEPTUNE_ASYNC_BUFFER_FULL_POLICY) or "block"),
+            max_queue_bytes=int(os.environ.get(NEPTUNE_ASYNC_MAX_QUEUE_BYTES) or "0") or None,
+            quota_policy=QuotaPolicy(os.environ.get(NEPTUNE_ASYNC_QUEUE_QUOTA_POLICY) or "block"),
+            backend=ingest_backend,
+            project=project,
+            max_in_flight_batches=int(os.environ.get(NEPTUNE_ASYNC_MAX_IN_FLIGHT_BATCHES) or "4"),
+            adaptive_batch_size=os.getenv(NEPTUNE_ASYNC_ADAPTIVE_BATCH_SIZE, "True").lower() in ("true", "t", "1"),
+            max_delay=max_delay,
+            max_steps_per_batch=int(os.environ.get(NEPTUNE_ASYNC_MAX_STEPS_PER_BATCH) or "1"),
+            sync_scheduler=get_sync_scheduler(max_workers=sync_workers) if sync_workers > 0 else None,
         )
     elif mode in {Mode.SYNC, Mode.DEBUG}:
         return SyncOperationProcessor(custom_id=custom_id, container_type=container_type)
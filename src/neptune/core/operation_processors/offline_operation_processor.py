@@ -22,6 +22,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    List,
     Optional,
     Tuple,
 )
@@ -30,7 +31,11 @@ from neptune.constants import OFFLINE_DIRECTORY
 from neptune.core.components.abstract import WithResources
 from neptune.core.components.metadata_file import MetadataFile
 from neptune.core.components.operation_storage import OperationStorage
-from neptune.core.components.queue.disk_queue import DiskQueue
+from neptune.core.components.queue.disk_queue import (
+    OFFSET_GROUP_COMMIT_EVERY,
+    OFFSET_GROUP_COMMIT_INTERVAL_SECONDS,
+    DiskQueue,
+)
 from neptune.core.operation_processors.operation_processor import OperationProcessor
 from neptune.core.operation_processors.utils import (
     common_metadata,
@@ -60,7 +65,14 @@ class OfflineOperationProcessor(WithResources, OperationProcessor):
             metadata=common_metadata(mode="offline", custom_id=custom_id, container_type=container_type),
         )
         self._operation_storage = OperationStorage(data_path=self._data_path)
-        self._queue = DiskQueue(data_path=self._data_path, to_dict=serializer, from_dict=Operation.from_dict, lock=lock)
+        self._queue = DiskQueue(
+            data_path=self._data_path,
+            to_dict=serializer,
+            from_dict=Operation.from_dict,
+            lock=lock,
+            offset_commit_every=OFFSET_GROUP_COMMIT_EVERY,
+            offset_commit_interval=OFFSET_GROUP_COMMIT_INTERVAL_SECONDS,
+        )
 
     @property
     def operation_storage(self) -> "OperationStorage":
@@ -78,6 +90,10 @@ class OfflineOperationProcessor(WithResources, OperationProcessor):
     def enqueue_operation(self, op: Operation, *, wait: bool) -> None:
         self._queue.put(op)
 
+    @ensure_disk_not_overutilize
+    def enqueue_operations(self, ops: List[Operation], *, wait: bool) -> None:
+        self._queue.put_batch(ops)
+
     def wait(self) -> None:
         self.flush()
 
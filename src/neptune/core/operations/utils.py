@@ -14,17 +14,74 @@
 # limitations under the License.
 #
 
-from typing import Optional
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from neptune.core.operations.operation import (
     LogFloats,
+    LogOperation,
     Operation,
 )
+from neptune.internal import operation as internal_operation
+
+# Attributes still enqueue the operations of `neptune.internal.operation`, the queue reads back the ones above
+AnyOperation = Union[Operation, internal_operation.Operation]
+LOG_FLOATS_TYPES = (LogFloats, internal_operation.LogFloats)
+LOG_OPERATION_TYPES = (LogOperation, internal_operation.LogOperation)
 
 
-def try_get_step(operation: Operation) -> Optional[float]:
-    if isinstance(operation, LogFloats):
-        # assumtion: there is at most one value in the LogFloats values list
+def try_get_step(operation: AnyOperation) -> Optional[float]:
+    if isinstance(operation, LOG_FLOATS_TYPES):
+        # values logged one by one share the step, an extended series is categorized by its first step
         return operation.values[0].step if operation.values else None
     else:
         return None
+
+
+def coalesce_log_floats(operations: Iterable[Operation], max_values: int) -> List[Operation]:
+    """Merges `LogFloats` for the same path into operations carrying up to `max_values` values.
+
+    Only a run of `LogFloats` sharing the same step is merged, so every result still has a single step.
+    Within such a run operations for different paths are independent and are grouped by path,
+    the order of values logged to any single path is kept.
+    """
+    result: List[Operation] = []
+    # `LogFloats` of either module, a merged operation keeps the class of the first one
+    pending: Dict[Tuple[str, ...], Any] = {}
+    pending_step: Optional[float] = None
+
+    for operation in operations:
+        if not isinstance(operation, LOG_FLOATS_TYPES) or not operation.values:
+            result.extend(pending.values())
+            pending = {}
+            result.append(operation)
+            continue
+
+        step = try_get_step(operation)
+        if pending and step != pending_step:
+            result.extend(pending.values())
+            pending = {}
+        pending_step = step
+
+        path = tuple(operation.path)
+        merged = pending.get(path)
+        if (
+            merged is not None
+            and type(merged) is type(operation)
+            and len(merged.values) + len(operation.values) <= max_values
+        ):
+            merged.values.extend(operation.values)
+        else:
+            if merged is not None:
+                result.append(merged)
+            pending[path] = type(operation)(operation.path, list(operation.values))
+
+    result.extend(pending.values())
+    return result
@@ -34,6 +34,19 @@ __all__ = [
     "NEPTUNE_ENABLE_DEFAULT_ASYNC_NO_PROGRESS_CALLBACK",
     "NEPTUNE_USE_PROTOCOL_BUFFERS",
     "NEPTUNE_ASYNC_BATCH_SIZE",
+    "NEPTUNE_ASYNC_BUFFER_SIZE",
+    "NEPTUNE_ASYNC_BUFFER_FULL_POLICY",
+    "NEPTUNE_ASYNC_MAX_QUEUE_BYTES",
+    "NEPTUNE_ASYNC_QUEUE_QUOTA_POLICY",
+    "NEPTUNE_ASYNC_MAX_IN_FLIGHT_BATCHES",
+    "NEPTUNE_ASYNC_ADAPTIVE_BATCH_SIZE",
+    "NEPTUNE_ASYNC_MAX_DELAY",
+    "NEPTUNE_ASYNC_MAX_STEPS_PER_BATCH",
+    "NEPTUNE_ASYNC_SYNC_WORKERS",
+    "NEPTUNE_ASYNC_BACKGROUND_DRAIN_TIMEOUT",
+    "NEPTUNE_DISK_QUEUE_RECORD_FORMAT",
+    "NEPTUNE_DISK_QUEUE_COMPRESSION",
+    "NEPTUNE_DISK_QUEUE_DURABILITY",
 ]
 
 from neptune.internal.envs import (
@@ -75,4 +88,30 @@ NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_EXCEEDED = "NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_
 
 NEPTUNE_ASYNC_BATCH_SIZE = "NEPTUNE_ASYNC_BATCH_SIZE"
 
+NEPTUNE_ASYNC_BUFFER_SIZE = "NEPTUNE_ASYNC_BUFFER_SIZE"
+
+NEPTUNE_ASYNC_BUFFER_FULL_POLICY = "NEPTUNE_ASYNC_BUFFER_FULL_POLICY"
+
+NEPTUNE_ASYNC_MAX_QUEUE_BYTES = "NEPTUNE_ASYNC_MAX_QUEUE_BYTES"
+
+NEPTUNE_ASYNC_QUEUE_QUOTA_POLICY = "NEPTUNE_ASYNC_QUEUE_QUOTA_POLICY"
+
+NEPTUNE_ASYNC_MAX_IN_FLIGHT_BATCHES = "NEPTUNE_ASYNC_MAX_IN_FLIGHT_BATCHES"
+
+NEPTUNE_ASYNC_ADAPTIVE_BATCH_SIZE = "NEPTUNE_ASYNC_ADAPTIVE_BATCH_SIZE"
+
+NEPTUNE_ASYNC_MAX_DELAY = "NEPTUNE_ASYNC_MAX_DELAY"
+
+NEPTUNE_ASYNC_MAX_STEPS_PER_BATCH = "NEPTUNE_ASYNC_MAX_STEPS_PER_BATCH"
+
+NEPTUNE_ASYNC_SYNC_WORKERS = "NEPTUNE_ASYNC_SYNC_WORKERS"
+
+NEPTUNE_ASYNC_BACKGROUND_DRAIN_TIMEOUT = "NEPTUNE_ASYNC_BACKGROUND_DRAIN_TIMEOUT"
+
 NEPTUNE_USE_PROTOCOL_BUFFERS = "NEPTUNE_USE_PROTOCOL_BUFFERS"
+
+NEPTUNE_DISK_QUEUE_RECORD_FORMAT = "NEPTUNE_DISK_QUEUE_RECORD_FORMAT"
+
+NEPTUNE_DISK_QUEUE_COMPRESSION = "NEPTUNE_DISK_QUEUE_COMPRESSION"
+
+NEPTUNE_DISK_QUEUE_DURABILITY = "NEPTUNE_DISK_QUEUE_DURABILITY"
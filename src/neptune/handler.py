@@ -30,7 +30,10 @@ from typing import (
 
 from neptune.attributes.constants import SYSTEM_STAGE_ATTRIBUTE_PATH
 from neptune.attributes.namespace import Namespace
-from neptune.attributes.series.float_series import FloatSeries
+from neptune.attributes.series.float_series import (
+    FloatSeries,
+    FloatSeriesWriter,
+)
 from neptune.attributes.series.string_series import StringSeries
 from neptune.attributes.sets.string_set import StringSet
 from neptune.exceptions import (
@@ -45,6 +48,7 @@ from neptune.internal.utils import (
     is_dict_like,
     is_float,
     is_float_like,
+    is_numeric_array,
     is_string,
     is_stringify_value,
     verify_type,
@@ -424,6 +428,35 @@ class Handler(SupportsNamespaces):
 
             attr.extend(values, steps=steps, timestamps=timestamps, wait=wait, **kwargs)
 
+    @check_protected_paths
+    def writer(self) -> "FloatSeriesWriter":
+        """Returns a writer that appends float values to the series field with little overhead per call.
+
+        Use it to log a metric in a hot loop. The field is resolved once, and if it doesn't exist yet,
+        a `FloatSeries` is created. Each `append()` only checks the types of its arguments.
+
+        Available for the following field types:
+            * `FloatSeries`
+
+        Example:
+            >>> import neptune
+            >>> run = neptune.init_run()
+            >>> loss_writer = run["train/loss"].writer()
+            >>> for step in range(n_steps):
+            ...     loss_writer.append(train_step(), step=step)
+        """
+        with self._container.lock():
+            attr = self._container.get_attribute(self._path)
+            if attr is None:
+                attr = FloatSeries(self._container, parse_path(self._path))
+                self._container.set_attribute(self._path, attr)
+            if not isinstance(attr, FloatSeries):
+                raise NeptuneUserApiInputException(
+                    f"Cannot create a writer for the field '{self._path}' of type {type(attr).__name__},"
+                    " writers are available only for FloatSeries fields."
+                )
+            return attr.writer()
+
     @check_protected_paths
     def add(self, values: Union[str, Iterable[str]], *, wait: bool = False) -> None:
         """Adds the provided tags to the run.
@@ -766,7 +799,7 @@ class ExtendUtils:
         if isinstance(values, Namespace) or is_dict_like(values):
             for val in values.values():
                 yield from ExtendUtils.generate_leaf_collection_lengths(val)
-        elif is_collection(values):
+        elif is_collection(values) or is_numeric_array(values):
             yield len(values)
         else:
             raise NeptuneUserApiInputException("Values must be a collection or namespace leafs must be collections")
@@ -15,16 +15,30 @@
 #
 __all__ = ["get_backend"]
 
-from typing import Optional
+import threading
+from typing import (
+    Dict,
+    Optional,
+)
+
+from neptune_api.credentials import Credentials as ApiCredentials
 
 from neptune.internal.credentials import Credentials
+from neptune.internal.utils.logger import get_logger
 from neptune.objects.mode import Mode
 
 from .hosted_neptune_backend import HostedNeptuneBackend
+from .hosted_neptune_backend_v2 import HostedNeptuneBackendV2
 from .neptune_backend import NeptuneBackend
 from .neptune_backend_mock import NeptuneBackendMock
 from .offline_neptune_backend import OfflineNeptuneBackend
 
+_logger = get_logger()
+
+# Runs of the same account share one ingest API client and its connection pool
+_ingest_backends: Dict[str, HostedNeptuneBackendV2] = {}
+_ingest_backends_lock = threading.Lock()
+
 
 def get_backend(mode: Mode, api_token: Optional[str] = None, proxies: Optional[dict] = None) -> NeptuneBackend:
     if mode == Mode.ASYNC:
@@ -39,3 +53,25 @@ def get_backend(mode: Mode, api_token: Optional[str] = None, proxies: Optional[d
         return HostedNeptuneBackend(credentials=Credentials.from_token(api_token=api_token), proxies=proxies)
     else:
         raise ValueError(f"mode should be one of {[m for m in Mode]}")
+
+
+def get_ingest_backend(backend: NeptuneBackend) -> Optional[HostedNeptuneBackendV2]:
+    """Returns the ingest API client for the account of a hosted `backend`, None for backends without a server."""
+    credentials = getattr(backend, "credentials", None)
+    if not isinstance(credentials, Credentials):
+        return None
+
+    try:
+        with _ingest_backends_lock:
+            if credentials.api_token not in _ingest_backends:
+                _ingest_backends[credentials.api_token] = HostedNeptuneBackendV2(
+                    credentials=ApiCredentials.from_api_key(credentials.api_token)
+                )
+            return _ingest_backends[credentials.api_token]
+    except Exception:
+        _logger.warning(
+            "Cannot connect to the Neptune ingest API. Metadata will be kept on disk,"
+            " you can upload it later using the `neptune sync` command.",
+            exc_info=True,
+        )
+        return None
@@ -18,20 +18,30 @@ from __future__ import annotations
 __all__ = ["HostedNeptuneBackendV2"]
 
 
+from http import HTTPStatus
 from typing import cast
 
+import httpx
 from neptune_api.api.backend import get_project
+from neptune_api.api.data_ingestion import submit_operation
 from neptune_api.credentials import Credentials
 from neptune_api.models import (
     Error,
     ProjectDTO,
 )
+from neptune_api.proto.neptune_pb.ingest.v1.pub.client_pb2 import RequestId
+from neptune_api.proto.neptune_pb.ingest.v1.pub.ingest_pb2 import RunOperation
 from neptune_api.types import Response
 
 from neptune.internal.backends.api_client import (
     create_auth_api_client,
     get_config_and_token_urls,
 )
+from neptune.internal.exceptions import (
+    ClientHttpError,
+    InternalServerError,
+    NeptuneConnectionLostException,
+)
 from neptune.internal.id_formats import QualifiedName
 
 
@@ -50,3 +60,19 @@ class HostedNeptuneBackendV2:
         if response.parsed is None:
             raise RuntimeError(response.content.decode("utf-8"))
         return cast(ProjectDTO, response.parsed)
+
+    def submit_operation(self, run_operation: RunOperation) -> RequestId:
+        """Raises `NeptuneConnectionLostException` when the request is worth retrying, `ClientHttpError` otherwise."""
+        try:
+            response: Response[RequestId] = submit_operation.sync_detailed(client=self.auth_client, body=run_operation)
+        except httpx.TransportError as e:
+            raise NeptuneConnectionLostException(e) from e
+
+        if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR or response.status_code in (
+            HTTPStatus.REQUEST_TIMEOUT,
+            HTTPStatus.TOO_MANY_REQUESTS,
+        ):
+            raise NeptuneConnectionLostException(InternalServerError(response.content.decode("utf-8")))
+        if response.parsed is None:
+            raise ClientHttpError(str(response.status_code.value), response.content.decode("utf-8"))
+        return response.parsed
@@ -18,15 +18,33 @@ __all__ = ["Daemon"]
 import abc
 import functools
 import threading
+from concurrent.futures import Future
 from enum import Enum
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Optional,
+    Tuple,
+)
 
 from neptune.internal.exceptions import NeptuneConnectionLostException
 from neptune.internal.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from neptune.core.operation_processors.async_operation_processor.sync_scheduler import SyncScheduler
+
 logger = get_logger()
 
 
 class Daemon(threading.Thread):
+    """Calls `work` repeatedly, sleeping `sleep_time` seconds between the calls.
+
+    With a `scheduler`, no thread is started: every call of `work` is a task run by the workers the scheduler
+    shares with the other daemons of the process, and the sleep is a delayed task. `work` must not block then,
+    the workers it would hold may be the ones needed to unblock it.
+    """
+
     class DaemonState(Enum):
         INIT = 1
         WORKING = 2
@@ -35,17 +53,56 @@ class Daemon(threading.Thread):
         INTERRUPTED = 5
         STOPPED = 6
 
-    def __init__(self, sleep_time: float, name):
+    def __init__(self, sleep_time: float, name, scheduler: Optional["SyncScheduler"] = None):
         super().__init__(daemon=True, name=name)
         self._sleep_time = sleep_time
         self._state: Daemon.DaemonState = Daemon.DaemonState.INIT
         self._wait_condition = threading.Condition()
         self.last_backoff_time = 0  # used only with ConnectionRetryWrapper decorator
 
+        self._scheduler: Optional["SyncScheduler"] = scheduler
+        self._scheduled: bool = False
+        # an immediate call of `work` is submitted to the scheduler, is running, or is requested to follow
+        self._pass_submitted: bool = False
+        self._pass_running: bool = False
+        self._pass_requested: bool = False
+        # (due time, future) of the call of `work` that ends the sleep
+        self._timed_pass: Optional[Tuple[float, "Future[Any]"]] = None
+
+    def start(self):
+        if self._scheduler is None:
+            super().start()
+            return
+
+        with self._wait_condition:
+            if self._scheduled:
+                raise RuntimeError("daemons can only be started once")
+            self._scheduled = True
+            if not self._is_interrupted():
+                self._state = Daemon.DaemonState.WORKING
+            self._request_pass()
+
+    def is_alive(self) -> bool:
+        if self._scheduler is None:
+            return super().is_alive()
+        with self._wait_condition:
+            return self._scheduled and self._state != Daemon.DaemonState.STOPPED
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        if self._scheduler is None:
+            super().join(timeout)
+            return
+
+        with self._wait_condition:
+            self._wait_condition.wait_for(
+                lambda: not self._scheduled or self._state == Daemon.DaemonState.STOPPED, timeout=timeout
+            )
+
     def interrupt(self):
         with self._wait_condition:
             self._state = Daemon.DaemonState.INTERRUPTED
             self._wait_condition.notify_all()
+            self._request_pass()
 
     def pause(self):
         with self._wait_condition:
@@ -53,6 +110,7 @@ class Daemon(threading.Thread):
                 if not self._is_interrupted():
                     self._state = Daemon.DaemonState.PAUSING
                 self._wait_condition.notify_all()
+                self._request_pass()
                 self._wait_condition.wait_for(lambda: self._state != Daemon.DaemonState.PAUSING)
 
     def resume(self):
@@ -60,10 +118,12 @@ class Daemon(threading.Thread):
             if not self._is_interrupted():
                 self._state = Daemon.DaemonState.WORKING
             self._wait_condition.notify_all()
+            self._request_pass()
 
     def wake_up(self):
         with self._wait_condition:
             self._wait_condition.notify_all()
+            self._request_pass()
 
     def disable_sleep(self):
         self._sleep_time = 0
@@ -80,6 +140,10 @@ class Daemon(threading.Thread):
         with self._wait_condition:
             return self._state in (Daemon.DaemonState.INTERRUPTED, Daemon.DaemonState.STOPPED)
 
+    def _sleep(self) -> None:
+        """Waits between two calls of `work`, called with `_wait_condition` held."""
+        self._wait_condition.wait(timeout=self._sleep_time)
+
     def run(self):
         with self._wait_condition:
             if not self._is_interrupted():
@@ -96,7 +160,7 @@ class Daemon(threading.Thread):
                     self.work()
                     with self._wait_condition:
                         if self._sleep_time > 0 and self._state == Daemon.DaemonState.WORKING:
-                            self._wait_condition.wait(timeout=self._sleep_time)
+                            self._sleep()
         finally:
             with self._wait_condition:
                 self._state = Daemon.DaemonState.STOPPED
@@ -106,6 +170,101 @@ class Daemon(threading.Thread):
     def work(self):
         pass
 
+    def _has_pending_work(self) -> bool:
+        """Whether `work` still has to be called after an interruption, only for daemons run by a scheduler."""
+        return False
+
+    def _next_pass_delay(self) -> Optional[float]:
+        """Seconds until a daemon run by a scheduler calls `work` again, None to wait for `wake_up`."""
+        return self._sleep_time
+
+    def _on_error(self) -> None:
+        """Called once a daemon run by a scheduler is stopped by an exception raised by `work`."""
+
+    def _request_pass(self) -> None:
+        # called with `_wait_condition` held
+        if not self._scheduled:
+            return
+        if self._pass_running:
+            self._pass_requested = True
+        elif not self._pass_submitted:
+            self._cancel_timed_pass()
+            self._pass_submitted = True
+            self._scheduler.submit(self, self._run_pass)
+
+    def _schedule_pass(self, delay: float) -> None:
+        """Makes a daemon run by a scheduler call `work` within `delay` seconds, called with `_wait_condition` held."""
+        if not self._scheduled or self._pass_submitted:
+            return
+        if self._pass_running:
+            # the delay of the next call is decided once the running one returns
+            return
+
+        due = monotonic() + delay
+        if self._timed_pass is not None and self._timed_pass[0] <= due:
+            return
+        self._cancel_timed_pass()
+        self._timed_pass = due, self._scheduler.submit_after(delay, self, self._run_pass)
+
+    def _cancel_timed_pass(self) -> None:
+        if self._timed_pass is not None:
+            self._timed_pass[1].cancel()
+            self._timed_pass = None
+
+    def _run_pass(self) -> None:
+        with self._wait_condition:
+            if self._pass_running:
+                # a delayed call that could not be cancelled anymore
+                return
+            self._pass_submitted = False
+            self._pass_requested = False
+            self._timed_pass = None
+
+            if self._state == Daemon.DaemonState.PAUSING:
+                self._state = Daemon.DaemonState.PAUSED
+                self._wait_condition.notify_all()
+            if self._state in (Daemon.DaemonState.PAUSED, Daemon.DaemonState.STOPPED):
+                return
+            if self._is_interrupted() and not self._has_pending_work():
+                self._mark_stopped()
+                return
+            self._pass_running = True
+
+        try:
+            self.work()
+        except Exception:
+            logger.exception("Neptune background task %s stopped by an unexpected error", self.name)
+            with self._wait_condition:
+                self._pass_running = False
+                self._mark_stopped()
+            self._on_error()
+            raise
+
+        with self._wait_condition:
+            self._pass_running = False
+            if self._is_interrupted():
+                if not self._has_pending_work():
+                    self._mark_stopped()
+                # otherwise `wake_up` calls `work` again once there is something to do
+                return
+
+            if self._pass_requested or self._state == Daemon.DaemonState.PAUSING:
+                self._request_pass()
+                return
+
+            delay = self._next_pass_delay()
+            if delay is None:
+                return
+            if delay > 0:
+                self._schedule_pass(delay)
+            else:
+                self._request_pass()
+
+    def _mark_stopped(self) -> None:
+        self._state = Daemon.DaemonState.STOPPED
+        self._cancel_timed_pass()
+        self._wait_condition.notify_all()
+
     class ConnectionRetryWrapper:
         INITIAL_RETRY_BACKOFF = 2
         MAX_RETRY_BACKOFF = 120
@@ -135,6 +294,10 @@ class Daemon(threading.Thread):
                         else:
                             self_.last_backoff_time = min(self_.last_backoff_time * 2, self.MAX_RETRY_BACKOFF)
 
+                        if self_._scheduler is not None:
+                            # a shared worker must not wait, the daemon retries after `last_backoff_time` itself
+                            raise
+
                         with self_._wait_condition:
                             self_._wait_condition.wait(self_.last_backoff_time)
                     except Exception:
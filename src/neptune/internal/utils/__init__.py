@@ -29,6 +29,7 @@ __all__ = [
     "verify_collection_type",
     "verify_optional_callable",
     "is_collection",
+    "is_numeric_array",
     "base64_encode",
     "base64_decode",
     "get_absolute_paths",
@@ -40,6 +41,7 @@ __all__ = [
 
 import base64
 import os
+from array import array
 from glob import glob
 from io import IOBase
 from typing import (
@@ -136,9 +138,11 @@ def get_type_name(_type: Union[type, tuple]):
 
 
 def verify_collection_type(var_name: str, var, expected_type: Union[type, tuple]):
-    verify_type(var_name, var, (list, set, tuple))
+    verify_type(var_name, var, (list, set, tuple, range))
     for value in var:
-        verify_type("elements of collection '{}'".format(var_name), value, expected_type)
+        # the message is only built for an element that fails the check
+        if not isinstance(value, expected_type) or isinstance(value, IOBase):
+            verify_type("elements of collection '{}'".format(var_name), value, expected_type)
 
 
 def verify_optional_callable(var_name: str, var):
@@ -147,7 +151,13 @@ def verify_optional_callable(var_name: str, var):
 
 
 def is_collection(var) -> bool:
-    return isinstance(var, (list, set, tuple))
+    return isinstance(var, (list, set, tuple, range))
+
+
+def is_numeric_array(var) -> bool:
+    """Checks for `array.array` and NumPy arrays, without importing NumPy."""
+    var_type = type(var)
+    return isinstance(var, array) or (var_type.__module__ == "numpy" and var_type.__name__ == "ndarray")
 
 
 def base64_encode(data: bytes) -> str:
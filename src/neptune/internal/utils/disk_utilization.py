@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["ensure_disk_not_overutilize"]
+__all__ = ["ensure_disk_not_overutilize", "DiskUtilizationMonitor"]
 
 
 import os
@@ -22,6 +22,7 @@ from abc import (
     abstractmethod,
 )
 from functools import wraps
+from time import monotonic
 from typing import (
     Any,
     Callable,
@@ -42,6 +43,11 @@ from neptune.internal.warnings import (
     warn_once,
 )
 
+# Utilization is sampled at most this often, checks in between use the cached value
+DISK_UTILIZATION_SAMPLE_INTERVAL_SECONDS = 1.0
+# Once the limit is reached, utilization has to drop this many percentage points below it to resume saving
+DISK_UTILIZATION_HYSTERESIS_PERCENT = 1.0
+
 
 def get_neptune_data_directory() -> str:
     return os.getenv("NEPTUNE_DATA_DIRECTORY", NEPTUNE_DATA_DIRECTORY)
@@ -78,36 +84,86 @@ def get_max_disk_utilization_from_env() -> Optional[float]:
         return None
 
 
+class DiskUtilizationMonitor:
+    """Keeps the last sampled disk utilization and whether it exceeds the limit.
+
+    The limit counts as exceeded from the moment utilization reaches it until it drops `hysteresis` percentage
+    points below it, so saving does not flap on and off around the limit.
+    """
+
+    def __init__(
+        self,
+        max_disk_utilization: float,
+        sample_interval: float = DISK_UTILIZATION_SAMPLE_INTERVAL_SECONDS,
+        hysteresis: float = DISK_UTILIZATION_HYSTERESIS_PERCENT,
+    ) -> None:
+        self._max_disk_utilization = max_disk_utilization
+        self._sample_interval = sample_interval
+        self._hysteresis = hysteresis
+        self._utilization: Optional[float] = None
+        self._sampled_at: Optional[float] = None
+        self._exceeded: bool = False
+
+    @property
+    def is_exceeded(self) -> bool:
+        return self._exceeded
+
+    def utilization(self) -> Optional[float]:
+        """Returns the cached utilization, sampling it again if it is older than the sample interval."""
+        now = monotonic()
+        if self._sampled_at is None or now - self._sampled_at >= self._sample_interval:
+            self._sample(now)
+        return self._utilization
+
+    def _sample(self, now: float) -> None:
+        utilization = get_disk_utilization_percent()
+        self._sampled_at = now
+        self._utilization = utilization
+        if utilization is None:
+            return
+
+        if self._exceeded:
+            self._exceeded = utilization >= self._max_disk_utilization - self._hysteresis
+        else:
+            self._exceeded = utilization >= self._max_disk_utilization
+
+
 class DiskUtilizationErrorHandlerTemplate(ABC):
-    def __init__(self, max_disk_utilization: Optional[float], func: Callable[..., None], *args: Any, **kwargs: Any):
+    def __init__(
+        self,
+        max_disk_utilization: Optional[float],
+        func: Callable[..., None],
+        monitor: Optional[DiskUtilizationMonitor] = None,
+    ):
         self.max_disk_utilization = max_disk_utilization
         self.func = func
-        self.args = args
-        self.kwargs = kwargs
+        self.monitor = monitor
+        if self.monitor is None and max_disk_utilization:
+            self.monitor = DiskUtilizationMonitor(max_disk_utilization)
 
     @abstractmethod
-    def handle_limit_not_set(self) -> None: ...  # pragma: no cover
+    def handle_limit_not_set(self, *args: Any, **kwargs: Any) -> None: ...  # pragma: no cover
 
     @abstractmethod
-    def handle_utilization_calculation_error(self) -> None: ...  # pragma: no cover
+    def handle_utilization_calculation_error(self, *args: Any, **kwargs: Any) -> None: ...  # pragma: no cover
 
     @abstractmethod
-    def handle_limit_not_exceeded(self) -> None: ...  # pragma: no cover
+    def handle_limit_not_exceeded(self, *args: Any, **kwargs: Any) -> None: ...  # pragma: no cover
 
     @abstractmethod
     def handle_limit_exceeded(self, current_utilization: float) -> None: ...  # pragma: no cover
 
-    def run(self) -> None:
-        if not self.max_disk_utilization:
-            return self.handle_limit_not_set()
+    def run(self, *args: Any, **kwargs: Any) -> None:
+        if not self.max_disk_utilization or self.monitor is None:
+            return self.handle_limit_not_set(*args, **kwargs)
 
-        current_utilization = get_disk_utilization_percent()
+        current_utilization = self.monitor.utilization()
 
         if current_utilization is None:
-            return self.handle_utilization_calculation_error()
+            return self.handle_utilization_calculation_error(*args, **kwargs)
 
-        if current_utilization < self.max_disk_utilization:
-            return self.handle_limit_not_exceeded()
+        if not self.monitor.is_exceeded:
+            return self.handle_limit_not_exceeded(*args, **kwargs)
 
         self.handle_limit_exceeded(current_utilization)
 
@@ -115,21 +171,21 @@ class DiskUtilizationErrorHandlerTemplate(ABC):
 class NonRaisingErrorHandler(DiskUtilizationErrorHandlerTemplate):
     DISK_ISSUE_MSG = "Encountered disk issue. Neptune will not save your data."
 
-    def handle_limit_not_set(self) -> None:
+    def handle_limit_not_set(self, *args: Any, **kwargs: Any) -> None:
         try:
-            return self.func(*self.args, **self.kwargs)
+            return self.func(*args, **kwargs)
         except (OSError, Error):
             warn_once(self.DISK_ISSUE_MSG, exception=NeptuneWarning)
 
-    def handle_utilization_calculation_error(self) -> None:
+    def handle_utilization_calculation_error(self, *args: Any, **kwargs: Any) -> None:
         try:
-            return self.func(*self.args, **self.kwargs)
+            return self.func(*args, **kwargs)
         except (OSError, Error):
             warn_once(self.DISK_ISSUE_MSG, exception=NeptuneWarning)
 
-    def handle_limit_not_exceeded(self) -> None:
+    def handle_limit_not_exceeded(self, *args: Any, **kwargs: Any) -> None:
         try:
-            return self.func(*self.args, **self.kwargs)
+            return self.func(*args, **kwargs)
         except (OSError, Error):
             warn_once(self.DISK_ISSUE_MSG, exception=NeptuneWarning)
 
@@ -142,14 +198,14 @@ class NonRaisingErrorHandler(DiskUtilizationErrorHandlerTemplate):
 
 
 class RaisingErrorHandler(DiskUtilizationErrorHandlerTemplate):
-    def handle_limit_not_set(self) -> None:
-        return self.func(*self.args, **self.kwargs)
+    def handle_limit_not_set(self, *args: Any, **kwargs: Any) -> None:
+        return self.func(*args, **kwargs)
 
-    def handle_utilization_calculation_error(self) -> None:
-        return self.func(*self.args, **self.kwargs)
+    def handle_utilization_calculation_error(self, *args: Any, **kwargs: Any) -> None:
+        return self.func(*args, **kwargs)
 
-    def handle_limit_not_exceeded(self) -> None:
-        return self.func(*self.args, **self.kwargs)
+    def handle_limit_not_exceeded(self, *args: Any, **kwargs: Any) -> None:
+        return self.func(*args, **kwargs)
 
     def handle_limit_exceeded(self, current_utilization: float) -> None:
         if isinstance(self.max_disk_utilization, float):
@@ -164,10 +220,11 @@ def ensure_disk_not_overutilize(func: Callable[..., None]) -> Callable[..., None
     raising_on_disk_issue = os.getenv(NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_EXCEEDED, "True").lower() in ("true", "t", "1")
     max_disk_utilization = get_max_disk_utilization_from_env()
 
-    error_handler = RaisingErrorHandler if raising_on_disk_issue else NonRaisingErrorHandler
+    error_handler_class = RaisingErrorHandler if raising_on_disk_issue else NonRaisingErrorHandler
+    error_handler = error_handler_class(max_disk_utilization, func)
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> None:
-        error_handler(max_disk_utilization, func, *args, **kwargs).run()
+        error_handler.run(*args, **kwargs)
 
     return wrapper
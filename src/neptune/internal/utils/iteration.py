@@ -13,13 +13,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["get_batches"]
+__all__ = ["get_batches", "get_batches_by_size"]
 
 from itertools import (
     chain,
     islice,
 )
 from typing import (
+    Callable,
     Iterable,
     List,
     TypeVar,
@@ -41,3 +42,25 @@ def get_batches(iterable: Iterable[T], *, batch_size: int) -> Iterable[List[T]]:
             # but if there's nothing to return in last slice, close generator instead of returning empty list
             return
         yield list(chain([first_from_slice], slices))
+
+
+def get_batches_by_size(
+    iterable: Iterable[T], *, batch_size: int, batch_size_bytes: int, size_of: Callable[[T], int]
+) -> Iterable[List[T]]:
+    """Splits into batches of at most `batch_size` elements of `batch_size_bytes` in total.
+
+    An element larger than `batch_size_bytes` gets a batch of its own.
+    """
+    assert batch_size > 0
+
+    batch: List[T] = []
+    batch_bytes = 0
+    for item in iterable:
+        item_size = size_of(item)
+        if batch and (len(batch) >= batch_size or batch_bytes + item_size > batch_size_bytes):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(item)
+        batch_bytes += item_size
+    if batch:
+        yield batch
@@ -33,8 +33,11 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
+    Mapping,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -43,6 +46,10 @@ from neptune.attributes import create_attribute_from_type
 from neptune.attributes.attribute import Attribute
 from neptune.attributes.namespace import Namespace as NamespaceAttr
 from neptune.attributes.namespace import NamespaceBuilder
+from neptune.attributes.series.float_series import FloatSeries
+from neptune.attributes.series.series import Series
+from neptune.core.operation_processors.async_operation_processor import AsyncOperationProcessor
+from neptune.core.operation_processors.async_operation_processor.background_drain import DrainMode
 from neptune.core.operation_processors.factory import get_operation_processor
 from neptune.core.operation_processors.lazy_operation_processor_wrapper import LazyOperationProcessorWrapper
 from neptune.core.operation_processors.operation_processor import OperationProcessor
@@ -56,8 +63,14 @@ from neptune.exceptions import (
     MetadataInconsistency,
     NeptuneException,
     NeptuneUnsupportedFunctionalityException,
+    TypeDoesNotSupportAttributeException,
 )
-from neptune.handler import Handler
+from neptune.handler import (
+    ExtendUtils,
+    Handler,
+    validate_path_not_protected,
+)
+from neptune.internal.backends.factory import get_ingest_backend
 from neptune.internal.backgroud_job_list import BackgroundJobList
 from neptune.internal.background_job import BackgroundJob
 from neptune.internal.container_structure import ContainerStructure
@@ -71,6 +84,10 @@ from neptune.internal.parameters import (
 from neptune.internal.signals_processing.background_job import CallbacksMonitor
 from neptune.internal.state import ContainerState
 from neptune.internal.utils import (
+    is_dict_like,
+    is_float_like,
+    is_string,
+    is_stringify_value,
     verify_optional_callable,
     verify_type,
 )
@@ -82,18 +99,36 @@ from neptune.internal.utils.logger import (
     get_disabled_logger,
     get_logger,
 )
-from neptune.internal.utils.paths import parse_path
+from neptune.internal.utils.paths import (
+    join_paths,
+    parse_path,
+    path_to_str,
+)
 from neptune.internal.utils.uncaught_exception_handler import instance as uncaught_exception_handler
 from neptune.internal.utils.utils import reset_internal_ssl_state
 from neptune.internal.value_to_attribute_visitor import ValueToAttributeVisitor
-from neptune.internal.warnings import warn_about_unsupported_type
+from neptune.internal.warnings import (
+    NeptuneWarning,
+    warn_about_unsupported_type,
+    warn_once,
+)
 from neptune.objects.mode import Mode
 from neptune.objects.utils import (
     ensure_not_stopped,
     temporarily_disabled,
 )
 from neptune.objects.with_backend import WithBackend
-from neptune.types.type_casting import cast_value
+from neptune.types.namespace import Namespace as NamespaceVal
+from neptune.types.series.downsampling import (
+    DownsamplingPolicy,
+    match_downsampling_policy,
+)
+from neptune.types.series.float_series import FloatSeries as FloatSeriesVal
+from neptune.types.series.series import Series as SeriesVal
+from neptune.types.type_casting import (
+    cast_value,
+    cast_value_for_extend,
+)
 from neptune.utils import stop_synchronization_callback
 
 if TYPE_CHECKING:
@@ -118,6 +153,8 @@ class NeptuneObject(WithBackend, ABC):
         async_lag_threshold: float = ASYNC_LAG_THRESHOLD,
         async_no_progress_callback: Optional[NeptuneObjectCallback] = None,
         async_no_progress_threshold: float = ASYNC_NO_PROGRESS_THRESHOLD,
+        async_max_delay: Optional[float] = None,
+        downsampling: Optional[Dict[str, DownsamplingPolicy]] = None,
     ):
         verify_type("custom_id", custom_id, (str, type(None)))
         verify_type("flush_period", flush_period, (int, float))
@@ -125,6 +162,11 @@ class NeptuneObject(WithBackend, ABC):
         verify_optional_callable("async_lag_callback", async_lag_callback)
         verify_type("async_no_progress_threshold", async_no_progress_threshold, (int, float))
         verify_optional_callable("async_no_progress_callback", async_no_progress_callback)
+        verify_type("async_max_delay", async_max_delay, (int, float, type(None)))
+        verify_type("downsampling", downsampling, (dict, type(None)))
+        for pattern, policy in (downsampling or {}).items():
+            verify_type("downsampling pattern", pattern, str)
+            verify_type(f"downsampling policy of '{pattern}'", policy, DownsamplingPolicy)
 
         if custom_run_id_exceeds_length(custom_id):
             raise NeptuneException(
@@ -143,6 +185,7 @@ class NeptuneObject(WithBackend, ABC):
         self._logger: logging.Logger = get_logger()
 
         self._custom_id: str = custom_id or str(uuid.uuid4())
+        self._downsampling_rules: Dict[str, DownsamplingPolicy] = dict(downsampling or {})
 
         self._async_lag_threshold = async_lag_threshold
         self._async_lag_callback = NeptuneObject._get_callback(
@@ -162,6 +205,9 @@ class NeptuneObject(WithBackend, ABC):
             lock=self._lock,
             flush_period=flush_period,
             queue=self._signals_queue,
+            ingest_backend=get_ingest_backend(self._backend) if mode == Mode.ASYNC else None,
+            project=f"{self._workspace}/{self._project_name}",
+            max_delay=async_max_delay,
         )
 
         self._async_create_run()
@@ -349,6 +395,78 @@ class NeptuneObject(WithBackend, ABC):
         """
         self._get_root_handler().assign(value, wait=wait)
 
+    @ensure_not_stopped
+    def log_step(
+        self,
+        step: Union[float, int],
+        metrics: Mapping[str, Any],
+        *,
+        timestamp: Optional[Union[float, int]] = None,
+        wait: bool = False,
+    ) -> None:
+        """Appends the values of several series logged at the same step.
+
+        Does the same as calling `append()` for every entry of `metrics`, but in one pass: the object is locked once
+        and the operations of all the series are enqueued together. Every path is checked before any field is
+        created, so an invalid entry leaves the object unchanged.
+
+        Args:
+            step: Index of the values being appended. Must be strictly increasing in every series.
+            metrics: Values to append, keyed by the paths of the series fields. Values that aren't numbers
+                are appended the way `append()` does, e.g. strings to a `StringSeries`.
+            timestamp: Time of the values, in Unix time format. If `None`, the current time is used.
+            wait: If `True`, Neptune waits to send all tracked metadata to the server before returning.
+
+        Examples:
+            >>> import neptune
+            >>> run = neptune.init_run()
+            >>> for step in range(n_steps):
+            ...     loss, accuracy = train_step()
+            ...     run.log_step(step, {"train/loss": loss, "train/accuracy": accuracy})
+        """
+        verify_type("step", step, (int, float))
+        verify_type("metrics", metrics, Mapping)
+        verify_type("timestamp", timestamp, (int, float, type(None)))
+
+        steps = [step]
+        timestamps = [time.time() if timestamp is None else timestamp]
+        with self._lock:
+            # (path, attribute, value, whether the attribute has to be created) of every entry
+            entries: List[Tuple[str, Series, SeriesVal, bool]] = []
+            for path, value in _iterate_metrics(metrics):
+                validate_path_not_protected(path, self[path])
+                parsed_path = parse_path(path)
+                attribute = self._structure.get(parsed_path)
+                if attribute is not None and not isinstance(attribute, Series):
+                    raise TypeDoesNotSupportAttributeException(type_=type(attribute), attribute="append")
+
+                is_new = attribute is None
+                if isinstance(attribute, (FloatSeries, type(None))) and not is_string(value) and is_float_like(value):
+                    attribute = attribute or FloatSeries(self, parsed_path)
+                    series_value = FloatSeriesVal([value], steps=steps, timestamps=timestamps)
+                else:
+                    values = ExtendUtils.transform_to_extend_format(value)
+                    if attribute is None:
+                        neptune_value = cast_value_for_extend(values)
+                        if neptune_value is None:
+                            warn_about_unsupported_type(type_str=str(type(value)))
+                            continue
+                        attribute = ValueToAttributeVisitor(self, parsed_path).visit(neptune_value)
+                    if is_stringify_value(values):
+                        values = attribute._handle_stringified_value(values)
+                    series_value = attribute._data_to_value(values, steps=steps, timestamps=timestamps)
+                entries.append((path, attribute, series_value, is_new))
+
+            _verify_paths_do_not_overlap([path for path, *_ in entries])
+
+            operations = []
+            for path, attribute, series_value, is_new in entries:
+                if is_new:
+                    self.set_attribute(path, attribute)
+                operations.extend(attribute._get_log_operations_from_value(series_value))
+
+            self._op_processor.enqueue_operations(operations, wait=wait)
+
     @ensure_not_stopped
     def fetch(self) -> dict:
         """Fetch values of all non-File Atom fields as a dictionary.
@@ -387,7 +505,7 @@ class NeptuneObject(WithBackend, ABC):
         self._bg_job.start(self)
         self._state = ContainerState.STARTED
 
-    def stop(self, *, seconds: Optional[Union[float, int]] = None) -> None:
+    def stop(self, *, seconds: Optional[Union[float, int]] = None, drain: str = DrainMode.WAIT.value) -> None:
         """Stops the connection and ends the synchronization thread.
 
         You should stop any initialized runs or other objects when the connection to them is no longer needed.
@@ -403,6 +521,10 @@ class NeptuneObject(WithBackend, ABC):
         Args:
             seconds: Seconds to wait for all metadata tracking calls to finish before stopping the object.
                 If `None`, waits for all tracking calls to finish.
+            drain: What to do with metadata not synchronized yet in asynchronous mode.
+                "wait" (default) waits for it, at most for `seconds`.
+                "background" returns right away and leaves the upload to a detached process
+                that outlives the script. Not synchronized metadata stays on disk if that process fails.
 
         Example:
             >>> import neptune
@@ -417,6 +539,8 @@ class NeptuneObject(WithBackend, ABC):
                 https://docs.neptune.ai/api/universal/#stop
         """
         verify_type("seconds", seconds, (float, int, type(None)))
+        verify_type("drain", drain, str)
+        drain_mode = DrainMode(drain)
         if self._state != ContainerState.STARTED:
             return
 
@@ -424,6 +548,8 @@ class NeptuneObject(WithBackend, ABC):
             self._forking_cond.wait_for(lambda: not self._forking_state)
             self._state = ContainerState.STOPPING
 
+        self._flush_downsampled_series()
+
         ts = time.time()
         self._logger.info("Shutting down background jobs, please wait a moment...")
         self._bg_job.stop()
@@ -431,13 +557,29 @@ class NeptuneObject(WithBackend, ABC):
         self._logger.info("Done!")
 
         sec_left = None if seconds is None else seconds - (time.time() - ts)
-        self._op_processor.stop(sec_left)
+        if isinstance(self._op_processor, AsyncOperationProcessor):
+            self._op_processor.stop(sec_left, drain=drain_mode)
+        else:
+            if drain_mode == DrainMode.BACKGROUND:
+                warn_once(
+                    "Metadata can be synchronized in the background only in asynchronous mode and not in forked"
+                    " processes, waiting for it to be synchronized instead.",
+                    exception=NeptuneWarning,
+                )
+            self._op_processor.stop(sec_left)
         self.close()
 
         with self._forking_cond:
             self._state = ContainerState.STOPPED
             self._forking_cond.notify_all()
 
+    def _flush_downsampled_series(self) -> None:
+        with self._lock:
+            for path in self._structure.iterate_subpaths([]):
+                attribute = self.get_attribute(path)
+                if isinstance(attribute, FloatSeries):
+                    attribute._flush_downsampling()
+
     def get_state(self) -> str:
         """Returns the current state of the container as a string.
 
@@ -518,6 +660,10 @@ class NeptuneObject(WithBackend, ABC):
 
     def set_attribute(self, path: str, attribute: Attribute) -> Optional[Attribute]:
         with self._lock:
+            if isinstance(attribute, FloatSeries):
+                policy = match_downsampling_policy(self._downsampling_rules, path)
+                if policy is not None:
+                    attribute._set_downsampling(policy)
             return self._structure.set(parse_path(path), attribute)
 
     def exists(self, path: str) -> bool:
@@ -634,3 +780,28 @@ class NeptuneObject(WithBackend, ABC):
     def get_root_object(self) -> "NeptuneObject":
         """Returns the same Neptune object."""
         return self
+
+
+def _iterate_metrics(metrics: Mapping[str, Any], prefix: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+    """Yields the `(path, value)` pairs of `metrics`, with the paths of nested dictionaries joined."""
+    for path, value in metrics.items():
+        verify_type("path", path, str)
+        if prefix is not None:
+            path = join_paths(prefix, path)
+        if isinstance(value, NamespaceVal):
+            yield from _iterate_metrics(value.value, path)
+        elif is_dict_like(value):
+            yield from _iterate_metrics(value, path)
+        else:
+            yield path, value
+
+
+def _verify_paths_do_not_overlap(paths: List[str]) -> None:
+    # a path sorts right before the paths it is a namespace of
+    parsed_paths = sorted(tuple(parse_path(path)) for path in paths)
+    for path, next_path in zip(parsed_paths, parsed_paths[1:]):
+        if next_path[: len(path)] == path:
+            raise MetadataInconsistency(
+                "Cannot access path '{}': '{}' is already defined as an attribute, "
+                "not a namespace".format(path_to_str(list(next_path)), path_to_str(list(path)))
+            )
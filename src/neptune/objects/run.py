@@ -21,6 +21,7 @@ import uuid
 from platform import node as get_hostname
 from typing import (
     TYPE_CHECKING,
+    Dict,
     List,
     Optional,
     Union,
@@ -80,6 +81,7 @@ from neptune.objects.neptune_object import (
     temporarily_disabled,
 )
 from neptune.types import StringSeries
+from neptune.types.series.downsampling import DownsamplingPolicy
 
 if TYPE_CHECKING:
     from neptune.internal.background_job import BackgroundJob
@@ -180,6 +182,15 @@ class Run(NeptuneObject):
             object was initialized. If a no-progress callback (default callback enabled via environment variable or
             custom callback passed to the `async_no_progress_callback` argument) is enabled, the callback is called
             when this duration is exceeded.
+        async_max_delay: In the asynchronous (default) connection mode, the longest time (in seconds) a logged
+            operation waits before being sent, even if there is too little data to fill a batch.
+            If left empty, the `NEPTUNE_ASYNC_MAX_DELAY` environment variable is used, and if it's not set either,
+            data is sent at least every `flush_period`.
+        downsampling: Downsampling policies of float series, keyed by shell-style path patterns such as
+            `"train/*/loss"`, where `*` also matches `/`. A series created at a matching path only sends
+            the values kept by the policy of the first matching pattern, for example
+            `{"train/*": EveryNth(10)}` (see `neptune.types.series`).
+            Points held back by a policy are sent when the run is stopped.
 
     Returns:
         Run object that is used to manage the tracked run and log metadata to it.
@@ -280,6 +291,8 @@ class Run(NeptuneObject):
         async_lag_threshold: float = ASYNC_LAG_THRESHOLD,
         async_no_progress_callback: Optional[NeptuneObjectCallback] = None,
         async_no_progress_threshold: float = ASYNC_NO_PROGRESS_THRESHOLD,
+        async_max_delay: Optional[float] = None,
+        downsampling: Optional[Dict[str, DownsamplingPolicy]] = None,
         **kwargs,
     ):
         check_for_extra_kwargs("Run", kwargs)
@@ -366,6 +379,8 @@ class Run(NeptuneObject):
             async_lag_threshold=async_lag_threshold,
             async_no_progress_callback=async_no_progress_callback,
             async_no_progress_threshold=async_no_progress_threshold,
+            async_max_delay=async_max_delay,
+            downsampling=downsampling,
         )
 
     @temporarily_disabled
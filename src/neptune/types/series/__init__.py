@@ -17,7 +17,17 @@
 __all__ = [
     "FloatSeries",
     "StringSeries",
+    "DownsamplingPolicy",
+    "EveryNth",
+    "LastPerWindow",
+    "AggregatePerSteps",
 ]
 
+from .downsampling import (
+    AggregatePerSteps,
+    DownsamplingPolicy,
+    EveryNth,
+    LastPerWindow,
+)
 from .float_series import FloatSeries
 from .string_series import StringSeries
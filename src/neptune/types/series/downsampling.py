@@ -0,0 +1,192 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "DownsamplingPolicy",
+    "EveryNth",
+    "LastPerWindow",
+    "AggregatePerSteps",
+    "Aggregation",
+    "match_downsampling_policy",
+]
+
+import abc
+import math
+from enum import Enum
+from fnmatch import fnmatchcase
+from typing import (
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from neptune.internal.utils import verify_type
+
+# value, step, timestamp
+Point = Tuple[float, Optional[float], float]
+
+
+class DownsamplingPolicy(abc.ABC):
+    """Decides point by point which values of a float series are sent to Neptune.
+
+    A policy is stateful. The attribute it is applied to works on its own copy, so a single instance
+    can be used for many series.
+    """
+
+    @abc.abstractmethod
+    def add(self, value: float, step: Optional[float], timestamp: float) -> List[Point]:
+        """Takes the next point of the series and returns the points to be sent, if any."""
+        ...
+
+    def flush(self) -> List[Point]:
+        """Returns the points held back by the policy, called when the series is finished."""
+        return []
+
+    @abc.abstractmethod
+    def reset(self) -> None:
+        """Forgets the points seen so far, called when the series is cleared."""
+        ...
+
+
+class EveryNth(DownsamplingPolicy):
+    """Keeps the first point and every `n`-th one after it."""
+
+    def __init__(self, n: int) -> None:
+        verify_type("n", n, int)
+        if n < 1:
+            raise ValueError("n must be a positive integer")
+        self._n = n
+        self._count = 0
+
+    def add(self, value: float, step: Optional[float], timestamp: float) -> List[Point]:
+        keep = self._count % self._n == 0
+        self._count += 1
+        return [(value, step, timestamp)] if keep else []
+
+    def reset(self) -> None:
+        self._count = 0
+
+    def __repr__(self) -> str:
+        return f"EveryNth(n={self._n})"
+
+
+class LastPerWindow(DownsamplingPolicy):
+    """Keeps the last point logged in every time window of `seconds`, based on the timestamps of the points.
+
+    The point of a window is sent once a point from a later window arrives.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        verify_type("seconds", seconds, (int, float))
+        if seconds <= 0:
+            raise ValueError("seconds must be positive")
+        self._seconds = seconds
+        self._window: Optional[float] = None
+        self._pending: Optional[Point] = None
+
+    def add(self, value: float, step: Optional[float], timestamp: float) -> List[Point]:
+        window = timestamp // self._seconds
+        emitted = self.flush() if window != self._window else []
+        self._window = window
+        self._pending = (value, step, timestamp)
+        return emitted
+
+    def flush(self) -> List[Point]:
+        pending, self._pending = self._pending, None
+        return [pending] if pending is not None else []
+
+    def reset(self) -> None:
+        self._window = None
+        self._pending = None
+
+    def __repr__(self) -> str:
+        return f"LastPerWindow(seconds={self._seconds})"
+
+
+class Aggregation(str, Enum):
+    MIN = "min"
+    MAX = "max"
+    MEAN = "mean"
+
+
+class AggregatePerSteps(DownsamplingPolicy):
+    """Sends one aggregated point per `k` steps, with the step and the timestamp of the last point aggregated.
+
+    Points logged without a step are grouped by `k` consecutive points instead.
+    The point of a group is sent once a point from a later group arrives.
+    """
+
+    def __init__(self, k: int, aggregation: str = Aggregation.MEAN.value) -> None:
+        verify_type("k", k, int)
+        verify_type("aggregation", aggregation, str)
+        if k < 1:
+            raise ValueError("k must be a positive integer")
+        self._k = k
+        self._aggregation = Aggregation(aggregation)
+        self._count = 0
+        self._group: Optional[int] = None
+        self._size = 0
+        self._min = self._max = self._sum = 0.0
+        self._last_step: Optional[float] = None
+        self._last_timestamp = 0.0
+
+    def add(self, value: float, step: Optional[float], timestamp: float) -> List[Point]:
+        group = math.floor(step / self._k) if step is not None else self._count // self._k
+        self._count += 1
+
+        emitted = self.flush() if group != self._group else []
+        if self._size == 0:
+            self._group = group
+            self._min = self._max = value
+            self._sum = 0.0
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+        self._sum += value
+        self._size += 1
+        self._last_step, self._last_timestamp = step, timestamp
+        return emitted
+
+    def flush(self) -> List[Point]:
+        if self._size == 0:
+            return []
+
+        if self._aggregation == Aggregation.MIN:
+            value = self._min
+        elif self._aggregation == Aggregation.MAX:
+            value = self._max
+        else:
+            value = self._sum / self._size
+        self._size = 0
+        return [(value, self._last_step, self._last_timestamp)]
+
+    def reset(self) -> None:
+        self._count = 0
+        self._group = None
+        self._size = 0
+
+    def __repr__(self) -> str:
+        return f"AggregatePerSteps(k={self._k}, aggregation={self._aggregation.value!r})"
+
+
+def match_downsampling_policy(rules: Mapping[str, DownsamplingPolicy], path: str) -> Optional[DownsamplingPolicy]:
+    """Returns the policy of the first rule whose shell-style pattern matches `path`.
+
+    `*` also matches `/`, so `"train/*"` applies to every series in the `train` namespace and below it.
+    """
+    for pattern, policy in rules.items():
+        if fnmatchcase(path, pattern):
+            return policy
+    return None
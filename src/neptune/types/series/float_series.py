@@ -15,10 +15,13 @@
 #
 __all__ = ["FloatSeries"]
 
+import math
 import time
-from itertools import cycle
+from array import array
 from typing import (
     TYPE_CHECKING,
+    Any,
+    List,
     Optional,
     Sequence,
     TypeVar,
@@ -26,8 +29,10 @@ from typing import (
 )
 
 from neptune.internal.types.stringify_value import extract_if_stringify_value
-from neptune.internal.types.utils import is_unsupported_float
-from neptune.internal.utils import is_collection
+from neptune.internal.utils import (
+    is_collection,
+    is_numeric_array,
+)
 from neptune.internal.warnings import (
     NeptuneUnsupportedValue,
     warn_once,
@@ -35,12 +40,23 @@ from neptune.internal.warnings import (
 from neptune.types.series.series import Series
 
 if TYPE_CHECKING:
+    import numpy
+
     from neptune.types.value_visitor import ValueVisitor
 
 Ret = TypeVar("Ret")
 
+# contiguous buffer of doubles, values of a column are only boxed into Python floats when read one by one
+FloatColumn = Union["array[float]", "numpy.ndarray"]
+
 
 class FloatSeries(Series):
+    """Float values with their steps and timestamps, kept column by column.
+
+    NumPy arrays and `array.array("d")` of values are stored without copying, unless they hold non-finite values,
+    which are skipped. `values`, `steps` and `timestamps` are read from the columns as lists.
+    """
+
     def __init__(
         self,
         values,
@@ -52,48 +68,59 @@ class FloatSeries(Series):
     ):
         values = extract_if_stringify_value(values)
 
-        if not is_collection(values):
+        if not is_collection(values) and not is_numeric_array(values):
             raise TypeError("`values` is not a collection")
 
-        self._values = [float(value) for value in values]
         self._min = min
         self._max = max
         self._unit = unit
 
-        if steps is None:
-            filled_steps = cycle([None])
-        else:
+        self._values: FloatColumn = _to_float_column(values)
+
+        self._steps: Optional[FloatColumn] = None
+        if steps is not None:
             assert len(values) == len(steps)
-            filled_steps = steps
+            self._steps = _to_float_column(steps)
 
         if timestamps is None:
-            filled_timestamps = cycle([time.time()])
+            self._timestamps: FloatColumn = array("d", [time.time()]) * len(self._values)
         else:
             assert len(values) == len(timestamps)
-            filled_timestamps = timestamps
+            self._timestamps = _to_float_column(timestamps)
+
+        self._skip_unsupported_values()
+
+    def _skip_unsupported_values(self) -> None:
+        supported = _finite_mask(self._values)
+        if supported is None:
+            return
 
-        clean_values, self._steps, self._timestamps = self.filter_unsupported_values(
-            values=values,
-            steps=filled_steps,
-            timestamps=filled_timestamps,
-            filter_by=self.is_unsupported_float_with_warn,
+        unsupported = next(value for value, keep in zip(self._values, supported) if not keep)
+        warn_once(
+            message=f"WARNING: A value you're trying to log (`{str(unsupported)}`) will be skipped because "
+            f"it's a non-standard float value that is not currently supported.",
+            exception=NeptuneUnsupportedValue,
         )
-        self._values = [float(value) for value in clean_values]
+        self._values = _select(self._values, supported)
+        self._timestamps = _select(self._timestamps, supported)
+        if self._steps is not None:
+            self._steps = _select(self._steps, supported)
 
     @property
-    def steps(self):
-        return self._steps
+    def steps(self) -> List[Optional[float]]:
+        return self._steps.tolist() if self._steps is not None else [None] * len(self._values)
 
     @property
-    def timestamps(self):
-        return self._timestamps
+    def timestamps(self) -> List[float]:
+        return self._timestamps.tolist()
 
     def accept(self, visitor: "ValueVisitor[Ret]") -> Ret:
         return visitor.visit_float_series(self)
 
     @property
-    def values(self):
-        return self._values
+    def values(self) -> List[float]:
+        # read from the column in one go, as Python floats
+        return self._values.tolist()
 
     @property
     def min(self):
@@ -107,25 +134,50 @@ class FloatSeries(Series):
     def unit(self):
         return self._unit
 
+    def __len__(self) -> int:
+        return len(self._values)
+
     def __str__(self):
         return "FloatSeries({})".format(str(self.values))
 
-    def is_unsupported_float_with_warn(self, value):
-        if is_unsupported_float(value):
-            warn_once(
-                message=f"WARNING: A value you're trying to log (`{str(value)}`) will be skipped because "
-                f"it's a non-standard float value that is not currently supported.",
-                exception=NeptuneUnsupportedValue,
-            )
-            return False
-        return True
-
-    def filter_unsupported_values(self, values, steps, timestamps, filter_by):
-        filtered = [
-            (value, step, timestamp) for value, step, timestamp in zip(values, steps, timestamps) if filter_by(value)
-        ]
-        return (
-            [value for value, _, _ in filtered],
-            [step for _, step, _ in filtered],
-            [timestamp for _, _, timestamp in filtered],
-        )
+
+def _is_numpy_array(value: Any) -> bool:
+    # checked by name, NumPy is imported only once it is known to be used
+    value_type = type(value)
+    return value_type.__module__ == "numpy" and value_type.__name__ == "ndarray"
+
+
+def _to_float_column(values: Any) -> FloatColumn:
+    if _is_numpy_array(values):
+        import numpy
+
+        # a view for float64 arrays, a converted copy for any other dtype
+        return numpy.asarray(values, dtype=numpy.float64).reshape(-1)
+
+    if isinstance(values, array) and values.typecode == "d":
+        return values
+
+    try:
+        return array("d", values)
+    except TypeError:
+        # e.g. numeric strings, accepted by `float` but not by `array`
+        return array("d", (float(value) for value in values))
+
+
+def _finite_mask(column: FloatColumn) -> Optional[Sequence[bool]]:
+    """Returns which values are finite, None if all of them are."""
+    if _is_numpy_array(column):
+        import numpy
+
+        mask = numpy.isfinite(column)
+        return None if mask.all() else mask
+
+    if all(map(math.isfinite, column)):
+        return None
+    return [math.isfinite(value) for value in column]
+
+
+def _select(column: FloatColumn, mask: Sequence[bool]) -> FloatColumn:
+    if _is_numpy_array(column):
+        return column[mask]  # type: ignore[index]
+    return array("d", (value for value, keep in zip(column, mask) if keep))
@@ -0,0 +1,97 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Put/get throughput of `DiskQueue` per record codec.
+
+Usage: python -m tests.performance.bench_disk_queue_codecs [number of operations]
+"""
+
+import sys
+import threading
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from neptune.core.components.queue.disk_queue import DiskQueue
+from neptune.core.components.queue.record_codec import get_record_codec
+from neptune.core.operations.operation import (
+    LogFloats,
+    Operation,
+)
+from tests.performance.utils import (
+    measure,
+    print_table,
+)
+
+
+def make_operations(count: int) -> list:
+    return [
+        LogFloats(["train", f"metric_{i % 50}"], [LogFloats.ValueType(i * 0.5, float(i // 50), 1700000000.0 + i)])
+        for i in range(count)
+    ]
+
+
+def bench_codec(codec_name: str, operations: list) -> tuple:
+    def put_all() -> int:
+        with TemporaryDirectory() as data_path:
+            with DiskQueue[Operation](
+                data_path=Path(data_path),
+                to_dict=lambda op: op.to_dict(),
+                from_dict=Operation.from_dict,
+                lock=threading.RLock(),
+                codec=get_record_codec(codec_name),
+            ) as queue:
+                for op in operations:
+                    queue.put(op)
+                queue.flush()
+                queue.ack(len(operations))
+        return len(operations)
+
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Operation](
+            data_path=Path(data_path),
+            to_dict=lambda op: op.to_dict(),
+            from_dict=Operation.from_dict,
+            lock=threading.RLock(),
+            codec=get_record_codec(codec_name),
+        ) as queue:
+            for op in operations:
+                queue.put(op)
+            queue.flush()
+            bytes_on_disk = sum(file.stat().st_size for file in Path(data_path).glob("data-*.log"))
+
+        def get_all() -> int:
+            with DiskQueue[Operation](
+                data_path=Path(data_path),
+                to_dict=lambda op: op.to_dict(),
+                from_dict=Operation.from_dict,
+                lock=threading.RLock(),
+            ) as reader:
+                while reader.get_batch(1000):
+                    pass
+            return len(operations)
+
+        get_rate = measure(get_all)
+
+    return codec_name, f"{measure(put_all):,.0f}", f"{get_rate:,.0f}", f"{bytes_on_disk / len(operations):.1f}"
+
+
+def main(count: int) -> None:
+    operations = make_operations(count)
+    rows = [bench_codec(codec_name, operations) for codec_name in ("json", "msgpack")]
+    print_table(f"DiskQueue, {count:,} LogFloats operations", ("codec", "put ops/s", "get ops/s", "bytes/op"), rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
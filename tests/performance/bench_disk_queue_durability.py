@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Put throughput of `DiskQueue` per durability policy, with single puts and with `put_batch`.
+
+Usage: python -m tests.performance.bench_disk_queue_durability [number of operations] [batch size]
+"""
+
+import sys
+import threading
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from neptune.core.components.queue.disk_queue import (
+    DiskQueue,
+    DurabilityPolicy,
+)
+from neptune.core.operations.operation import Operation
+from tests.performance.bench_disk_queue_codecs import make_operations
+from tests.performance.utils import (
+    measure,
+    print_table,
+)
+
+
+def bench_policy(durability: DurabilityPolicy, operations: list, batch_size: int) -> tuple:
+    def put_all(batched: bool) -> int:
+        with TemporaryDirectory() as data_path:
+            with DiskQueue[Operation](
+                data_path=Path(data_path),
+                to_dict=lambda op: op.to_dict(),
+                from_dict=Operation.from_dict,
+                lock=threading.RLock(),
+                durability=durability,
+            ) as queue:
+                if batched:
+                    for start in range(0, len(operations), batch_size):
+                        queue.put_batch(operations[start : start + batch_size])
+                else:
+                    for op in operations:
+                        queue.put(op)
+                queue.flush()
+                queue.ack(len(operations))
+        return len(operations)
+
+    return (
+        durability.value,
+        f"{measure(lambda: put_all(batched=False)):,.0f}",
+        f"{measure(lambda: put_all(batched=True)):,.0f}",
+    )
+
+
+def main(count: int, batch_size: int) -> None:
+    operations = make_operations(count)
+    rows = [bench_policy(durability, operations, batch_size) for durability in DurabilityPolicy]
+    print_table(
+        f"DiskQueue, {count:,} LogFloats operations",
+        ("durability", "put ops/s", f"put_batch({batch_size}) ops/s"),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 1000,
+    )
@@ -0,0 +1,64 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""End-to-end throughput of `run["m"].extend(...)` for a float series, until the values are in the queue.
+
+Usage: python -m tests.performance.bench_float_series_extend [number of values]
+"""
+
+import os
+import sys
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from neptune import init_run
+from tests.performance.utils import (
+    measure,
+    print_table,
+)
+
+
+def bench_extend(name: str, make_values, count: int) -> tuple:
+    def extend() -> int:
+        values, steps = make_values(count)
+        with init_run(
+            mode="offline", capture_hardware_metrics=False, capture_stdout=False, capture_stderr=False
+        ) as run:
+            run["m"].extend(values, steps=steps)
+            run.wait()
+        return count
+
+    return name, f"{measure(extend, repeat=1):,.0f}"
+
+
+def main(count: int) -> None:
+    cwd = os.getcwd()
+    with TemporaryDirectory() as work_dir:
+        # offline runs are stored in the working directory
+        os.chdir(work_dir)
+        try:
+            rows = [
+                bench_extend("range", lambda n: (range(n), range(n)), count),
+                bench_extend("list", lambda n: (list(map(float, range(n))), list(range(n))), count),
+                bench_extend("numpy", lambda n: (np.arange(n, dtype=np.float64), np.arange(n)), count),
+            ]
+        finally:
+            os.chdir(cwd)
+    print_table(f"FloatSeries.extend, {count:,} values", ("input", "values/s"), rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,63 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Per-call overhead of appending single values to a float series: `run[path].append()` versus a bound writer.
+
+Usage: python -m tests.performance.bench_series_append [number of values]
+"""
+
+import os
+import sys
+from tempfile import TemporaryDirectory
+
+from neptune import init_run
+from tests.performance.utils import (
+    measure,
+    print_table,
+)
+
+
+def bench_append(name: str, count: int) -> tuple:
+    def append_all() -> int:
+        with init_run(
+            mode="offline", capture_hardware_metrics=False, capture_stdout=False, capture_stderr=False
+        ) as run:
+            if name == "handler":
+                for step in range(count):
+                    run["train/loss"].append(0.5, step=step)
+            else:
+                writer = run["train/loss"].writer()
+                for step in range(count):
+                    writer.append(0.5, step=step)
+        return count
+
+    rate = measure(append_all)
+    return name, f"{rate:,.0f}", f"{1e6 / rate:.1f}"
+
+
+def main(count: int) -> None:
+    cwd = os.getcwd()
+    with TemporaryDirectory() as work_dir:
+        # offline runs are stored in the working directory
+        os.chdir(work_dir)
+        try:
+            rows = [bench_append(name, count) for name in ("handler", "writer")]
+        finally:
+            os.chdir(cwd)
+    print_table(f"FloatSeries append, {count:,} values", ("path", "values/s", "us/value"), rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
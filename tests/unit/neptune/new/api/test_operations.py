@@ -131,3 +131,31 @@ def test_run_creation():
             experiment_id="run_id",
         ),
     )
+
+
+def test_log_floats_to_protos():
+    op = LogFloats("path", [FloatValue(1, 1.0, 1), FloatValue(2, 2.0, 2.5)])
+    run_op = RunOperation("project", "run_id", op)
+
+    serialized = run_op.to_protos()
+
+    assert serialized == [
+        ingest_pb2.RunOperation(
+            project="project",
+            run_id="run_id",
+            update=UpdateRunSnapshot(
+                step=Step(whole=1, micro=0),
+                timestamp=timestamp_pb2.Timestamp(seconds=1),
+                append={"path": Value(float64=1.0)},
+            ),
+        ),
+        ingest_pb2.RunOperation(
+            project="project",
+            run_id="run_id",
+            update=UpdateRunSnapshot(
+                step=Step(whole=2, micro=500000),
+                timestamp=timestamp_pb2.Timestamp(seconds=2),
+                append={"path": Value(float64=2.0)},
+            ),
+        ),
+    ]
@@ -0,0 +1,110 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from neptune.types.series.downsampling import (
+    AggregatePerSteps,
+    EveryNth,
+    LastPerWindow,
+    match_downsampling_policy,
+)
+
+
+def _apply(policy, points):
+    return [kept for point in points for kept in policy.add(*point)] + policy.flush()
+
+
+def test_every_nth():
+    # given
+    policy = EveryNth(3)
+
+    # when
+    kept = _apply(policy, [(float(i), float(i), 100.0 + i) for i in range(8)])
+
+    # then
+    assert kept == [(0.0, 0.0, 100.0), (3.0, 3.0, 103.0), (6.0, 6.0, 106.0)]
+
+
+def test_last_per_window():
+    # given
+    policy = LastPerWindow(10)
+    points = [(1.0, 1.0, 100.0), (2.0, 2.0, 105.0), (3.0, 3.0, 112.0), (4.0, 4.0, 135.0), (5.0, 5.0, 139.0)]
+
+    # when
+    kept_before_flush = [kept for point in points for kept in policy.add(*point)]
+
+    # then
+    assert kept_before_flush == [(2.0, 2.0, 105.0), (3.0, 3.0, 112.0)]
+    assert policy.flush() == [(5.0, 5.0, 139.0)]
+    assert policy.flush() == []
+
+
+@pytest.mark.parametrize(
+    "aggregation,expected", [("min", [0.0, 4.0, 8.0]), ("max", [3.0, 7.0, 9.0]), ("mean", [1.5, 5.5, 8.5])]
+)
+def test_aggregate_per_steps(aggregation, expected):
+    # given
+    policy = AggregatePerSteps(4, aggregation)
+
+    # when
+    kept = _apply(policy, [(float(i), float(i), 100.0 + i) for i in range(10)])
+
+    # then
+    assert [value for value, _, _ in kept] == expected
+    assert [(step, ts) for _, step, ts in kept] == [(3.0, 103.0), (7.0, 107.0), (9.0, 109.0)]
+
+
+def test_aggregate_per_steps_without_steps():
+    # given
+    policy = AggregatePerSteps(2, "max")
+
+    # when
+    kept = _apply(policy, [(float(i), None, 100.0 + i) for i in range(5)])
+
+    # then
+    assert kept == [(1.0, None, 101.0), (3.0, None, 103.0), (4.0, None, 104.0)]
+
+
+def test_reset_drops_pending_points():
+    # given
+    policy = AggregatePerSteps(10)
+    policy.add(1.0, 1.0, 100.0)
+
+    # when
+    policy.reset()
+
+    # then
+    assert policy.flush() == []
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        EveryNth(0)
+    with pytest.raises(ValueError):
+        LastPerWindow(0)
+    with pytest.raises(ValueError):
+        AggregatePerSteps(5, "median")
+
+
+def test_match_downsampling_policy():
+    # given
+    train, everything = EveryNth(2), EveryNth(10)
+    rules = {"train/*": train, "*": everything}
+
+    # expect
+    assert match_downsampling_policy(rules, "train/batch/loss") is train
+    assert match_downsampling_policy(rules, "eval/loss") is everything
+    assert match_downsampling_policy({}, "eval/loss") is None
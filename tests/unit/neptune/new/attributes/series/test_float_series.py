@@ -13,15 +13,44 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from array import array
+
+import numpy
 import pytest
 from mock import (
     MagicMock,
     patch,
 )
 
-from neptune.attributes.series.float_series import FloatSeries
-from neptune.exceptions import NeptuneUnsupportedFunctionalityException
-from neptune.internal.warnings import NeptuneUnsupportedValue
+from neptune.attributes.series.float_series import (
+    FLOAT_SERIALIZED_SIZE_BYTES,
+    FloatSeries,
+)
+from neptune.attributes.series.series import (
+    SERIES_OPERATION_MAX_SIZE_BYTES,
+    SERIES_VALUE_OVERHEAD_BYTES,
+)
+from neptune.attributes.series.string_series import StringSeries
+from neptune.exceptions import (
+    InactiveRunException,
+    MetadataInconsistency,
+    NeptuneUnsupportedFunctionalityException,
+    NeptuneUserApiInputException,
+    TypeDoesNotSupportAttributeException,
+)
+from neptune.internal.operation import (
+    LogFloats,
+    LogStrings,
+)
+from neptune.internal.warnings import (
+    NeptuneUnsupportedValue,
+    warned_once,
+)
+from neptune.types.series import (
+    AggregatePerSteps,
+    EveryNth,
+)
+from neptune.types.series.float_series import FloatSeries as FloatSeriesVal
 from tests.unit.neptune.new.attributes.test_attribute_base import TestAttributeBase
 
 
@@ -39,6 +68,296 @@ class TestFloatSeries(TestAttributeBase):
             with self.assertRaises(Exception):
                 FloatSeries(MagicMock(), MagicMock()).log(value)
 
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_extend_with_arrays(self, get_operation_processor):
+        for values, steps in (
+            (numpy.array([1.5, 2.0, 3.5]), numpy.array([1, 2, 3])),
+            (array("d", [1.5, 2.0, 3.5]), array("d", [1, 2, 3])),
+        ):
+            processor = MagicMock()
+            get_operation_processor.return_value = processor
+
+            with self._exp() as exp:
+                path = self._random_path()
+                FloatSeries(exp, path).extend(values, steps=steps)
+
+                processor.enqueue_operations.assert_called_once_with(
+                    [
+                        LogFloats(
+                            path,
+                            [
+                                LogFloats.ValueType(1.5, 1.0, self._now()),
+                                LogFloats.ValueType(2.0, 2.0, self._now()),
+                                LogFloats.ValueType(3.5, 3.0, self._now()),
+                            ],
+                        ),
+                    ],
+                    wait=False,
+                )
+                logged = processor.enqueue_operations.call_args[0][0][0].values[0]
+                assert type(logged.value) is float
+                assert type(logged.step) is float
+
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_extend_splits_values_by_serialized_size(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            per_operation = SERIES_OPERATION_MAX_SIZE_BYTES // (
+                SERIES_VALUE_OVERHEAD_BYTES + FLOAT_SERIALIZED_SIZE_BYTES
+            )
+            count = 2 * per_operation + 1
+            FloatSeries(exp, self._random_path()).extend(range(count), steps=range(count))
+
+            ops = processor.enqueue_operations.call_args[0][0]
+            assert [per_operation, per_operation, 1] == [len(op.values) for op in ops]
+
+    def test_series_value_is_read_as_lists(self):
+        for values, steps in (
+            (numpy.array([1.5, 2.0]), numpy.array([1, 2])),
+            (array("d", [1.5, 2.0]), array("d", [1, 2])),
+            ([1.5, 2.0], [1, 2]),
+        ):
+            # when
+            value = FloatSeriesVal(values, steps=steps, timestamps=[10, 20])
+
+            # then
+            self.assertEqual([1.5, 2.0], value.values)
+            self.assertEqual([1.0, 2.0], value.steps)
+            self.assertEqual([10.0, 20.0], value.timestamps)
+            self.assertTrue(all(type(column) is list for column in (value.values, value.steps, value.timestamps)))
+
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_extend_skips_non_finite_values(self, get_operation_processor):
+        for values in (numpy.array([1.0, float("nan"), 3.0]), [1.0, float("inf"), 3.0]):
+            processor = MagicMock()
+            get_operation_processor.return_value = processor
+
+            with self._exp() as exp:
+                path = self._random_path()
+                with pytest.warns(NeptuneUnsupportedValue):
+                    FloatSeries(exp, path).extend(values, steps=[1, 2, 3])
+
+                processor.enqueue_operations.assert_called_once_with(
+                    [
+                        LogFloats(
+                            path,
+                            [LogFloats.ValueType(1.0, 1.0, self._now()), LogFloats.ValueType(3.0, 3.0, self._now())],
+                        ),
+                    ],
+                    wait=False,
+                )
+
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_configure_downsampling(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            # given
+            path = self._random_path()
+            var = FloatSeries(exp, path)
+            var.configure(downsampling=EveryNth(3))
+
+            # when
+            var.extend([float(i) for i in range(7)], steps=list(range(7)))
+
+            # then
+            processor.enqueue_operation.assert_not_called()
+            processor.enqueue_operations.assert_called_once_with(
+                [LogFloats(path, [LogFloats.ValueType(float(i), float(i), self._now()) for i in (0, 3, 6)])],
+                wait=False,
+            )
+
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_downsampling_rules_are_applied_and_flushed_on_stop(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            # given
+            exp._downsampling_rules = {"train/*": AggregatePerSteps(2, "mean")}
+
+            # when
+            for step in range(5):
+                exp["train/loss"].append(float(step), step=step)
+                exp["test/loss"].append(float(step), step=step)
+
+            # then
+            train_values = [
+                value.value
+                for call in processor.enqueue_operations.call_args_list
+                for op in call[0][0]
+                if op.path == ["train", "loss"]
+                for value in op.values
+            ]
+            assert train_values == [0.5, 2.5]
+
+        # and the last, partial group is sent on stop
+        op = processor.enqueue_operations.call_args_list[-1][0][0][0]
+        assert op == LogFloats(["train", "loss"], [LogFloats.ValueType(4.0, 4.0, self._now())])
+
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_log_step(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            # given
+            exp["train/acc"].append(0.25, step=1)
+            processor.enqueue_operations.reset_mock()
+
+            # when
+            exp.log_step(2, {"train/loss": 0.5, "train/acc": 1, "train/comment": "text"}, timestamp=100.0)
+
+            # then
+            assert isinstance(exp.get_attribute("train/loss"), FloatSeries)
+            assert isinstance(exp.get_attribute("train/comment"), StringSeries)
+            processor.enqueue_operations.assert_called_once_with(
+                [
+                    LogFloats(["train", "loss"], [LogFloats.ValueType(0.5, 2.0, 100.0)]),
+                    LogFloats(["train", "acc"], [LogFloats.ValueType(1.0, 2.0, 100.0)]),
+                    LogStrings(["train", "comment"], [LogStrings.ValueType("text", 2.0, 100.0)]),
+                ],
+                wait=False,
+            )
+            processor.enqueue_operation.assert_not_called()
+
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_log_step_type_error(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            for step, metrics in (
+                ("1", {"loss": 0.5}),
+                (1, [("loss", 0.5)]),
+                (1, {1: 0.5}),
+                (1, {"comment": "text", "loss": 0.5, 1: 0.5}),
+            ):
+                with self.assertRaises(TypeError):
+                    exp.log_step(step, metrics)
+
+            # then
+            self.assertIsNone(exp.get_attribute("comment"))
+            self.assertIsNone(exp.get_attribute("loss"))
+            processor.enqueue_operation.assert_not_called()
+            processor.enqueue_operations.assert_not_called()
+
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_log_step_to_field_that_is_not_a_series(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            # given
+            exp["name"] = "text"
+            processor.reset_mock()
+
+            # then
+            with self.assertRaises(TypeDoesNotSupportAttributeException):
+                exp.log_step(1, {"comment": "text", "name": 0.5})
+            self.assertIsNone(exp.get_attribute("comment"))
+            processor.enqueue_operation.assert_not_called()
+            processor.enqueue_operations.assert_not_called()
+
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_log_step_with_invalid_entry_changes_nothing(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            # given
+            exp["loss"].append(0.5, step=1)
+            processor.reset_mock()
+
+            for metrics, error in (
+                ({"a": 1.0, "a/b": 2.0}, MetadataInconsistency),
+                ({"comment": "text", "a/b": 2.0, "a": {"b": 3.0}}, MetadataInconsistency),
+                ({"comment": "text", "loss/b": 2.0}, MetadataInconsistency),
+                ({"comment": "text", "loss": "text"}, ValueError),
+            ):
+                with self.subTest(metrics=metrics):
+                    # when
+                    with self.assertRaises(error):
+                        exp.log_step(2, metrics)
+
+                    # then
+                    self.assertIsNone(exp.get_attribute("a"))
+                    self.assertIsNone(exp.get_attribute("comment"))
+                    processor.enqueue_operation.assert_not_called()
+                    processor.enqueue_operations.assert_not_called()
+
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_log_step_with_nested_metrics(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            # when
+            exp.log_step(1, {"train": {"loss": 0.5, "comment": "text"}}, timestamp=100.0)
+
+            # then
+            processor.enqueue_operations.assert_called_once_with(
+                [
+                    LogFloats(["train", "loss"], [LogFloats.ValueType(0.5, 1.0, 100.0)]),
+                    LogStrings(["train", "comment"], [LogStrings.ValueType("text", 1.0, 100.0)]),
+                ],
+                wait=False,
+            )
+
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_writer(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            # given
+            writer = exp["train/loss"].writer()
+
+            # when
+            writer.append(1, step=0)
+            writer.append(numpy.float32(0.5), step=1, timestamp=10)
+            warned_once.clear()
+            with pytest.warns(NeptuneUnsupportedValue):
+                writer.append(float("nan"), step=2)
+
+            # then
+            assert isinstance(exp.get_attribute("train/loss"), FloatSeries)
+            assert [call[0][0] for call in processor.enqueue_operation.call_args_list] == [
+                LogFloats(["train", "loss"], [LogFloats.ValueType(1.0, 0.0, self._now())]),
+                LogFloats(["train", "loss"], [LogFloats.ValueType(0.5, 1.0, 10.0)]),
+            ]
+            assert type(processor.enqueue_operation.call_args[0][0].values[0].step) is float
+
+    def test_writer_type_error(self):
+        with self._exp() as exp:
+            writer = exp["train/loss"].writer()
+            for value, step in (("0.5", 1), (None, 1), (0.5, "1"), (0.5, None), (True, 1), (0.5, False)):
+                with self.assertRaises(TypeError):
+                    writer.append(value, step=step)
+
+    def test_writer_of_stopped_run(self):
+        # given
+        with self._exp() as exp:
+            writer = exp["train/loss"].writer()
+
+        # then
+        with self.assertRaises(InactiveRunException):
+            writer.append(0.5, step=1)
+
+    def test_writer_of_field_that_is_not_a_float_series(self):
+        with self._exp() as exp:
+            # given
+            exp["name"] = "text"
+            exp["comments"].append("text", step=1)
+
+            # then
+            for path in ("name", "comments"):
+                with self.assertRaisesRegex(NeptuneUserApiInputException, "only for FloatSeries"):
+                    exp[path].writer()
+
     @pytest.mark.xfail(reason="fetch_last disabled", strict=True, raises=NeptuneUnsupportedFunctionalityException)
     def test_get(self):
         with self._exp() as exp:
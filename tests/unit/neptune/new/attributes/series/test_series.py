@@ -54,26 +54,17 @@ class TestSeries(TestAttributeBase):
                 [
                     call(ConfigFloatSeries(path, min=0, max=100, unit="%"), wait=False),
                     call(ClearFloatLog(path), wait=False),
-                    call(
-                        LogFloats(
-                            path,
-                            [
-                                LogFloats.ValueType(17, None, self._now()),
-                            ],
-                        ),
-                        wait=wait,
-                    ),
-                    call(
-                        LogFloats(
-                            path,
-                            [
-                                LogFloats.ValueType(3.6, None, self._now()),
-                            ],
-                        ),
-                        wait=wait,
-                    ),
                 ]
             )
+            processor.enqueue_operations.assert_called_once_with(
+                [
+                    LogFloats(
+                        path,
+                        [LogFloats.ValueType(17, None, self._now()), LogFloats.ValueType(3.6, None, self._now())],
+                    ),
+                ],
+                wait=wait,
+            )
 
     @patch("neptune.objects.neptune_object.get_operation_processor")
     def test_assign_empty(self, get_operation_processor):
@@ -131,7 +122,7 @@ class TestSeries(TestAttributeBase):
                 )
                 var = FloatSeries(exp, path)
                 var.log(value, wait=wait)
-                processor.enqueue_operation.assert_has_calls([call(LogFloats(path, [e]), wait=wait) for e in expected])
+                processor.enqueue_operations.assert_called_once_with([LogFloats(path, expected)], wait=wait)
 
     @patch("neptune.objects.neptune_object.get_operation_processor")
     def test_log_with_step(self, get_operation_processor):
@@ -154,7 +145,7 @@ class TestSeries(TestAttributeBase):
                 )
                 var = FloatSeries(exp, path)
                 var.log(value, step=step, wait=wait)
-                processor.enqueue_operation.assert_called_with(LogFloats(path, [expected]), wait=wait)
+                processor.enqueue_operations.assert_called_with([LogFloats(path, [expected])], wait=wait)
 
     @patch("neptune.objects.neptune_object.get_operation_processor")
     def test_log_with_timestamp(self, get_operation_processor):
@@ -174,7 +165,7 @@ class TestSeries(TestAttributeBase):
                 )
                 var = FloatSeries(exp, path)
                 var.log(value, timestamp=ts, wait=wait)
-                processor.enqueue_operation.assert_called_with(LogFloats(path, [expected]), wait=wait)
+                processor.enqueue_operations.assert_called_with([LogFloats(path, [expected])], wait=wait)
 
     @patch("neptune.objects.neptune_object.get_operation_processor")
     def test_log_value_errors(self, get_operation_processor):
@@ -19,6 +19,10 @@ from mock import (
     patch,
 )
 
+from neptune.attributes.series.series import (
+    SERIES_OPERATION_MAX_SIZE_BYTES,
+    SERIES_VALUE_OVERHEAD_BYTES,
+)
 from neptune.attributes.series.string_series import StringSeries
 from neptune.exceptions import NeptuneUnsupportedFunctionalityException
 from tests.unit.neptune.new.attributes.test_attribute_base import TestAttributeBase
@@ -32,6 +36,21 @@ class TestStringSeries(TestAttributeBase):
             with self.assertRaises(Exception):
                 StringSeries(MagicMock(), MagicMock()).assign(value)
 
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_extend_splits_values_by_encoded_size(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            # each character is escaped to 6 bytes in the queue, quotes included the value takes 6002
+            value = "ą" * 1000
+            per_operation = SERIES_OPERATION_MAX_SIZE_BYTES // (SERIES_VALUE_OVERHEAD_BYTES + 6002)
+            count = 2 * per_operation + 1
+            StringSeries(exp, self._random_path()).extend([value] * count, steps=range(count))
+
+            ops = processor.enqueue_operations.call_args[0][0]
+            assert [per_operation, per_operation, 1] == [len(op.values) for op in ops]
+
     @pytest.mark.xfail(reason="fetch_last disabled", strict=True, raises=NeptuneUnsupportedFunctionalityException)
     def test_get(self):
         with self._exp() as exp:
@@ -151,6 +151,40 @@ def test_get_batch_with_category(category_series: List[Optional[int]], expected_
                 )
 
 
+@pytest.mark.parametrize(
+    ("category_series", "max_categories_per_batch", "expected_batch_sizes"),
+    [
+        ([1, 1, 2, 2, 3, 3], 3, [6]),
+        ([1, 1, 2, 2, 3, 3], 2, [4, 2]),
+        ([1, None, 2, None, 3, 4, 4], 2, [4, 3]),
+        ([1, 2, 1, 2, 3], 2, [4, 1]),
+    ],
+)
+def test_get_batch_with_multiple_categories(
+    category_series: List[Optional[int]], max_categories_per_batch: int, expected_batch_sizes: List[int]
+):
+    with TemporaryDirectory() as data_path:
+        with AggregatingDiskQueue[Obj, int](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_categories_per_batch=max_categories_per_batch,
+        ) as queue:
+            # given
+            for i, cat in enumerate(category_series):
+                queue.put(Obj(i, str(i)), category=cat)
+
+            # when
+            queue.flush()
+            batches = [queue.get_batch(len(category_series) + 1) for _ in expected_batch_sizes]
+
+            # then
+            assert expected_batch_sizes == [len(batch) for batch in batches]
+            assert [element.obj.obj.num for batch in batches for element in batch] == list(range(len(category_series)))
+            assert queue.get_batch(len(category_series) + 1) == []
+
+
 def test_batch_limit():
     with TemporaryDirectory() as data_path:
         with AggregatingDiskQueue[Obj, int](
@@ -16,19 +16,36 @@
 import json
 import random
 import threading
+import time
 from dataclasses import dataclass
 from glob import glob
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Optional
 
-from mock import patch
-from pytest import fixture
+from mock import (
+    MagicMock,
+    patch,
+)
+from pytest import (
+    fixture,
+    mark,
+)
 
 from neptune.core.components.queue.disk_queue import (
     DiskQueue,
+    DurabilityPolicy,
     QueueElement,
 )
+from neptune.core.components.queue.record_codec import (
+    JsonRecordCodec,
+    MsgpackRecordCodec,
+)
+from neptune.core.components.queue.segment_compression import (
+    GzipCompression,
+    detect_segment_compression,
+)
+from neptune.core.components.queue.segment_index import INDEX_ENTRY
 
 
 def test_put():
@@ -221,6 +238,578 @@ def test_cleaning_up():
     assert list(Path(data_path).glob("*")) == []
 
 
+def test_msgpack_codec_multiple_files():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=300,
+            codec=MsgpackRecordCodec(),
+        ) as queue:
+            # given
+            for i in range(1, 101):
+                queue.put(Obj(i, str(i)))
+
+            # when
+            queue.flush()
+
+            # then
+            for i in range(1, 101):
+                element = queue.get()
+                assert (element.obj, element.ver, element.at) == (Obj(i, str(i)), i, 1234 + i - 1)
+
+            # and
+            assert len(glob(data_path + "/data-*.log")) > 10
+
+
+def test_segments_are_read_without_detecting_their_format_again():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=300,
+            codec=MsgpackRecordCodec(),
+        ) as queue:
+            # given
+            for i in range(1, 101):
+                queue.put(Obj(i, str(i)))
+            queue.flush()
+
+            # when
+            with patch("neptune.core.components.queue.record_codec.open_segment") as open_segment, patch.object(
+                MsgpackRecordCodec, "__init__", side_effect=AssertionError
+            ):
+                elements = [queue.get() for _ in range(100)]
+
+            # then
+            assert [element.ver for element in elements] == list(range(1, 101))
+            open_segment.assert_not_called()
+
+
+def test_switching_codec_keeps_old_segments_readable():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            codec=JsonRecordCodec(),
+        ) as queue:
+            # given
+            for i in range(1, 6):
+                queue.put(Obj(i, str(i)))
+
+        # when
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            codec=MsgpackRecordCodec(),
+        ) as queue:
+            for i in range(6, 11):
+                queue.put(Obj(i, str(i)))
+            queue.flush()
+
+            # then
+            assert sorted(Path(file).name for file in glob(data_path + "/data-*.log")) == ["data-1.log", "data-6.log"]
+            assert [element.obj for element in queue.get_batch(10)] == [Obj(i, str(i)) for i in range(1, 11)]
+
+
+def test_offset_group_commit():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            offset_commit_every=10,
+        ) as queue:
+            # when
+            for i in range(1, 13):
+                queue.put(Obj(i, str(i)))
+
+            # then
+            assert (Path(data_path) / "last_put_version").read_text() == "10"
+            assert queue.size() == 12
+
+            # when
+            queue.flush()
+
+            # then
+            assert (Path(data_path) / "last_put_version").read_text() == "12"
+
+
+def test_recovering_last_put_version_after_crash():
+    with TemporaryDirectory() as data_path:
+        # given
+        queue = DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=300,
+            offset_commit_every=1000,
+        )
+        for i in range(1, 21):
+            queue.put(Obj(i, str(i)))
+
+        # and
+        for log_file in queue._log_files:
+            log_file.flush()
+        with open(Path(data_path) / queue._writer.file_name, "ab") as log_file:
+            log_file.write(b'{"obj": {"num": 21, "tx')
+        assert (Path(data_path) / "last_put_version").read_text() == ""
+
+        # when
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+        ) as recovered_queue:
+            # then
+            assert recovered_queue.size() == 20
+            assert (Path(data_path) / "last_put_version").read_text() == "20"
+
+        queue.close()
+
+
+@mark.parametrize("codec", [JsonRecordCodec(), MsgpackRecordCodec()])
+def test_puts_after_recovering_from_torn_record_are_readable(codec):
+    with TemporaryDirectory() as data_path:
+        # given
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            codec=codec,
+        ) as queue:
+            for i in range(3):
+                queue.put(Obj(i, str(i)))
+            file_name = queue._writer.file_name
+
+        # and
+        with open(Path(data_path) / file_name, "ab") as log_file:
+            log_file.write(codec.encode({"obj": {"num": 3, "txt": "3"}, "version": 4, "at": None})[:-5])
+
+        # when
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            codec=codec,
+        ) as queue:
+            queue.put(Obj(100, "100"))
+            queue.put(Obj(101, "101"))
+            queue.flush()
+
+            # then
+            assert [element.obj.num for element in queue.get_batch(10)] == [0, 1, 2, 100, 101]
+
+
+def test_put_batch():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=300,
+        ) as queue:
+            # given
+            queue.put(Obj(0, "0"))
+
+            # when
+            last_version = queue.put_batch(Obj(i, str(i)) for i in range(1, 101))
+            queue.flush()
+
+            # then
+            assert last_version == 101
+            assert queue.size() == 101
+            assert len(glob(data_path + "/data-*.log")) > 10
+
+            # and
+            for version in range(1, 102):
+                element = queue.get()
+                assert (element.obj, element.ver) == (Obj(version - 1, str(version - 1)), version)
+            assert queue.get() is None
+
+
+def test_put_batch_writes_offset_once():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+        ) as queue:
+            # given
+            queue._last_put_file.write = MagicMock(wraps=queue._last_put_file.write)
+
+            # when
+            queue.put_batch(Obj(i, str(i)) for i in range(10))
+            queue.put_batch([])
+
+            # then
+            queue._last_put_file.write.assert_called_once_with(10)
+
+
+@mark.parametrize(
+    "durability, durability_interval, written_on_put, fsyncs_on_put, fsyncs_on_flush",
+    [
+        (DurabilityPolicy.NONE, 0.0, False, 0, 0),
+        (DurabilityPolicy.FLUSH_PER_INTERVAL, 0.0, True, 0, 0),
+        (DurabilityPolicy.FSYNC_PER_INTERVAL, 0.0, True, 3, 1),
+        (DurabilityPolicy.FSYNC_PER_INTERVAL, 60.0, False, 0, 1),
+        (DurabilityPolicy.FSYNC_PER_BATCH, 60.0, True, 3, 1),
+    ],
+)
+@patch("neptune.core.components.queue.log_file.os.fsync")
+def test_durability_policy(fsync, durability, durability_interval, written_on_put, fsyncs_on_put, fsyncs_on_flush):
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            durability=durability,
+            durability_interval=durability_interval,
+        ) as queue:
+            # given
+            log_file = queue._writer.file_path
+            empty_size = log_file.stat().st_size
+
+            # when
+            queue.put(Obj(1, "1"))
+            queue.put(Obj(2, "2"))
+            queue.put_batch([Obj(3, "3"), Obj(4, "4")])
+
+            # then
+            assert (log_file.stat().st_size > empty_size) == written_on_put
+            assert fsync.call_count == fsyncs_on_put
+
+            # when
+            queue.flush()
+
+            # then
+            assert log_file.stat().st_size > empty_size
+            assert fsync.call_count == fsyncs_on_put + fsyncs_on_flush
+
+
+def test_next_segment_is_prepared_ahead():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=300,
+        ) as queue:
+            # given
+            version = 0
+            while not queue._next_segment_requested:
+                version = queue.put(Obj(version, str(version)))
+            deadline = time.monotonic() + 10
+            while queue._segment_preparer._prepared is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            prepared = queue._segment_preparer._prepared
+
+            # when
+            while queue._write_file_version == 1:
+                version = queue.put(Obj(version, str(version)))
+
+            # then
+            assert queue._writer is prepared
+            assert prepared.file_name == f"data-{version}.log"
+
+            # and
+            queue.flush()
+            assert [element.ver for element in queue.get_batch(version)] == list(range(1, version + 1))
+
+        # and
+        assert glob(data_path + "/prepared.*") == []
+
+
+@mark.parametrize(
+    "written, elapsed, expected_size",
+    [
+        (100 * 1024, 10.0, 1024**2),
+        (10 * 1024**2, 60.0, 10 * 1024**2),
+        (50 * 1024**2, 1.0, 64 * 1024**2),
+    ],
+)
+def test_segment_size_follows_write_rate(written, elapsed, expected_size):
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=64 * 1024**2,
+        ) as queue:
+            # given
+            queue._segment_started_at = time.monotonic() - elapsed
+            sealed = MagicMock(file_size=queue._segment_start_size + written)
+
+            # when
+            queue._adapt_segment_size(sealed)
+
+            # then
+            assert abs(queue._segment_size - expected_size) < expected_size * 0.01
+
+
+@patch("neptune.core.components.queue.disk_queue.INDEX_INTERVAL_BYTES", 500)
+@patch("neptune.core.components.queue.log_file.INDEX_INTERVAL_BYTES", 500)
+def test_skipping_to_ack_uses_index():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+        ) as queue:
+            # given
+            for i in range(1, 501):
+                queue.put(Obj(i, str(i)))
+            queue.flush()
+            queue.ack(400)
+
+        # when
+        counting_deserializer = MagicMock(side_effect=deserializer)
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=counting_deserializer,
+            lock=threading.RLock(),
+        ) as queue:
+            # then
+            assert queue.get().obj == Obj(401, "401")
+            assert counting_deserializer.call_count < 20
+
+
+@patch("neptune.core.components.queue.disk_queue.INDEX_INTERVAL_BYTES", 500)
+@patch("neptune.core.components.queue.log_file.INDEX_INTERVAL_BYTES", 500)
+def test_missing_or_corrupted_index_is_rebuilt():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+        ) as queue:
+            # given
+            for i in range(1, 501):
+                queue.put(Obj(i, str(i)))
+            queue.flush()
+            queue.ack(400)
+
+        index_path = Path(data_path) / "data-1.log.idx"
+        valid_index = index_path.read_bytes()
+
+        for broken_index in (None, INDEX_ENTRY.pack(1, 0) + INDEX_ENTRY.pack(390, 7)):
+            # when
+            if broken_index is None:
+                index_path.unlink()
+            else:
+                index_path.write_bytes(broken_index)
+
+            with DiskQueue[Obj](
+                data_path=Path(data_path),
+                to_dict=serializer,
+                from_dict=deserializer,
+                lock=threading.RLock(),
+            ) as queue:
+                # then
+                assert queue.get().obj == Obj(401, "401")
+
+            # and
+            assert index_path.read_bytes() == valid_index
+
+
+@patch("neptune.core.components.queue.disk_queue.INDEX_INTERVAL_BYTES", 500)
+@patch("neptune.core.components.queue.log_file.INDEX_INTERVAL_BYTES", 500)
+def test_sealed_segments_are_compressed():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=3000,
+            compression=GzipCompression(),
+        ) as queue:
+            # given
+            for i in range(1, 201):
+                queue.put(Obj(i, str(i)))
+            queue.flush()
+
+            # when
+            log_files = sorted(glob(data_path + "/data-*.log"), key=lambda path: int(Path(path).stem[5:]))
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline and not all(
+                detect_segment_compression(path) is GzipCompression for path in log_files[:-1]
+            ):
+                time.sleep(0.05)
+
+            # then
+            assert len(log_files) > 2
+            assert all(detect_segment_compression(path) is GzipCompression for path in log_files[:-1])
+            assert detect_segment_compression(log_files[-1]) is None
+
+            # and
+            for i in range(1, 201):
+                element = queue.get()
+                assert (element.obj, element.ver) == (Obj(i, str(i)), i)
+            queue.ack(150)
+
+        # and when
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=3000,
+        ) as queue:
+            # then
+            element = queue.get()
+            assert (element.obj, element.ver) == (Obj(151, "151"), 151)
+            assert queue._last_put_file.read_local() == 200
+
+
+def test_acknowledged_segments_are_not_compressed():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=300,
+            compression=GzipCompression(),
+        ) as queue:
+            # given
+            queue._compactor.schedule = MagicMock()
+            for i in range(1, 101):
+                queue.put(Obj(i, str(i)))
+            queue.flush()
+            sealed_files = [call.args[0] for call in queue._compactor.schedule.call_args_list]
+
+            # when
+            queue.ack(100)
+            for file_path in sealed_files:
+                queue._compactor._compact(file_path)
+
+            # then
+            assert all(not file_path.exists() for file_path in sealed_files)
+            assert glob(data_path + "/*.tmp") == []
+
+
+def test_size_bytes_tracks_segments_on_disk():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=300,
+        ) as queue:
+            # given
+            for i in range(1, 101):
+                queue.put(Obj(i, str(i)))
+            queue.flush()
+            size_bytes = queue.size_bytes()
+
+            # then
+            assert size_bytes == sum(Path(path).stat().st_size for path in glob(data_path + "/data-*.log"))
+
+            # when
+            queue.ack(90)
+
+            # then
+            assert queue.size_bytes() == sum(Path(path).stat().st_size for path in glob(data_path + "/data-*.log"))
+            assert 0 < queue.size_bytes() < size_bytes
+
+
+def test_pending_bytes_excludes_acknowledged_records():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=100000,
+        ) as queue:
+            # given
+            for i in range(1, 101):
+                queue.put(Obj(i, str(i)))
+            queue.put_batch([Obj(i, str(i)) for i in range(101, 111)])
+            pending_bytes = queue.pending_bytes()
+
+            # then
+            assert pending_bytes > 0
+
+            # when
+            queue.ack(50)
+
+            # then
+            assert 0 < queue.pending_bytes() < pending_bytes
+            assert queue.size_bytes() >= pending_bytes
+
+            # when
+            queue.ack(105)
+
+            # then
+            assert queue.pending_bytes() > 0
+
+            # when
+            queue.ack(110)
+
+            # then
+            assert queue.pending_bytes() == 0
+
+
+def test_pending_bytes_of_resumed_queue():
+    with TemporaryDirectory() as data_path:
+        # given
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+        ) as queue:
+            for i in range(1, 11):
+                queue.put(Obj(i, str(i)))
+
+        # when
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+        ) as queue:
+            # then
+            assert queue.pending_bytes() == queue.size_bytes() > 0
+
+            # when
+            queue.put(Obj(11, "11"))
+            queue.ack(10)
+
+            # then
+            assert 0 < queue.pending_bytes() < queue.size_bytes()
+
+            # when
+            queue.ack(11)
+
+            # then
+            assert queue.pending_bytes() == 0
+
+
 @dataclass
 class Obj:
     num: int
@@ -0,0 +1,67 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+
+from neptune.core.components.queue.ring_buffer import RingBuffer
+
+
+def test_put_and_pop_batch():
+    # given
+    buffer = RingBuffer[int](capacity=5)
+
+    # when
+    for i in range(5):
+        assert buffer.put(i)
+
+    # then
+    assert buffer.is_full()
+    assert not buffer.put(5)
+    assert buffer.pop_batch(3) == [0, 1, 2]
+    assert buffer.pop_batch(3) == [3, 4]
+    assert buffer.is_empty()
+
+
+def test_put_blocking_times_out_when_full():
+    # given
+    buffer = RingBuffer[int](capacity=1)
+    buffer.put(0)
+
+    # then
+    assert not buffer.put_blocking(1, timeout=0.01)
+    assert len(buffer) == 1
+
+
+def test_put_blocking_waits_for_space():
+    # given
+    buffer = RingBuffer[int](capacity=1)
+    buffer.put(0)
+    appended = threading.Event()
+
+    def produce():
+        buffer.put_blocking(1, timeout=10)
+        appended.set()
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+
+    # when
+    assert not appended.wait(0.05)
+    assert buffer.pop_batch(1) == [0]
+
+    # then
+    producer.join(10)
+    assert appended.is_set()
+    assert buffer.pop_batch(1) == [1]
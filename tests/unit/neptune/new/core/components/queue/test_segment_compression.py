@@ -0,0 +1,87 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from neptune.core.components.queue.segment_compactor import SegmentCompactor
+from neptune.core.components.queue.segment_compression import (
+    GzipCompression,
+    detect_segment_compression,
+    get_segment_compression,
+    open_segment,
+)
+
+CONTENT = b"".join(b'{"obj": {"key": "value"}, "version": %d}\n' % i for i in range(1000))
+
+
+def test_compacted_segment_is_read_transparently():
+    with TemporaryDirectory() as data_path:
+        # given
+        path = Path(data_path) / "data-1.log"
+        path.write_bytes(CONTENT)
+        compactor = SegmentCompactor(GzipCompression())
+
+        # when
+        compactor._compact(path)
+
+        # then
+        assert detect_segment_compression(path) is GzipCompression
+        assert path.stat().st_size < len(CONTENT)
+        with open_segment(path) as stream:
+            assert stream.read() == CONTENT
+
+
+def test_discarded_segment_is_not_restored():
+    with TemporaryDirectory() as data_path:
+        # given
+        path = Path(data_path) / "data-1.log"
+        path.write_bytes(CONTENT)
+        compactor = SegmentCompactor(GzipCompression())
+        compactor._pending.append(path)
+
+        # when
+        compactor.discard(path, path.unlink)
+        compactor._compact(path)
+
+        # then
+        assert list(Path(data_path).iterdir()) == []
+        assert not compactor._pending
+
+
+def test_segment_discarded_during_compaction_is_not_restored():
+    class DiscardingCompression(GzipCompression):
+        def compress(self, source, target):
+            super().compress(source, target)
+            compactor.discard(path, path.unlink)
+
+    with TemporaryDirectory() as data_path:
+        # given
+        path = Path(data_path) / "data-1.log"
+        path.write_bytes(CONTENT)
+        compactor = SegmentCompactor(DiscardingCompression())
+
+        # when
+        compactor._compact(path)
+
+        # then
+        assert list(Path(data_path).iterdir()) == []
+
+
+def test_unknown_compression():
+    with pytest.raises(ValueError):
+        get_segment_compression("brotli")
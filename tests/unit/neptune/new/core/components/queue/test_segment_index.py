@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from neptune.core.components.queue.segment_index import (
+    INDEX_ENTRY,
+    SegmentIndex,
+)
+
+
+def test_lookup():
+    with TemporaryDirectory() as data_path:
+        with SegmentIndex(Path(data_path) / "data-1.log.idx") as index:
+            # given
+            index.add(1, 0)
+            index.add(10, 100)
+            index.add(20, 200)
+
+            # then
+            assert index.lookup(0) is None
+            assert index.lookup(1) == (1, 0)
+            assert index.lookup(15) == (10, 100)
+            assert index.lookup(25) == (20, 200)
+
+
+def test_persisted_entries_are_loaded():
+    with TemporaryDirectory() as data_path:
+        path = Path(data_path) / "data-1.log.idx"
+        with SegmentIndex(path) as index:
+            index.add(1, 0)
+            index.add(10, 100)
+
+        with SegmentIndex(path) as index:
+            assert index.lookup(15) == (10, 100)
+
+
+def test_corrupted_tail_is_dropped():
+    with TemporaryDirectory() as data_path:
+        # given
+        path = Path(data_path) / "data-1.log.idx"
+        path.write_bytes(INDEX_ENTRY.pack(1, 0) + INDEX_ENTRY.pack(10, 100) + INDEX_ENTRY.pack(5, 300) + b"\x01\x02")
+
+        # when
+        with SegmentIndex(path) as index:
+            # then
+            assert index.lookup(50) == (10, 100)
+
+        # and
+        assert path.read_bytes() == INDEX_ENTRY.pack(1, 0) + INDEX_ENTRY.pack(10, 100)
+
+
+def test_rebuild():
+    with TemporaryDirectory() as data_path:
+        path = Path(data_path) / "data-1.log.idx"
+        with SegmentIndex(path) as index:
+            # given
+            index.add(1, 0)
+            index.add(10, 100)
+
+            # when
+            index.rebuild([(1, 0), (7, 70)])
+            index.add(9, 90)
+
+            # then
+            assert index.lookup(50) == (9, 90)
+
+        # and
+        assert path.read_bytes() == INDEX_ENTRY.pack(1, 0) + INDEX_ENTRY.pack(7, 70) + INDEX_ENTRY.pack(9, 90)
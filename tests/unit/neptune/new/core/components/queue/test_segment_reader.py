@@ -0,0 +1,200 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import gzip
+from unittest.mock import patch
+
+import pytest
+
+from neptune.core.components.queue.record_codec import (
+    JsonRecordCodec,
+    MsgpackRecordCodec,
+    detect_record_codec,
+)
+from neptune.core.components.queue.segment_reader import (
+    BINARY_FILE_MAGIC,
+    FRAME_HEADER,
+    BinarySegmentReader,
+    JsonSegmentReader,
+)
+from neptune.exceptions import MalformedOperation
+from tests.unit.neptune.new.utils.file_helpers import create_file
+
+codec = MsgpackRecordCodec()
+
+
+def encode_all(*objects: dict) -> bytes:
+    return b"".join(codec.encode(obj) for obj in objects)
+
+
+def test_json_lines():
+    content = '{"a": 5, "b": "text"}\n{"a": 13}\n\n{}\n'
+
+    with create_file(content) as filename:
+        with JsonSegmentReader(filename) as reader:
+            assert reader.get_with_size() == ({"a": 5, "b": "text"}, len('{"a": 5, "b": "text"}'))
+            assert reader.get() == {"a": 13}
+            assert reader.get() == {}
+            assert reader.get() is None
+
+
+def test_json_growing_file():
+    with create_file() as filename, open(filename, "a") as fp:
+        with JsonSegmentReader(filename) as reader:
+            assert reader.get() is None
+
+            fp.write('{"a": 5}\n{"a": ')
+            fp.flush()
+
+            assert reader.get() == {"a": 5}
+            assert reader.get() is None
+
+            fp.write("13}\n" + '{"b": "x"}\n' * 10)
+            fp.flush()
+
+            assert reader.get() == {"a": 13}
+            assert [reader.get() for _ in range(10)] == [{"b": "x"}] * 10
+            assert reader.get() is None
+
+
+def test_json_skips_torn_line():
+    content = '{"a": 5}\n{"a": 1{"a": 13}\n{"a": 14}\n'
+
+    with create_file(content) as filename:
+        with JsonSegmentReader(filename) as reader:
+            assert reader.get() == {"a": 5}
+            assert reader.get() == {"a": 14}
+            assert reader.get() is None
+
+
+def test_simple_file():
+    content = BINARY_FILE_MAGIC + encode_all({"a": 5, "b": "text"}, {"a": 13}, {})
+
+    with create_file(content, binary_mode=True) as filename:
+        with codec.open_reader(filename) as reader:
+            assert reader.get() == {"a": 5, "b": "text"}
+            assert reader.get() == {"a": 13}
+            assert reader.get() == {}
+            assert reader.get() is None
+
+
+def test_append_cut_frame():
+    frames = encode_all({"a": 5, "b": "text"}, {"a": 155, "r": "something"}, {"a": {"b": [1, 2, 3]}})
+    first_frame_size = len(codec.encode({"a": 5, "b": "text"}))
+    cut = first_frame_size + FRAME_HEADER.size + 3
+
+    with create_file(BINARY_FILE_MAGIC + frames[:cut], binary_mode=True) as filename, open(filename, "ab") as fp:
+        with codec.open_reader(filename) as reader:
+            assert reader.get_with_size() == ({"a": 5, "b": "text"}, first_frame_size)
+            assert reader.get() is None
+
+            fp.write(frames[cut:])
+            fp.flush()
+
+            assert reader.get() == {"a": 155, "r": "something"}
+            assert reader.get() == {"a": {"b": [1, 2, 3]}}
+            assert reader.get() is None
+
+
+def test_big_frame():
+    big = {"a": "x" * 64 * 1024 * 2, "b": "y" * 64 * 1024 * 2}
+    content = BINARY_FILE_MAGIC + encode_all({"a": 5}, big, {})
+
+    with create_file(content, binary_mode=True) as filename:
+        with codec.open_reader(filename) as reader:
+            assert reader.get() == {"a": 5}
+            assert reader.get() == big
+            assert reader.get() == {}
+            assert reader.get() is None
+
+
+def test_checksum_mismatch():
+    frame = bytearray(codec.encode({"a": 5}))
+    frame[-1] ^= 0xFF
+
+    with create_file(BINARY_FILE_MAGIC + bytes(frame), binary_mode=True) as filename:
+        with codec.open_reader(filename) as reader:
+            with pytest.raises(MalformedOperation):
+                reader.get()
+
+
+def test_detect_record_codec():
+    with create_file(BINARY_FILE_MAGIC, binary_mode=True) as filename:
+        assert detect_record_codec(filename) is MsgpackRecordCodec
+
+    with create_file('{"a": 5}\n') as filename:
+        assert detect_record_codec(filename) is JsonRecordCodec
+
+    with create_file() as filename:
+        assert detect_record_codec(filename) is None
+
+
+def test_read_last_record_skips_torn_tail():
+    frames = encode_all({"a": 1}, {"a": 2}, {"a": 3})
+
+    with create_file(BINARY_FILE_MAGIC + frames[:-2], binary_mode=True) as filename:
+        assert codec.read_last_record(filename) == ({"a": 2}, len(BINARY_FILE_MAGIC + encode_all({"a": 1}, {"a": 2})))
+
+    with create_file(BINARY_FILE_MAGIC, binary_mode=True) as filename:
+        assert codec.read_last_record(filename) == (None, len(BINARY_FILE_MAGIC))
+
+
+def test_json_read_last_record_skips_torn_tail():
+    with create_file('{"a": 1}\n{"a": 2}\n{"a": 3') as filename:
+        assert JsonRecordCodec().read_last_record(filename) == ({"a": 2}, len('{"a": 1}\n{"a": 2}\n'))
+
+    with create_file('{"a": 1') as filename:
+        assert JsonRecordCodec().read_last_record(filename) == (None, 0)
+
+
+OBJECTS = [{"a": i, "b": "x" * (i % 7)} for i in range(100)]
+
+
+def _read_all(reader):
+    objects = []
+    largest_window = 0
+    obj = reader.get()
+    while obj is not None:
+        objects.append(obj)
+        largest_window = max(largest_window, len(reader._map))
+        obj = reader.get()
+    return objects, largest_window
+
+
+@patch("neptune.core.components.queue.segment_reader.DECOMPRESSION_CHUNK_SIZE", 64)
+def test_compressed_segments_are_decompressed_as_stream():
+    json_content = b"".join(JsonRecordCodec().encode(obj) for obj in OBJECTS)
+    with create_file(gzip.compress(json_content), binary_mode=True) as filename:
+        with JsonSegmentReader(filename) as reader:
+            objects, largest_window = _read_all(reader)
+
+            assert objects == OBJECTS
+            assert largest_window < 2 * 64
+
+    with create_file(gzip.compress(BINARY_FILE_MAGIC + encode_all(*OBJECTS)), binary_mode=True) as filename:
+        with BinarySegmentReader(filename, decode=codec.decode) as reader:
+            objects, largest_window = _read_all(reader)
+
+            assert objects == OBJECTS
+            assert largest_window < 2 * 64
+
+
+@patch("neptune.core.components.queue.segment_reader.DECOMPRESSION_CHUNK_SIZE", 64)
+def test_compressed_segment_read_from_offset():
+    offset = len(BINARY_FILE_MAGIC + encode_all(*OBJECTS[:30]))
+
+    with create_file(gzip.compress(BINARY_FILE_MAGIC + encode_all(*OBJECTS)), binary_mode=True) as filename:
+        with BinarySegmentReader(filename, decode=codec.decode, offset=offset) as reader:
+            assert _read_all(reader)[0] == OBJECTS[30:]
@@ -14,10 +14,12 @@
 # limitations under the License.
 #
 
+import itertools
 import random
 import threading
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest.mock import (
     MagicMock,
     Mock,
@@ -30,14 +32,26 @@ from neptune.core.operation_processors.async_operation_processor import AsyncOpe
 from neptune.core.operation_processors.async_operation_processor.async_operation_processor import (
     _queue_has_enough_space,
 )
+from neptune.core.operation_processors.async_operation_processor.background_drain import DrainMode
+from neptune.core.operation_processors.async_operation_processor.buffer_writer_thread import BufferFullPolicy
+from neptune.core.operation_processors.async_operation_processor.queue_quota import QuotaPolicy
+from neptune.core.operation_processors.async_operation_processor.sync_scheduler import SyncScheduler
 from neptune.core.operation_processors.operation_processor import OperationProcessor
+from neptune.core.operations.operation import (
+    AssignFloat,
+    LogFloats,
+)
 from neptune.core.typing.container_type import ContainerType
 from neptune.core.typing.id_formats import (
     CustomId,
     UniqueId,
 )
 from neptune.exceptions import NeptuneSynchronizationAlreadyStoppedException
-from neptune.internal.warnings import NeptuneWarning
+from neptune.internal.warnings import (
+    NeptuneWarning,
+    warned_once,
+)
+from tests.unit.neptune.new.attributes.test_attribute_base import TestAttributeBase
 
 
 @patch("neptune.core.operation_processors.async_operation_processor.processing_resources.MetadataFile", new=Mock)
@@ -165,6 +179,93 @@ class TestAsyncOperationProcessorEnqueueOperation(unittest.TestCase):
         processor.processing_resources.disk_queue.put.assert_called_once_with(op, category=10)
         mock_wait.assert_called_once()
 
+    def test_enqueue_operations_puts_batch(self):
+        # given
+        processor = AsyncOperationProcessor(
+            custom_id=CustomId("test_id"),
+            container_type=random.choice(list(ContainerType)),
+            lock=threading.RLock(),
+            signal_queue=Mock(),
+        )
+
+        processor.processing_resources.disk_queue.put_batch = Mock(side_effect=lambda items: len(list(items)))
+        processor.processing_resources.disk_queue.size.return_value = 100
+
+        ops = [Mock(), Mock()]
+        mock_wait = Mock()
+        processor.wait = mock_wait
+
+        # when
+        processor.enqueue_operations(ops, wait=True)
+
+        # then
+        processor.processing_resources.disk_queue.put_batch.assert_called_once()
+        assert processor._last_version == 2
+        mock_wait.assert_called_once()
+
+    def test_enqueue_operation_below_threshold_schedules_consumer_wake_up(self):
+        # given
+        processor = AsyncOperationProcessor(
+            custom_id=CustomId("test_id"),
+            container_type=random.choice(list(ContainerType)),
+            lock=threading.RLock(),
+            signal_queue=Mock(),
+            batch_size=100,
+            max_delay=0.5,
+        )
+
+        processor.processing_resources.disk_queue.put = Mock(return_value=1)
+        processor.processing_resources.disk_queue.size.return_value = 1
+        processor._consumer = Mock()
+
+        # when
+        processor.enqueue_operation(Mock(), wait=False)
+
+        # then
+        processor._consumer.schedule_wake_up.assert_called_once_with(0.5)
+        processor._consumer.wake_up.assert_not_called()
+
+    def test_sync_stats_follow_written_operations(self):
+        # given
+        processor = AsyncOperationProcessor(
+            custom_id=CustomId("test_id"),
+            container_type=random.choice(list(ContainerType)),
+            lock=threading.RLock(),
+            signal_queue=Mock(),
+        )
+
+        processor.processing_resources.disk_queue.put = Mock(return_value=3)
+        processor.processing_resources.disk_queue.size.return_value = 3
+        processor.processing_resources.disk_queue.pending_bytes.return_value = 1024
+
+        # when
+        processor.enqueue_operation(Mock(), wait=False)
+        stats = processor.sync_stats()
+
+        # then
+        assert stats.queue_size == 3
+        assert stats.queue_size_bytes == 1024
+        assert stats.oldest_unacked_age is not None
+        assert stats.batch_latency_p50 is None
+
+    @patch("neptune.core.operation_processors.async_operation_processor.async_operation_processor._directory_size")
+    def test_sync_stats_do_not_walk_queue_directory_on_every_call(self, directory_size):
+        # given
+        processor = AsyncOperationProcessor(
+            custom_id=CustomId("test_id"),
+            container_type=random.choice(list(ContainerType)),
+            lock=threading.RLock(),
+            signal_queue=Mock(),
+        )
+        directory_size.return_value = 4096
+
+        # when
+        stats = [processor.sync_stats() for _ in range(3)]
+
+        # then
+        assert [stat.disk_usage_bytes for stat in stats] == [4096, 4096, 4096]
+        directory_size.assert_called_once_with(processor.data_path)
+
     def test_enqueue_operation_not_accepting_operations_raises_warning_and_doesnt_put_to_queue(self):
         # given
         processor = AsyncOperationProcessor(
@@ -186,6 +287,202 @@ class TestAsyncOperationProcessorEnqueueOperation(unittest.TestCase):
         processor.processing_resources.disk_queue.put.assert_not_called()
 
 
+@patch("neptune.core.operation_processors.async_operation_processor.processing_resources.MetadataFile", new=Mock)
+@patch(
+    "neptune.core.operation_processors.async_operation_processor.processing_resources.AggregatingDiskQueue",
+    new=MagicMock(),
+)
+@patch(
+    "neptune.core.operation_processors.async_operation_processor.buffer_writer_thread.try_get_step",
+    new=lambda _: 10,
+)
+class TestAsyncOperationProcessorBuffer(unittest.TestCase):
+    @staticmethod
+    def _processor(buffer_full_policy: BufferFullPolicy = BufferFullPolicy.BLOCK):
+        processor = AsyncOperationProcessor(
+            custom_id=CustomId("test_id"),
+            container_type=random.choice(list(ContainerType)),
+            lock=threading.RLock(),
+            signal_queue=Mock(),
+            batch_size=10,
+            buffer_size=2,
+            buffer_full_policy=buffer_full_policy,
+        )
+        written = []
+
+        def put_batch(items):
+            written.extend(items)
+            return len(written)
+
+        processor.processing_resources.disk_queue.put_batch = Mock(side_effect=put_batch)
+        processor.processing_resources.disk_queue.size.return_value = 0
+        return processor, written
+
+    def test_sync_stats_count_buffered_operations(self):
+        # given
+        processor, _ = self._processor()
+        processor.processing_resources.disk_queue.size.return_value = 3
+
+        # when
+        processor.enqueue_operation(Mock(), wait=False)
+
+        # then
+        assert processor.sync_stats().queue_size == 4
+
+    def test_operations_are_written_on_flush(self):
+        # given
+        processor, written = self._processor()
+        ops = [Mock(), Mock()]
+
+        # when
+        for op in ops:
+            processor.enqueue_operation(op, wait=False)
+
+        # then
+        assert written == []
+
+        # when
+        processor.flush()
+
+        # then
+        assert written == [(op, 10) for op in ops]
+        processor.processing_resources.disk_queue.put_batch.assert_called_once()
+        assert processor._last_version == 2
+
+    def test_log_floats_are_coalesced(self):
+        # given
+        processor, written = self._processor(BufferFullPolicy.SPILL)
+        values = [LogFloats.ValueType(value, None, 1234) for value in range(2)]
+
+        # when
+        for value in values:
+            processor.enqueue_operation(LogFloats(["a"], [value]), wait=False)
+        processor.flush()
+
+        # then
+        assert written == [(LogFloats(["a"], values), 10)]
+        assert processor._last_version == 1
+
+    def test_full_buffer_spills_in_order(self):
+        # given
+        processor, written = self._processor(BufferFullPolicy.SPILL)
+        ops = [Mock(), Mock(), Mock()]
+
+        # when
+        processor.enqueue_operations(ops, wait=False)
+
+        # then
+        assert written == [(op, 10) for op in ops]
+
+    def test_full_buffer_drops_with_warning(self):
+        # given
+        processor, written = self._processor(BufferFullPolicy.DROP)
+        ops = [Mock(), Mock(), Mock()]
+
+        # when
+        with self.assertWarnsRegex(NeptuneWarning, "operation buffer is full"):
+            for op in ops:
+                processor.enqueue_operation(op, wait=False)
+        processor.flush()
+
+        # then
+        assert written == [(op, 10) for op in ops[:2]]
+
+    def test_full_buffer_blocks_until_writer_makes_space(self):
+        # given
+        processor, written = self._processor(BufferFullPolicy.BLOCK)
+        processor._consumer = Mock()
+        ops = [Mock(), Mock(), Mock()]
+        processor.start()
+
+        # when
+        for op in ops:
+            processor.enqueue_operation(op, wait=False)
+        processor.close()
+
+        # then
+        assert written == [(op, 10) for op in ops]
+
+
+class TestAsyncOperationProcessorWithAttributes(TestAttributeBase):
+    def test_appended_values_are_coalesced(self):
+        with TemporaryDirectory() as data_path, self._exp() as exp:
+            # given
+            processor = AsyncOperationProcessor(
+                custom_id=CustomId("test_id"),
+                container_type=ContainerType.RUN,
+                lock=threading.RLock(),
+                signal_queue=Mock(),
+                batch_size=1000,
+                data_path=Path(data_path),
+                buffer_size=100,
+            )
+
+            # when
+            with patch.object(exp, "_op_processor", processor):
+                for value in range(5):
+                    exp["train/loss"].append(float(value), step=1)
+                processor.flush()
+
+            # then
+            batch = processor.processing_resources.disk_queue.get_batch(1000)
+            assert [op.obj.obj.path for op in batch] == [["train", "loss"]]
+            assert [value.value for value in batch[0].obj.obj.values] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+            processor.close()
+            processor.cleanup()
+
+
+class TestAsyncOperationProcessorQueueQuota(unittest.TestCase):
+    def test_blocked_writer_holding_container_lock_does_not_stop_synchronization(self):
+        for buffer_size, sync_scheduler in itertools.product((0, 10), (None, SyncScheduler(max_workers=1))):
+            with self.subTest(
+                buffer_size=buffer_size, sync_scheduler=sync_scheduler
+            ), TemporaryDirectory() as data_path:
+                # given
+                lock = threading.RLock()
+                processor = AsyncOperationProcessor(
+                    custom_id=CustomId("test_id"),
+                    container_type=ContainerType.RUN,
+                    lock=lock,
+                    signal_queue=Mock(),
+                    batch_size=10,
+                    data_path=Path(data_path),
+                    sleep_time=0.01,
+                    buffer_size=buffer_size,
+                    max_queue_bytes=1000,
+                    quota_policy=QuotaPolicy.BLOCK,
+                    backend=Mock(),
+                    project="workspace/project",
+                    sync_scheduler=sync_scheduler,
+                )
+                processor.start()
+
+                def log():
+                    # attributes enqueue their operations under the lock of the container
+                    for i in range(200):
+                        with lock:
+                            processor.enqueue_operation(AssignFloat(["a"], float(i)), wait=False)
+
+                # when
+                writer = threading.Thread(target=log, daemon=True)
+                writer.start()
+                writer.join(timeout=30)
+
+                # then
+                assert not writer.is_alive()
+                if sync_scheduler is None or buffer_size == 0:
+                    # run by a scheduler, the buffer writer keeps operations in the full buffer instead of waiting
+                    assert processor.queue_quota_metrics.blocked_seconds > 0
+                if sync_scheduler is not None:
+                    # no thread of its own, the run is synchronized by the workers of the scheduler
+                    assert processor._consumer.ident is None
+                    assert processor._buffer_writer is None or processor._buffer_writer.ident is None
+
+                processor.stop()
+                assert processor.processing_resources.consumed_version == processor._last_version
+
+
 @patch("neptune.core.operation_processors.async_operation_processor.processing_resources.MetadataFile", new=Mock)
 @patch(
     "neptune.core.operation_processors.async_operation_processor.processing_resources.AggregatingDiskQueue",
@@ -334,6 +631,75 @@ class TestAsyncOperationProcessorStopAndClose(unittest.TestCase):
         processor._queue_observer.is_queue_empty.assert_called_once()
         processor.cleanup.assert_called_once()
 
+    @patch(
+        "neptune.core.operation_processors.async_operation_processor.async_operation_processor.start_background_drain"
+    )
+    def test_stop_with_background_drain(self, start_background_drain):
+        # given
+        processor = AsyncOperationProcessor(
+            custom_id=CustomId("test_id"),
+            container_type=ContainerType.RUN,
+            lock=threading.RLock(),
+            signal_queue=Mock(),
+            backend=Mock(),
+            project="workspace/project",
+        )
+
+        processor._consumer = Mock()
+        processor.flush = Mock()
+        processor.close = Mock()
+        processor.cleanup = Mock()
+
+        processor._queue_observer = Mock()
+        processor._queue_observer.is_queue_empty.return_value = False
+
+        # when
+        processor.stop(seconds=10, drain=DrainMode.BACKGROUND)
+
+        # then
+        processor.flush.assert_called_once()
+        processor._consumer.interrupt.assert_called_once()
+        processor._consumer.join.assert_called_once()
+        processor._queue_observer.wait_for_queue_empty.assert_not_called()
+        processor.close.assert_called_once()
+        processor.cleanup.assert_not_called()
+
+        start_background_drain.assert_called_once_with(
+            data_path=processor.data_path,
+            project="workspace/project",
+            run_id="test_id",
+            container_type=ContainerType.RUN,
+            api_token=processor._backend.credentials.api_key,
+        )
+
+    @patch(
+        "neptune.core.operation_processors.async_operation_processor.async_operation_processor.start_background_drain"
+    )
+    def test_stop_with_background_drain_without_backend_warns_and_waits(self, start_background_drain):
+        # given
+        processor = AsyncOperationProcessor(
+            custom_id=CustomId("test_id"),
+            container_type=ContainerType.RUN,
+            lock=threading.RLock(),
+            signal_queue=Mock(),
+        )
+
+        processor._consumer = Mock()
+        processor._consumer.is_running.return_value = True
+        processor.flush = Mock()
+        processor.close = Mock()
+        processor.cleanup = Mock()
+        processor._queue_observer = Mock()
+        warned_once.clear()
+
+        # when
+        with self.assertWarns(NeptuneWarning):
+            processor.stop(seconds=10, drain=DrainMode.BACKGROUND)
+
+        # then
+        processor._queue_observer.wait_for_queue_empty.assert_called_once()
+        start_background_drain.assert_not_called()
+
     def test_close(self):
         # given
         processor = AsyncOperationProcessor(
@@ -0,0 +1,108 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import subprocess
+import threading
+import time
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from neptune.core.operation_processors.async_operation_processor.background_drain import (
+    DRAIN_LOG_FILE_NAME,
+    drain,
+    start_background_drain,
+)
+from neptune.core.operation_processors.async_operation_processor.processing_resources import ProcessingResources
+from neptune.core.operations.operation import AssignFloat
+from neptune.core.typing.container_type import ContainerType
+from neptune.core.typing.id_formats import CustomId
+from neptune.internal.exceptions import NeptuneConnectionLostException
+
+
+def _write_queue(data_path, ops):
+    data_path.mkdir(parents=True)
+    resources = ProcessingResources(
+        custom_id=CustomId("run_id"),
+        container_type=ContainerType.RUN,
+        lock=threading.RLock(),
+        signal_queue=Mock(),
+        data_path=data_path,
+    )
+    resources.disk_queue.put_batch((op, None) for op in ops)
+    resources.close()
+
+
+def test_drain_sends_queue_left_on_disk_and_removes_it(tmp_path):
+    # given
+    data_path = tmp_path / "run_id"
+    _write_queue(data_path, [AssignFloat(["a"], 1.0), AssignFloat(["b"], 2.0)])
+    (data_path / DRAIN_LOG_FILE_NAME).write_text("")
+    backend = Mock()
+
+    # when
+    is_synchronized = drain(data_path, "workspace/project", "run_id", ContainerType.RUN, backend)
+
+    # then
+    assert is_synchronized
+    assert backend.submit_operation.called
+    assert not data_path.exists()
+
+
+def test_drain_keeps_queue_and_log_when_not_synchronized(tmp_path):
+    # given
+    data_path = tmp_path / "run_id"
+    _write_queue(data_path, [AssignFloat(["a"], 1.0)])
+    (data_path / DRAIN_LOG_FILE_NAME).write_text("")
+    backend = Mock()
+    backend.submit_operation.side_effect = RuntimeError
+
+    # when
+    is_synchronized = drain(data_path, "workspace/project", "run_id", ContainerType.RUN, backend)
+
+    # then
+    assert not is_synchronized
+    assert (data_path / DRAIN_LOG_FILE_NAME).exists()
+
+
+def test_drain_gives_up_when_connection_does_not_come_back(tmp_path):
+    # given
+    data_path = tmp_path / "run_id"
+    _write_queue(data_path, [AssignFloat(["a"], 1.0)])
+    (data_path / DRAIN_LOG_FILE_NAME).write_text("")
+    backend = Mock()
+    backend.submit_operation.side_effect = NeptuneConnectionLostException(Exception())
+
+    # when
+    started_at = time.monotonic()
+    is_synchronized = drain(data_path, "workspace/project", "run_id", ContainerType.RUN, backend, timeout=0.5)
+
+    # then
+    assert not is_synchronized
+    assert time.monotonic() - started_at < 10
+    assert (data_path / DRAIN_LOG_FILE_NAME).exists()
+    assert any(data_path.glob("data-*.log"))
+
+
+@patch("neptune.core.operation_processors.async_operation_processor.background_drain.subprocess.Popen")
+def test_drain_process_logs_to_queue_directory(popen, tmp_path):
+    # when
+    start_background_drain(tmp_path, "workspace/project", "run_id", ContainerType.RUN, api_token="token")
+
+    # then
+    _, kwargs = popen.call_args
+    assert kwargs["stdout"].name == str(tmp_path / DRAIN_LOG_FILE_NAME)
+    assert kwargs["stderr"] == subprocess.STDOUT
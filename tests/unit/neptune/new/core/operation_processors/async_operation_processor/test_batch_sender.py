@@ -0,0 +1,186 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest
+from datetime import datetime
+from unittest.mock import Mock
+
+from neptune.core.operation_processors.async_operation_processor.batch_sender import BatchSender
+from neptune.core.operations.operation import (
+    AssignFloat,
+    AssignString,
+    LogFloats,
+    RunCreation,
+)
+from neptune.internal.exceptions import (
+    ClientHttpError,
+    NeptuneConnectionLostException,
+)
+
+
+def _log_floats(path, *steps):
+    return LogFloats(path, [LogFloats.ValueType(float(step), step, 1.0) for step in steps])
+
+
+class TestBatchSender(unittest.TestCase):
+    def setUp(self):
+        self.backend = Mock()
+        self.sender = BatchSender(backend=self.backend, project="workspace/project", run_id="run_id")
+
+    def test_operations_of_a_step_are_packed_into_one_message(self):
+        # given
+        batch = [_log_floats(["loss"], 1), _log_floats(["acc"], 1), _log_floats(["lr"], 1)]
+
+        # when
+        packed = self.sender.pack(batch)
+
+        # then
+        self.assertEqual(1, len(packed))
+        run_operation, completed_count = packed[0]
+        self.assertEqual(3, completed_count)
+        self.assertEqual({"loss", "acc", "lr"}, set(run_operation.update.append))
+        self.assertEqual(1, run_operation.update.step.whole)
+        self.assertEqual("workspace/project", run_operation.project)
+        self.assertEqual("run_id", run_operation.run_id)
+
+    def test_assignments_are_packed_together(self):
+        # given
+        batch = [AssignFloat(["a"], 1.0), AssignString(["b"], "text")]
+
+        # when
+        packed = self.sender.pack(batch)
+
+        # then
+        self.assertEqual(1, len(packed))
+        self.assertEqual({"a", "b"}, set(packed[0][0].update.assign))
+
+    def test_messages_are_split_on_step_change_and_repeated_series(self):
+        # given
+        batch = [RunCreation(datetime(2024, 1, 1), "run_id"), _log_floats(["loss"], 1, 2), _log_floats(["loss"], 3)]
+
+        # when
+        packed = self.sender.pack(batch)
+
+        # then
+        self.assertEqual([1, 1, 2, 3], [completed_count for _, completed_count in packed])
+        self.assertEqual("create", packed[0][0].WhichOneof("operation"))
+        self.assertEqual([1, 2, 3], [run_operation.update.step.whole for run_operation, _ in packed[1:]])
+
+    def test_send_returns_confirmed_operations(self):
+        # given
+        batch = [_log_floats(["loss"], 1), _log_floats(["loss"], 2), _log_floats(["loss"], 3)]
+        self.backend.submit_operation.side_effect = [Mock(), NeptuneConnectionLostException(Exception())]
+
+        # when
+        processed_count = self.sender.send(batch)
+
+        # then
+        self.assertEqual(1, processed_count)
+        self.assertEqual(2, self.backend.submit_operation.call_count)
+
+    def test_send_raises_when_nothing_is_confirmed(self):
+        # given
+        self.backend.submit_operation.side_effect = NeptuneConnectionLostException(Exception())
+
+        # then
+        with self.assertRaises(NeptuneConnectionLostException):
+            self.sender.send([_log_floats(["loss"], 1)])
+
+    def test_resent_operation_skips_confirmed_values(self):
+        # given
+        batch = [_log_floats(["loss"], 1, 2, 3)]
+        self.backend.submit_operation.side_effect = [Mock(), Mock(), NeptuneConnectionLostException(Exception())]
+
+        # when
+        with self.assertRaises(NeptuneConnectionLostException):
+            self.sender.send(batch)
+        self.backend.submit_operation.reset_mock(side_effect=True)
+        processed_count = self.sender.send(batch)
+
+        # then
+        self.assertEqual(1, processed_count)
+        self.backend.submit_operation.assert_called_once()
+        self.assertEqual(3, self.backend.submit_operation.call_args[0][0].update.step.whole)
+
+    def test_partially_sent_operation_is_resumed_after_confirmed_ones(self):
+        # given
+        batch = [_log_floats(["acc"], 1), _log_floats(["loss"], 2, 3, 4)]
+        self.backend.submit_operation.side_effect = [Mock(), Mock(), NeptuneConnectionLostException(Exception())]
+
+        # when
+        processed_count = self.sender.send(batch)
+        self.backend.submit_operation.reset_mock(side_effect=True)
+        self.sender.send(batch[processed_count:])
+
+        # then
+        self.assertEqual(1, processed_count)
+        self.assertEqual(
+            [3, 4], [call_args[0][0].update.step.whole for call_args in self.backend.submit_operation.call_args_list]
+        )
+
+    def test_equal_operation_is_sent_whole(self):
+        # given
+        self.backend.submit_operation.side_effect = [Mock(), NeptuneConnectionLostException(Exception())]
+        with self.assertRaises(NeptuneConnectionLostException):
+            self.sender.send([_log_floats(["loss"], 1, 2)])
+        self.backend.submit_operation.reset_mock(side_effect=True)
+
+        # when
+        self.sender.send([_log_floats(["loss"], 1, 2)])
+
+        # then
+        self.assertEqual(2, self.backend.submit_operation.call_count)
+
+    def test_rejected_operations_are_processed(self):
+        # given
+        batch = [_log_floats(["loss"], 1), _log_floats(["loss"], 2)]
+        self.backend.submit_operation.side_effect = [ClientHttpError("400", "invalid"), Mock()]
+
+        # when
+        processed_count = self.sender.send(batch)
+
+        # then
+        self.assertEqual(2, processed_count)
+
+    def test_operations_are_kept_when_not_authorized(self):
+        for status in ("401", "403", "404", "413"):
+            with self.subTest(status=status):
+                # given
+                batch = [_log_floats(["loss"], 1), _log_floats(["loss"], 2), _log_floats(["loss"], 3)]
+                self.backend.submit_operation.side_effect = [Mock(), ClientHttpError(status, "error")]
+
+                # when
+                processed_count = self.sender.send(batch)
+
+                # then
+                self.assertEqual(1, processed_count)
+
+                # given
+                self.backend.submit_operation.side_effect = ClientHttpError(status, "error")
+
+                # then
+                with self.assertRaises(ClientHttpError):
+                    self.sender.send(batch[1:])
+
+    def test_operations_without_messages_are_processed(self):
+        # given
+        batch = [LogFloats(["loss"], [])]
+
+        # when
+        processed_count = self.sender.send(batch)
+
+        # then
+        self.assertEqual(1, processed_count)
+        self.backend.submit_operation.assert_not_called()
@@ -0,0 +1,80 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest
+
+from neptune.core.operation_processors.async_operation_processor.batch_size_controller import BatchSizeController
+
+
+class TestBatchSizeController(unittest.TestCase):
+    def _controller(self):
+        return BatchSizeController(initial_size=100, min_size=10, max_size=150, max_size_bytes=1000, increase_step=20)
+
+    def test_grows_while_latency_is_flat(self):
+        # given
+        controller = self._controller()
+
+        # when
+        controller.on_sent(batch_size=100, latency=1.0)
+        controller.on_sent(batch_size=120, latency=1.1)
+
+        # then
+        self.assertEqual(140, controller.size)
+
+        # when
+        controller.on_sent(batch_size=140, latency=1.0)
+
+        # then
+        self.assertEqual(150, controller.size)
+        self.assertEqual(1000, controller.size_bytes)
+
+    def test_does_not_grow_when_latency_rises(self):
+        # given
+        controller = self._controller()
+        controller.on_sent(batch_size=100, latency=1.0)
+
+        # when
+        controller.on_sent(batch_size=120, latency=5.0)
+
+        # then
+        self.assertEqual(120, controller.size)
+
+    def test_does_not_grow_on_partial_batches(self):
+        # given
+        controller = self._controller()
+
+        # when
+        controller.on_sent(batch_size=30, latency=1.0)
+
+        # then
+        self.assertEqual(100, controller.size)
+
+    def test_shrinks_on_throttling(self):
+        # given
+        controller = self._controller()
+
+        # when
+        controller.on_throttled()
+
+        # then
+        self.assertEqual(50, controller.size)
+        self.assertEqual(500, controller.size_bytes)
+
+        # when
+        for _ in range(5):
+            controller.on_throttled()
+
+        # then
+        self.assertEqual(10, controller.size)
@@ -14,14 +14,28 @@
 # limitations under the License.
 #
 
+import threading
+import time
 import unittest
+from datetime import datetime
 from unittest.mock import (
     MagicMock,
     Mock,
+    call,
     patch,
 )
 
+from neptune.core.components.queue.aggregating_disk_queue import CategoryQueueElement
+from neptune.core.components.queue.disk_queue import QueueElement
+from neptune.core.operation_processors.async_operation_processor.batch_size_controller import BatchSizeController
 from neptune.core.operation_processors.async_operation_processor.consumer_thread import ConsumerThread
+from neptune.core.operation_processors.async_operation_processor.sync_scheduler import SyncScheduler
+from neptune.core.operations.operation import (
+    AssignFloat,
+    RunCreation,
+)
+from neptune.internal.daemon import Daemon
+from neptune.internal.exceptions import NeptuneConnectionLostException
 
 
 class TestConsumerThread(unittest.TestCase):
@@ -70,9 +84,12 @@ class TestConsumerThread(unittest.TestCase):
     @patch("neptune.core.operation_processors.async_operation_processor.consumer_thread.signal_batch_lag")
     def test_process_batch_occurred_at_not_supplied(self, signal_batch_lag, signal_batch_processed):
         # given
+        batch_sender = Mock()
+        batch_sender.send.return_value = 1
         customer_thread = ConsumerThread(
             sleep_time=30,
             processing_resources=Mock(),
+            batch_sender=batch_sender,
         )
 
         operation = MagicMock()
@@ -91,9 +108,12 @@ class TestConsumerThread(unittest.TestCase):
     @patch("neptune.core.operation_processors.async_operation_processor.consumer_thread.signal_batch_lag")
     def test_process_batch_occurred_at_supplied(self, signal_batch_lag, signal_batch_processed):
         # given
+        batch_sender = Mock()
+        batch_sender.send.return_value = 1
         customer_thread = ConsumerThread(
             sleep_time=30,
             processing_resources=Mock(),
+            batch_sender=batch_sender,
         )
 
         operation = MagicMock()
@@ -107,3 +127,351 @@ class TestConsumerThread(unittest.TestCase):
         signal_batch_processed.assert_called_once_with(queue=customer_thread._processing_resources.signals_queue)
         customer_thread._processing_resources.disk_queue.ack.assert_called_once()
         customer_thread._processing_resources.waiting_cond.notify_all.assert_called_once()
+
+    @patch("neptune.core.operation_processors.async_operation_processor.consumer_thread.signal_batch_processed")
+    def test_process_batch_acks_only_confirmed_operations(self, signal_batch_processed):
+        # given
+        batch_sender = Mock()
+        batch_sender.send.side_effect = [2, 1]
+        customer_thread = ConsumerThread(
+            sleep_time=30,
+            processing_resources=Mock(),
+            batch_sender=batch_sender,
+        )
+        customer_thread._processing_resources.waiting_cond = MagicMock()
+        batch = [MagicMock(), MagicMock(), MagicMock()]
+
+        # when
+        customer_thread.process_batch(batch=batch, version=3)
+
+        # then
+        batch_sender.send.assert_has_calls([call(batch), call(batch[2:])])
+        customer_thread._processing_resources.disk_queue.ack.assert_has_calls([call(2), call(3)])
+        customer_thread._processing_resources.waiting_cond.notify_all.assert_called_once()
+
+    @patch("neptune.core.operation_processors.async_operation_processor.consumer_thread.signal_batch_processed")
+    def test_retried_batch_skips_acknowledged_operations(self, signal_batch_processed):
+        # given
+        batch_sender = Mock()
+        batch_sender.send.return_value = 2
+        customer_thread = ConsumerThread(
+            sleep_time=30,
+            processing_resources=Mock(),
+            batch_sender=batch_sender,
+        )
+        customer_thread._processing_resources.waiting_cond = MagicMock()
+        batch = [MagicMock(), MagicMock(), MagicMock()]
+        customer_thread._acked_version = 1
+
+        # when
+        customer_thread.process_batch(batch=batch, version=3)
+
+        # then
+        batch_sender.send.assert_called_once_with(batch[1:])
+        customer_thread._processing_resources.disk_queue.ack.assert_called_once_with(3)
+
+    @patch("neptune.core.operation_processors.async_operation_processor.consumer_thread.signal_batch_processed")
+    def test_process_batch_raises_when_nothing_is_processed(self, signal_batch_processed):
+        # given
+        batch_sender = Mock()
+        batch_sender.send.return_value = 0
+        customer_thread = ConsumerThread(
+            sleep_time=30,
+            processing_resources=Mock(),
+            batch_sender=batch_sender,
+        )
+        customer_thread._processing_resources.waiting_cond = MagicMock()
+
+        # then
+        with self.assertRaises(RuntimeError):
+            customer_thread.process_batch(batch=[MagicMock()], version=1)
+        customer_thread._processing_resources.disk_queue.ack.assert_not_called()
+
+    @patch("neptune.core.operation_processors.async_operation_processor.consumer_thread.signal_batch_processed")
+    def test_process_batch_without_sender_keeps_operations_on_disk(self, signal_batch_processed):
+        # given
+        customer_thread = ConsumerThread(
+            sleep_time=30,
+            processing_resources=Mock(),
+        )
+        customer_thread._processing_resources.waiting_cond = MagicMock()
+        customer_thread._state = ConsumerThread.DaemonState.WORKING
+
+        # when
+        customer_thread.process_batch(batch=[MagicMock()], version=1)
+
+        # then
+        customer_thread._processing_resources.disk_queue.ack.assert_not_called()
+        signal_batch_processed.assert_not_called()
+        customer_thread._processing_resources.waiting_cond.notify_all.assert_called_once()
+        assert not customer_thread.is_running()
+
+
+def _op(version, path=None):
+    return AssignFloat([path or f"op-{version}"], float(version))
+
+
+def _queue_batch(*versions, path=None):
+    return [QueueElement(CategoryQueueElement(_op(version, path)), version, 1) for version in versions]
+
+
+class TestPipelinedConsumerThread(unittest.TestCase):
+    def _consumer(self, batch_sender, batches):
+        consumer = ConsumerThread(
+            sleep_time=30,
+            processing_resources=Mock(),
+            batch_sender=batch_sender,
+            max_in_flight=3,
+        )
+        consumer._processing_resources.waiting_cond = MagicMock()
+        remaining = iter(batches)
+        consumer._processing_resources.disk_queue.get_batch.side_effect = lambda *args: next(remaining, [])
+        return consumer
+
+    def test_batches_are_sent_concurrently_and_acked_in_order(self):
+        # given
+        all_sent = threading.Barrier(3, timeout=5)
+
+        def send(batch):
+            # completes only once all batches are in flight, the last one first
+            all_sent.wait()
+            return len(batch)
+
+        batch_sender = Mock()
+        batch_sender.send.side_effect = send
+        consumer = self._consumer(batch_sender, [_queue_batch(1, 2), _queue_batch(3), _queue_batch(4, 5)])
+
+        # when
+        consumer.work()
+
+        # then
+        self.assertEqual(3, batch_sender.send.call_count)
+        consumer._processing_resources.disk_queue.ack.assert_has_calls([call(2), call(3), call(5)])
+        self.assertEqual(3, consumer._processing_resources.disk_queue.ack.call_count)
+        consumer._executor.shutdown()
+
+    def test_partially_confirmed_batch_is_retried_before_later_ones_are_acked(self):
+        # given
+        def send(batch):
+            # the second batch is confirmed in two parts
+            if batch == [_op(3), _op(4)]:
+                return 1
+            return len(batch)
+
+        batch_sender = Mock()
+        batch_sender.send.side_effect = send
+        consumer = self._consumer(batch_sender, [_queue_batch(1, 2), _queue_batch(3, 4), _queue_batch(5)])
+
+        # when
+        consumer.work()
+
+        # then
+        batch_sender.send.assert_any_call([_op(4)])
+        self.assertEqual(
+            [call(2), call(3), call(4), call(5)],
+            consumer._processing_resources.disk_queue.ack.call_args_list,
+        )
+        consumer._executor.shutdown()
+
+    def test_batches_updating_the_same_fields_are_sent_one_by_one(self):
+        for batches in (
+            [_queue_batch(1, path="loss"), _queue_batch(2, path="loss")],
+            [[QueueElement(CategoryQueueElement(RunCreation(datetime(2024, 1, 1), "run_id")), 1, 1)], _queue_batch(2)],
+        ):
+            with self.subTest(batches=batches):
+                # given
+                sending = []
+                overlapping = []
+
+                def send(batch):
+                    sending.append(batch)
+                    overlapping.append(len(sending) > 1)
+                    time.sleep(0.05)
+                    sending.remove(batch)
+                    return len(batch)
+
+                batch_sender = Mock()
+                batch_sender.send.side_effect = send
+                consumer = self._consumer(batch_sender, batches)
+
+                # when
+                consumer.work()
+
+                # then
+                self.assertEqual([False, False], overlapping)
+                consumer._processing_resources.disk_queue.ack.assert_has_calls([call(1), call(2)])
+                consumer._executor.shutdown()
+
+    def _scheduled_consumer(self, batch_sender, batches, max_in_flight):
+        consumer = self._consumer(batch_sender, batches)
+        consumer._max_in_flight = max_in_flight
+        consumer._scheduler = SyncScheduler(max_workers=2)
+        return consumer
+
+    def _wait_for_ack(self, consumer, version, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while call(version) not in consumer._processing_resources.disk_queue.ack.call_args_list:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def test_batches_are_sent_through_shared_scheduler(self):
+        # given
+        batch_sender = Mock()
+        batch_sender.send.side_effect = lambda batch: len(batch)
+        consumer = self._scheduled_consumer(batch_sender, [_queue_batch(1, 2), _queue_batch(3)], max_in_flight=3)
+
+        # when
+        consumer.start()
+
+        # then
+        self.assertTrue(self._wait_for_ack(consumer, 3))
+        self.assertEqual(2, batch_sender.send.call_count)
+        consumer._processing_resources.disk_queue.ack.assert_has_calls([call(2), call(3)])
+        self.assertIsNone(consumer._executor)
+        self.assertIsNone(consumer.ident)
+
+        # when
+        consumer.interrupt()
+        consumer.join(5)
+
+        # then
+        self.assertFalse(consumer.is_alive())
+
+    def test_retries_and_serial_sends_go_through_shared_scheduler(self):
+        for max_in_flight in (1, 3):
+            with self.subTest(max_in_flight=max_in_flight):
+                # given
+                threads = []
+
+                def send(batch):
+                    threads.append(threading.current_thread().name)
+                    # the first batch is confirmed in two parts
+                    return 1 if batch == [_op(1), _op(2)] else len(batch)
+
+                batch_sender = Mock()
+                batch_sender.send.side_effect = send
+                consumer = self._scheduled_consumer(
+                    batch_sender, [_queue_batch(1, 2), _queue_batch(3)], max_in_flight=max_in_flight
+                )
+
+                # when
+                consumer.start()
+
+                # then
+                self.assertTrue(self._wait_for_ack(consumer, 3))
+                self.assertEqual(3, len(threads))
+                self.assertTrue(all(name.startswith("NeptuneSyncScheduler") for name in threads))
+                consumer._processing_resources.disk_queue.ack.assert_has_calls([call(1), call(2), call(3)])
+                self.assertIsNone(consumer.ident)
+                consumer.interrupt()
+                consumer.join(5)
+
+    def test_lost_connection_is_retried_in_a_later_pass(self):
+        for max_in_flight in (1, 3):
+            with self.subTest(max_in_flight=max_in_flight):
+                # given
+                attempts = []
+                # a batch failed in flight is retried right away, the backoff starts with the retry
+                failures = 1 if max_in_flight == 1 else 2
+
+                def send(batch):
+                    attempts.append(time.monotonic())
+                    if len(attempts) <= failures:
+                        raise NeptuneConnectionLostException(Exception())
+                    return len(batch)
+
+                batch_sender = Mock()
+                batch_sender.send.side_effect = send
+                consumer = self._scheduled_consumer(batch_sender, [_queue_batch(1, 2)], max_in_flight=max_in_flight)
+
+                # when
+                with patch.object(Daemon.ConnectionRetryWrapper, "INITIAL_RETRY_BACKOFF", 0.2):
+                    consumer.start()
+
+                    # then
+                    self.assertTrue(self._wait_for_ack(consumer, 2))
+                self.assertEqual(failures + 1, len(attempts))
+                self.assertGreaterEqual(attempts[-1] - attempts[-2], 0.2)
+                consumer.interrupt()
+                consumer.join(5)
+                self.assertFalse(consumer.is_alive())
+
+    def test_interrupted_consumer_stops_while_connection_is_lost(self):
+        # given
+        batch_sender = Mock()
+        batch_sender.send.side_effect = NeptuneConnectionLostException(Exception())
+        consumer = self._scheduled_consumer(batch_sender, [_queue_batch(1, 2)], max_in_flight=3)
+        consumer.start()
+        deadline = time.monotonic() + 5
+        while consumer._retry_at is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # when
+        consumer.interrupt()
+        consumer.join(5)
+
+        # then
+        self.assertFalse(consumer.is_alive())
+        consumer._processing_resources.disk_queue.ack.assert_not_called()
+
+    def test_batch_size_follows_controller(self):
+        # given
+        batch_sender = Mock()
+        batch_sender.send.side_effect = NeptuneConnectionLostException(Exception())
+        controller = BatchSizeController(initial_size=100, min_size=10, max_size=1000, max_size_bytes=1000)
+        consumer = self._consumer(batch_sender, [_queue_batch(1, 2)])
+        consumer._batch_size_controller = controller
+
+        # when
+        with self.assertRaises(NeptuneConnectionLostException):
+            consumer._send(batch_sender, [_op(1), _op(2)])
+        batch = consumer._get_batch()
+
+        # then
+        self.assertEqual(2, len(batch))
+        self.assertEqual(50, consumer._processing_resources.batch_size)
+        consumer._processing_resources.disk_queue.get_batch.assert_called_once_with(50, 500)
+
+
+class TestConsumerThreadWakeUp(unittest.TestCase):
+    def setUp(self):
+        self.consumer = ConsumerThread(sleep_time=30, processing_resources=Mock())
+        self.consumer._processing_resources.disk_queue.get_batch.return_value = []
+        self.passes = self.consumer._processing_resources.disk_queue.get_batch
+        self.consumer.start()
+        self._wait_for_passes(1)
+
+    def tearDown(self):
+        self.consumer.interrupt()
+        self.consumer.join(5)
+
+    def _wait_for_passes(self, count, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while self.passes.call_count < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.passes.call_count >= count
+
+    def test_deadline_wakes_consumer_up_before_sleep_time(self):
+        # when
+        self.consumer.schedule_wake_up(0.2)
+
+        # then
+        self.assertEqual(1, self.passes.call_count)
+        self.assertTrue(self._wait_for_passes(2))
+
+    def test_later_deadline_does_not_postpone_earlier_one(self):
+        # when
+        self.consumer.schedule_wake_up(0.2)
+        self.consumer.schedule_wake_up(60)
+
+        # then
+        self.assertTrue(self._wait_for_passes(2))
+
+    def test_wake_up_is_immediate(self):
+        # when
+        self.consumer.wake_up()
+
+        # then
+        self.assertTrue(self._wait_for_passes(2, timeout=1.0))
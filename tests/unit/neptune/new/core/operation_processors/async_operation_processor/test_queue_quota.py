@@ -0,0 +1,153 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from neptune.core.operation_processors.async_operation_processor.queue_quota import (
+    QueueQuota,
+    QuotaPolicy,
+)
+from neptune.core.operations.operation import (
+    AssignFloat,
+    LogFloats,
+)
+from neptune.internal import operation as internal_operation
+
+
+def _log_floats(path, count, start=0):
+    return LogFloats(path, [LogFloats.ValueType(float(i), i, 1.0) for i in range(start, start + count)])
+
+
+class TestQueueQuota(unittest.TestCase):
+    def _quota(self, policy, size_bytes):
+        disk_queue = Mock()
+        disk_queue.pending_bytes.return_value = size_bytes
+        return QueueQuota(disk_queue, max_bytes=1000, policy=policy, waiting_cond=threading.Condition()), disk_queue
+
+    def test_operations_below_quota_are_admitted(self):
+        # given
+        quota, _ = self._quota(QuotaPolicy.DROP, size_bytes=999)
+        ops = [_log_floats(["monitoring", "cpu"], 5), AssignFloat(["a"], 1.0)]
+
+        # when
+        admitted = quota.admit(ops)
+
+        # then
+        self.assertEqual(ops, admitted)
+        self.assertFalse(quota.metrics().is_exceeded)
+
+    def test_downsample_keeps_every_nth_value_across_operations(self):
+        # given
+        quota, _ = self._quota(QuotaPolicy.DOWNSAMPLE, size_bytes=1000)
+
+        # when
+        admitted = quota.admit([_log_floats(["loss"], 15), AssignFloat(["a"], 1.0), _log_floats(["loss"], 15, 15)])
+
+        # then
+        self.assertEqual([0, 10], [value.step for value in admitted[0].values])
+        self.assertEqual(AssignFloat(["a"], 1.0), admitted[1])
+        self.assertEqual([20], [value.step for value in admitted[2].values])
+        self.assertEqual(27, quota.metrics().downsampled_values)
+
+    def test_drop_starts_with_monitoring(self):
+        # given
+        quota, _ = self._quota(QuotaPolicy.DROP, size_bytes=1000)
+        ops = [_log_floats(["monitoring", "cpu"], 5), _log_floats(["loss"], 5), AssignFloat(["a"], 1.0)]
+
+        # when
+        admitted = quota.admit(ops)
+
+        # then
+        self.assertEqual(ops[1:], admitted)
+        self.assertEqual(1, quota.metrics().dropped_operations)
+
+    def test_downsample_operations_of_attributes(self):
+        # given
+        quota, _ = self._quota(QuotaPolicy.DOWNSAMPLE, size_bytes=1000)
+        values = [internal_operation.LogFloats.ValueType(float(i), i, 1.0) for i in range(15)]
+
+        # when
+        admitted = quota.admit([internal_operation.LogFloats(["loss"], values)])
+
+        # then
+        self.assertEqual([internal_operation.LogFloats(["loss"], [values[0], values[10]])], admitted)
+        self.assertEqual(13, quota.metrics().downsampled_values)
+
+    def test_drop_operations_of_attributes(self):
+        # given
+        quota, _ = self._quota(QuotaPolicy.DROP, size_bytes=1100)
+        value = internal_operation.LogFloats.ValueType(1.0, 1, 1.0)
+        ops = [
+            internal_operation.LogFloats(["monitoring", "cpu"], [value]),
+            internal_operation.LogStrings(["logs"], [internal_operation.LogStrings.ValueType("a", 1, 1.0)]),
+            internal_operation.AssignFloat(["a"], 1.0),
+        ]
+
+        # when
+        admitted = quota.admit(ops)
+
+        # then
+        self.assertEqual(ops[2:], admitted)
+        self.assertEqual(2, quota.metrics().dropped_operations)
+
+    def test_drop_all_series_well_above_quota(self):
+        # given
+        quota, _ = self._quota(QuotaPolicy.DROP, size_bytes=1100)
+        ops = [_log_floats(["monitoring", "cpu"], 5), _log_floats(["loss"], 5), AssignFloat(["a"], 1.0)]
+
+        # when
+        admitted = quota.admit(ops)
+
+        # then
+        self.assertEqual(ops[2:], admitted)
+
+    def test_block_waits_until_queue_is_synchronized(self):
+        # given
+        quota, disk_queue = self._quota(QuotaPolicy.BLOCK, size_bytes=1000)
+        admitted = []
+        writer = threading.Thread(target=lambda: admitted.extend(quota.admit([AssignFloat(["a"], 1.0)])))
+
+        # when
+        writer.start()
+        time.sleep(0.1)
+
+        # then
+        self.assertTrue(writer.is_alive())
+
+        # when
+        disk_queue.pending_bytes.return_value = 0
+        with quota._waiting_cond:
+            quota._waiting_cond.notify_all()
+        writer.join(timeout=5)
+
+        # then
+        self.assertFalse(writer.is_alive())
+        self.assertEqual([AssignFloat(["a"], 1.0)], admitted)
+
+    def test_release_unblocks_writers(self):
+        # given
+        quota, _ = self._quota(QuotaPolicy.BLOCK, size_bytes=1000)
+        writer = threading.Thread(target=quota.admit, args=([AssignFloat(["a"], 1.0)],))
+        writer.start()
+
+        # when
+        quota.release()
+        writer.join(timeout=5)
+
+        # then
+        self.assertFalse(writer.is_alive())
@@ -0,0 +1,139 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+import unittest
+
+from neptune.core.operation_processors.async_operation_processor.sync_scheduler import (
+    SyncScheduler,
+    get_sync_scheduler,
+)
+
+
+class TestSyncScheduler(unittest.TestCase):
+    def _block(self, scheduler):
+        started, release = threading.Event(), threading.Event()
+
+        def blocker():
+            started.set()
+            release.wait(timeout=5)
+
+        scheduler.submit("blocker", blocker)
+        self.assertTrue(started.wait(timeout=5))
+        return release
+
+    def test_runs_take_turns(self):
+        # given
+        scheduler = SyncScheduler(max_workers=1)
+        release = self._block(scheduler)
+        order = []
+
+        futures = [scheduler.submit("a", order.append, f"a{i}") for i in range(3)]
+        futures += [scheduler.submit("b", order.append, f"b{i}") for i in range(2)]
+
+        # when
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+
+        # then
+        self.assertEqual(["a0", "b0", "a1", "b1", "a2"], order)
+
+    def test_pending_counts_tasks_waiting_for_a_worker(self):
+        # given
+        scheduler = SyncScheduler(max_workers=1)
+        release = self._block(scheduler)
+
+        # when
+        future = scheduler.submit("a", lambda: 1)
+        scheduler.submit("a", lambda: 2)
+
+        # then
+        self.assertEqual(2, scheduler.pending("a"))
+
+        # when
+        release.set()
+
+        # then
+        self.assertEqual(1, future.result(timeout=5))
+
+    def test_exception_is_set_on_future(self):
+        # given
+        scheduler = SyncScheduler(max_workers=1)
+
+        def fail():
+            raise ValueError("failed")
+
+        # when
+        future = scheduler.submit("a", fail)
+
+        # then
+        with self.assertRaises(ValueError):
+            future.result(timeout=5)
+
+    def test_number_of_workers_is_limited(self):
+        # given
+        scheduler = SyncScheduler(max_workers=2)
+        release = threading.Event()
+
+        def task():
+            release.wait(timeout=5)
+
+        # when
+        futures = [scheduler.submit(key, task) for key in ("a", "b", "c", "d")]
+
+        # then
+        self.assertEqual(2, len(scheduler._workers))
+
+        # when
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+
+        # then
+        self.assertEqual(2, len(scheduler._workers))
+
+    def test_delayed_task_runs_once_due_without_holding_a_worker(self):
+        # given
+        scheduler = SyncScheduler(max_workers=1)
+        submitted_at = time.monotonic()
+
+        # when
+        delayed = scheduler.submit_after(0.2, "a", time.monotonic)
+        immediate = scheduler.submit("b", lambda: 1)
+
+        # then
+        self.assertEqual(1, immediate.result(timeout=5))
+        self.assertFalse(delayed.done())
+        self.assertGreaterEqual(delayed.result(timeout=5) - submitted_at, 0.2)
+        self.assertEqual(1, len(scheduler._workers))
+
+    def test_cancelled_delayed_task_is_skipped(self):
+        # given
+        scheduler = SyncScheduler(max_workers=1)
+        calls = []
+        delayed = scheduler.submit_after(0.05, "a", calls.append, "delayed")
+
+        # when
+        delayed.cancel()
+        time.sleep(0.1)
+        scheduler.submit("a", calls.append, "immediate").result(timeout=5)
+
+        # then
+        self.assertEqual(["immediate"], calls)
+
+    def test_scheduler_is_shared(self):
+        self.assertIs(get_sync_scheduler(max_workers=4), get_sync_scheduler(max_workers=2))
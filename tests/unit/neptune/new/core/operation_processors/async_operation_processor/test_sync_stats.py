@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from unittest.mock import patch
+
+import pytest
+
+from neptune.core.operation_processors.async_operation_processor.sync_stats import SyncStatsCollector
+
+
+@pytest.fixture
+def clock():
+    with patch("neptune.core.operation_processors.async_operation_processor.sync_stats.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+        yield monotonic
+
+
+def test_rates_follow_written_and_acknowledged_versions(clock):
+    # given
+    stats = SyncStatsCollector()
+    stats.on_written(100)
+    stats.on_acked(100)
+
+    # when
+    clock.return_value = 1010.0
+    stats.on_written(1100)
+    stats.on_acked(600)
+
+    # then
+    assert stats.enqueue_rate() == 100.0
+    assert stats.send_rate() == 50.0
+
+
+def test_rates_cover_only_last_window(clock):
+    # given
+    stats = SyncStatsCollector()
+    stats.on_written(0)
+    clock.return_value = 1030.0
+    stats.on_written(3000)
+    clock.return_value = 1090.0
+    stats.on_written(3600)
+
+    # when
+    clock.return_value = 1100.0
+
+    # then
+    assert stats.enqueue_rate() == 600 / 70
+
+
+def test_oldest_unacked_age(clock):
+    # given
+    stats = SyncStatsCollector()
+    stats.on_written(10)
+    clock.return_value = 1005.0
+    stats.on_written(20)
+
+    # when
+    clock.return_value = 1008.0
+
+    # then
+    assert stats.oldest_unacked_age() == 8.0
+
+    # when
+    stats.on_acked(10)
+
+    # then
+    assert stats.oldest_unacked_age() == 3.0
+
+    # when
+    stats.on_acked(20)
+
+    # then
+    assert stats.oldest_unacked_age() is None
+
+
+def test_batch_latency_percentiles():
+    # given
+    stats = SyncStatsCollector()
+
+    # when
+    for latency in range(1, 101):
+        stats.on_batch_sent(latency / 100)
+
+    # then
+    assert stats.batch_latency(50) == 0.51
+    assert stats.batch_latency(99) == 1.0
+
+
+def test_batch_latency_without_samples():
+    assert SyncStatsCollector().batch_latency(50) is None
@@ -82,6 +82,25 @@ def test_flush(metadata_file_mock, operation_storage_mock, disk_queue_mock):
     metadata_file.flush.assert_called_once()
 
 
+@patch("neptune.core.operation_processors.offline_operation_processor.DiskQueue")
+@patch("neptune.core.operation_processors.offline_operation_processor.OperationStorage")
+@patch("neptune.core.operation_processors.offline_operation_processor.MetadataFile")
+def test_enqueue_operations(metadata_file_mock, operation_storage_mock, disk_queue_mock):
+    # given
+    disk_queue = disk_queue_mock.return_value
+    processor = OfflineOperationProcessor(
+        custom_id=CustomId(str(uuid4())), container_type=ContainerType.RUN, lock=MagicMock()
+    )
+    ops = [MagicMock(), MagicMock()]
+
+    # when
+    processor.enqueue_operations(ops, wait=False)
+
+    # then
+    disk_queue.put_batch.assert_called_once_with(ops)
+    disk_queue.put.assert_not_called()
+
+
 @patch("neptune.core.operation_processors.offline_operation_processor.DiskQueue")
 @patch("neptune.core.operation_processors.offline_operation_processor.OperationStorage")
 @patch("neptune.core.operation_processors.offline_operation_processor.MetadataFile")
@@ -0,0 +1,80 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from neptune.core.operations.operation import (
+    AssignFloat,
+    LogFloats,
+)
+from neptune.core.operations.utils import coalesce_log_floats
+
+
+def log_floats(path, *values, step=None):
+    return LogFloats(path, [LogFloats.ValueType(value, step, 1234) for value in values])
+
+
+def test_coalesce_log_floats_for_the_same_path():
+    # given
+    operations = [log_floats(["a"], 1), log_floats(["a"], 2), log_floats(["a"], 3)]
+
+    # then
+    assert coalesce_log_floats(operations, max_values=10) == [log_floats(["a"], 1, 2, 3)]
+
+
+def test_coalesce_log_floats_groups_paths_within_the_same_step():
+    # given
+    operations = [
+        log_floats(["a"], 1, step=1),
+        log_floats(["b"], 2, step=1),
+        log_floats(["a"], 3, step=1),
+        log_floats(["a"], 4, step=2),
+    ]
+
+    # then
+    assert coalesce_log_floats(operations, max_values=10) == [
+        log_floats(["a"], 1, 3, step=1),
+        log_floats(["b"], 2, step=1),
+        log_floats(["a"], 4, step=2),
+    ]
+
+
+def test_coalesce_log_floats_does_not_cross_other_operations():
+    # given
+    operations = [log_floats(["a"], 1), AssignFloat(["a"], 5), log_floats(["a"], 2)]
+
+    # then
+    assert coalesce_log_floats(operations, max_values=10) == operations
+
+
+def test_coalesce_log_floats_respects_max_values():
+    # given
+    operations = [log_floats(["a"], value) for value in range(5)]
+
+    # then
+    assert coalesce_log_floats(operations, max_values=2) == [
+        log_floats(["a"], 0, 1),
+        log_floats(["a"], 2, 3),
+        log_floats(["a"], 4),
+    ]
+
+
+def test_coalesce_log_floats_does_not_modify_input():
+    # given
+    operations = [log_floats(["a"], 1), log_floats(["a"], 2)]
+
+    # when
+    coalesce_log_floats(operations, max_values=10)
+
+    # then
+    assert operations == [log_floats(["a"], 1), log_floats(["a"], 2)]
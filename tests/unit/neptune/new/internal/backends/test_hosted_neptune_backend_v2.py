@@ -1,8 +1,10 @@
+from http import HTTPStatus
 from unittest.mock import (
     Mock,
     patch,
 )
 
+import httpx
 import pytest
 from neptune_api.credentials import Credentials
 from neptune_api.models import (
@@ -11,8 +13,14 @@ from neptune_api.models import (
     ProjectDTO,
     SecurityDTO,
 )
+from neptune_api.proto.neptune_pb.ingest.v1.pub.client_pb2 import RequestId
+from neptune_api.proto.neptune_pb.ingest.v1.pub.ingest_pb2 import RunOperation
 
 from neptune.internal.backends.hosted_neptune_backend_v2 import HostedNeptuneBackendV2
+from neptune.internal.exceptions import (
+    ClientHttpError,
+    NeptuneConnectionLostException,
+)
 
 API_TOKEN = (
     "eyJhcGlfYWRkcmVzcyI6Imh0dHBzOi8vbXItMTI5MjcuZGV2Lm5lcHR1bmUuY"
@@ -76,3 +84,39 @@ def test_get_project(sync_detailed_mock, credentials, project_dto):
     backend = HostedNeptuneBackendV2(credentials)
     project = backend.get_project("project_name")
     assert project == project_dto
+
+
+@patch("neptune_api.api.data_ingestion.submit_operation.sync_detailed")
+def test_submit_operation(sync_detailed_mock, credentials):
+    sync_detailed_mock.return_value = Mock(status_code=HTTPStatus.OK, parsed=RequestId(value="request_id"))
+    backend = HostedNeptuneBackendV2(credentials)
+
+    request_id = backend.submit_operation(RunOperation(project="project", run_id="run_id"))
+
+    assert request_id == RequestId(value="request_id")
+
+
+@pytest.mark.parametrize(
+    "status_code, expected_exception",
+    [
+        (HTTPStatus.SERVICE_UNAVAILABLE, NeptuneConnectionLostException),
+        (HTTPStatus.TOO_MANY_REQUESTS, NeptuneConnectionLostException),
+        (HTTPStatus.BAD_REQUEST, ClientHttpError),
+    ],
+)
+@patch("neptune_api.api.data_ingestion.submit_operation.sync_detailed")
+def test_submit_operation_failure(sync_detailed_mock, credentials, status_code, expected_exception):
+    sync_detailed_mock.return_value = Mock(status_code=status_code, parsed=None, content=b"error")
+    backend = HostedNeptuneBackendV2(credentials)
+
+    with pytest.raises(expected_exception):
+        backend.submit_operation(RunOperation(project="project", run_id="run_id"))
+
+
+@patch("neptune_api.api.data_ingestion.submit_operation.sync_detailed")
+def test_submit_operation_connection_error(sync_detailed_mock, credentials):
+    sync_detailed_mock.side_effect = httpx.ConnectError("connection refused")
+    backend = HostedNeptuneBackendV2(credentials)
+
+    with pytest.raises(NeptuneConnectionLostException):
+        backend.submit_operation(RunOperation(project="project", run_id="run_id"))
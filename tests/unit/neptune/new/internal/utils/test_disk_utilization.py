@@ -34,6 +34,7 @@ from neptune.envs import (
 )
 from neptune.exceptions import NeptuneMaxDiskUtilizationExceeded
 from neptune.internal.utils.disk_utilization import (
+    DiskUtilizationMonitor,
     NonRaisingErrorHandler,
     RaisingErrorHandler,
     ensure_disk_not_overutilize,
@@ -141,6 +142,42 @@ class TestDiskUtilization(unittest.TestCase):
         mocked_func.assert_not_called()
 
 
+class TestDiskUtilizationMonitor(unittest.TestCase):
+    @patch.dict(os.environ, {NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_EXCEEDED: "True"})
+    @patch.dict(os.environ, {NEPTUNE_MAX_DISK_USAGE: "60"})
+    @patch("psutil.disk_usage")
+    def test_utilization_is_sampled_once_per_interval(self, disk_usage_mock):
+        disk_usage_mock.return_value.percent = 10
+        mocked_func = MagicMock()
+        wrapped_func = ensure_disk_not_overutilize(mocked_func)
+
+        for _ in range(100):
+            wrapped_func()
+
+        assert mocked_func.call_count == 100
+        disk_usage_mock.assert_called_once()
+
+    @patch("neptune.internal.utils.disk_utilization.get_disk_utilization_percent")
+    def test_hysteresis(self, get_disk_utilization_percent_mock):
+        monitor = DiskUtilizationMonitor(max_disk_utilization=90, sample_interval=0, hysteresis=2)
+
+        for utilization, exceeded in ((89.5, False), (90, True), (89, True), (88.5, True), (87.9, False), (89, False)):
+            get_disk_utilization_percent_mock.return_value = utilization
+            assert monitor.utilization() == utilization
+            assert monitor.is_exceeded == exceeded
+
+    @patch("neptune.internal.utils.disk_utilization.get_disk_utilization_percent")
+    def test_failed_sample_keeps_state(self, get_disk_utilization_percent_mock):
+        monitor = DiskUtilizationMonitor(max_disk_utilization=90, sample_interval=0)
+
+        get_disk_utilization_percent_mock.return_value = 95
+        monitor.utilization()
+        get_disk_utilization_percent_mock.return_value = None
+
+        assert monitor.utilization() is None
+        assert monitor.is_exceeded
+
+
 class TestDiskErrorHandler(unittest.TestCase):
     @patch("neptune.internal.utils.disk_utilization.RaisingErrorHandler")
     @patch("neptune.internal.utils.disk_utilization.NonRaisingErrorHandler")
@@ -160,7 +197,9 @@ class TestDiskErrorHandler(unittest.TestCase):
         mock_non_raising_handler.assert_called_once()
         mock_raising_handler.assert_not_called()
 
-    def test_non_raising_handler(self):
+    @patch("psutil.disk_usage")
+    def test_non_raising_handler(self, disk_usage_mock):
+        disk_usage_mock.return_value.percent = 50
         func = MagicMock()
         func.side_effect = OSError
 
@@ -15,7 +15,10 @@
 #
 import unittest
 
-from neptune.internal.utils.iteration import get_batches
+from neptune.internal.utils.iteration import (
+    get_batches,
+    get_batches_by_size,
+)
 
 
 class TestIterationUtils(unittest.TestCase):
@@ -41,3 +44,16 @@ class TestIterationUtils(unittest.TestCase):
             [[0, 1, 2, 3, 4, 5, 6, 7, 8]],
         ]
         self.assertEqual(expected_batched, list(get_batches(list_of_lists, batch_size=3)))
+
+    def test_get_batches_by_size(self):
+        words = ["a", "bb", "cccccc", "dd", "e", "f"]
+
+        self.assertEqual(
+            [["a", "bb"], ["cccccc"], ["dd", "e", "f"]],
+            list(get_batches_by_size(words, batch_size=10, batch_size_bytes=4, size_of=len)),
+        )
+        self.assertEqual(
+            [["a", "bb"], ["cccccc", "dd"], ["e", "f"]],
+            list(get_batches_by_size(words, batch_size=2, batch_size_bytes=100, size_of=len)),
+        )
+        self.assertEqual([], list(get_batches_by_size([], batch_size=2, batch_size_bytes=100, size_of=len)))